@@ -5,6 +5,8 @@ and generate AI assistant guidance files.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
 
 # Add the src directory to the path so we can import our modules
@@ -158,26 +160,28 @@ def generate_guidance_files(template: GuidanceTemplate, output_dir: Path):
     cursor_dir.mkdir(parents=True, exist_ok=True)
     copilot_dir.mkdir(parents=True, exist_ok=True)
     
-    # Generate Cursor guidance
-    cursor_renderer = CursorRenderer()
-    cursor_guidance = cursor_renderer.render(template, language="python")
+    # Each renderer builds its file's text as one string and writes it in one call,
+    # when the writes below run
     cursor_file = cursor_dir / "fastapi-testing-guidance.mdc"
-    with open(cursor_file, "w", encoding="utf-8") as f:
-        f.write(cursor_guidance)
-    print(f"Generated Cursor guidance: {cursor_file}")
-    
-    # Generate GitHub Copilot guidance
-    copilot_renderer = CopilotRenderer()
-    copilot_guidance = copilot_renderer.render(template, language="python")
     copilot_file = copilot_dir / "fastapi-testing-guidance.instructions.md"
-    with open(copilot_file, "w", encoding="utf-8") as f:
-        f.write(copilot_guidance)
-    print(f"Generated GitHub Copilot guidance: {copilot_file}")
-    
-    # Save the original template as YAML
     yaml_file = output_dir / "fastapi-testing-guidance.yaml"
-    template.save_to_file(yaml_file)
-    print(f"Saved template as YAML: {yaml_file}")
+    json_file = yaml_file.with_suffix(".json")
+    
+    outputs = [
+        (cursor_file, partial(CursorRenderer().render_file, template, cursor_file), "Generated Cursor guidance"),
+        (copilot_file, partial(CopilotRenderer().render_file, template, copilot_file), "Generated GitHub Copilot guidance"),
+        (yaml_file, partial(yaml_file.write_text, template.to_yaml(), encoding="utf-8"), "Saved template as YAML"),
+        (json_file, partial(template.save_to_file, json_file), "Saved template as JSON"),
+    ]
+    
+    # The files are independent, so let them flush concurrently
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = [executor.submit(write) for _, write, _ in outputs]
+        wait(futures)
+    
+    for (path, _, label), future in zip(outputs, futures):
+        future.result()
+        print(f"{label}: {path}")
 
 
 def main():
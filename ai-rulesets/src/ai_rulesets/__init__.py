@@ -11,7 +11,6 @@ __author__ = "Dan Holman"
 __email__ = "danxholman@gmail.com"
 
 from .core import Ruleset, RulesetItem, RulesetManager
-from .renderers import CursorRenderer, CopilotRenderer, GenericRenderer
 
 __all__ = [
     "Ruleset",
@@ -21,3 +20,14 @@ __all__ = [
     "CopilotRenderer",
     "GenericRenderer",
 ]
+
+
+_LAZY_RENDERERS = {"CursorRenderer", "CopilotRenderer", "GenericRenderer"}
+
+
+def __getattr__(name):
+    """Import renderers on first access so core-only users skip jinja2."""
+    if name in _LAZY_RENDERERS:
+        from . import renderers
+        return getattr(renderers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
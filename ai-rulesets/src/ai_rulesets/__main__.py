@@ -1,6 +1,73 @@
-"""Entry point for running ai-rulesets as a module."""
+"""Entry point for running ai-rulesets as a module.
+
+The everyday commands are parsed with argparse and dispatched straight to
+``ai_rulesets.commands``, so they start without importing click. Everything
+else, including ``--help``, falls through to the full click CLI.
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, List, Optional
+
+from . import commands
+
+
+_RULESET_TYPES_HELP = "Ruleset types (python, typescript, testing, cicd, security)"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argparse mirror of the fast-path click commands."""
+    parser = argparse.ArgumentParser(prog="ai-rulesets")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    for name, default_output in (("generate-cursor", ".cursor/rules"),
+                                 ("generate-copilot", ".github/instructions")):
+        sub = subparsers.add_parser(name)
+        sub.add_argument("--output", "-o", default=default_output)
+        sub.add_argument("--type", "-t", dest="ruleset_types", action="append", default=[],
+                         help=_RULESET_TYPES_HELP)
+        sub.add_argument("--all", dest="generate_all", action="store_true")
+    
+    sub = subparsers.add_parser("generate-from-docs")
+    sub.add_argument("--input", "-i", required=True)
+    sub.add_argument("--output", "-o", default=".cursor/rules")
+    sub.add_argument("--type", "-t", dest="ruleset_type", default="generic")
+    sub.add_argument("--format", "-f", dest="output_format", choices=["cursor", "copilot", "generic"],
+                     default="cursor")
+    
+    sub = subparsers.add_parser("validate")
+    sub.add_argument("--input", "-i", required=True)
+    
+    sub = subparsers.add_parser("list-rulesets")
+    sub.add_argument("--type", "-t", dest="ruleset_types", action="append", default=[],
+                     help=_RULESET_TYPES_HELP)
+    
+    return parser
+
+
+_FAST_COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "generate-cursor": lambda args: commands.generate_cursor(args.output, args.ruleset_types, args.generate_all),
+    "generate-copilot": lambda args: commands.generate_copilot(args.output, args.ruleset_types, args.generate_all),
+    "generate-from-docs": lambda args: commands.generate_from_docs(
+        args.input, args.output, args.ruleset_type, args.output_format
+    ),
+    "validate": lambda args: commands.validate(args.input),
+    "list-rulesets": lambda args: commands.list_rulesets(args.ruleset_types),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a fast-path command directly, or hand off to the click CLI."""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    if argv and argv[0] in _FAST_COMMANDS and not {"--help", "-h"} & set(argv):
+        args = _build_parser().parse_args(argv)
+        _FAST_COMMANDS[args.command](args)
+        return
+    
+    from .main import main as click_main
+    click_main(args=argv, prog_name="ai-rulesets")
 
-from .main import main
 
 if __name__ == "__main__":
     main()
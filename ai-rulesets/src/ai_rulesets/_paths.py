@@ -0,0 +1,16 @@
+"""
+Per-user locations shared by the package's on-disk caches.
+"""
+
+import os
+from pathlib import Path
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """Return the package's per-user cache directory, or a directory inside it.
+    
+    Follows $XDG_CACHE_HOME, falling back to ~/.cache. Nothing is created;
+    each cache makes its own directory when it first writes.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base, "ai-rulesets", *parts)
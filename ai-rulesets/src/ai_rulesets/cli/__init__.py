@@ -2,9 +2,15 @@
 CLI commands for AI rulesets.
 """
 
-from .generate import generate_rulesets, generate_from_sources
-
 __all__ = [
     "generate_rulesets",
     "generate_from_sources",
 ]
+
+
+def __getattr__(name):
+    """Import the generate commands on first access."""
+    if name in __all__:
+        from . import generate
+        return getattr(generate, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
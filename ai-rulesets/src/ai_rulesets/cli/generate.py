@@ -3,11 +3,30 @@ Generate rulesets from source files.
 """
 
 import click
+import functools
+import gzip
+import hashlib
+import os
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
+from ai_rulesets import __version__
+from ai_rulesets._paths import user_cache_dir
+from ai_rulesets.core import Ruleset
 from ai_rulesets.sources.processor import SourceProcessor
-from ai_rulesets.renderers import CursorRenderer, CopilotRenderer, GenericRenderer
+from ai_rulesets.renderers import MarkdownRenderer, cursor_renderer, copilot_renderer, generic_renderer
+
+
+# The shared instance per format is used across calls and worker threads;
+# its render cache and created-directory set are safe to share.
+_FORMAT_TABLE: Dict[str, Tuple[MarkdownRenderer, str]] = {
+    "cursor": (cursor_renderer, "{domain}-{category}-standards.mdc"),
+    "copilot": (copilot_renderer, "{domain}-{category}-standards.instructions.md"),
+    "generic": (generic_renderer, "{domain}-{category}-standards.md"),
+}
+_ALL_FORMATS = tuple(_FORMAT_TABLE)
 
 
 @click.command()
@@ -19,7 +38,10 @@ from ai_rulesets.renderers import CursorRenderer, CopilotRenderer, GenericRender
               default="all", help="Output format for rulesets")
 @click.option("--domain", "-d", help="Specific domain to generate (python, typescript, etc.)")
 @click.option("--category", "-c", help="Specific category to generate (coding, testing, etc.)")
-def generate_rulesets(sources: str, output: str, format: str, domain: Optional[str], category: Optional[str]):
+@click.option("--jobs", "-j", "workers", type=click.IntRange(min=1), default=None,
+              help="Render in this many worker processes (default: threads in this process)")
+def generate_rulesets(sources: str, output: str, format: str, domain: Optional[str], category: Optional[str],
+                      workers: Optional[int]):
     """Generate rulesets from source markdown files."""
     sources_path = Path(sources)
     output_path = Path(output)
@@ -32,8 +54,6 @@ def generate_rulesets(sources: str, output: str, format: str, domain: Optional[s
     click.echo(f"Output directory: {output_path}")
     click.echo(f"Format: {format}")
     
-    processor = SourceProcessor(sources_path)
-    
     if domain and category:
         # Generate specific domain/category
         source_file = sources_path / domain / f"{category}.md"
@@ -41,8 +61,8 @@ def generate_rulesets(sources: str, output: str, format: str, domain: Optional[s
             click.echo(f"Error: Source file {source_file} does not exist")
             return
         
-        ruleset = processor.process_markdown_file(source_file, domain, category)
-        _generate_ruleset_files(ruleset, output_path, format, domain, category)
+        ruleset = _load_source(source_file, domain, category)
+        _generate_ruleset_files(ruleset, output_path, format, domain, category, workers)
         
     elif domain:
         # Generate all categories for domain
@@ -51,46 +71,165 @@ def generate_rulesets(sources: str, output: str, format: str, domain: Optional[s
             click.echo(f"Error: Domain directory {domain_dir} does not exist")
             return
         
-        for source_file in domain_dir.glob("*.md"):
-            category = source_file.stem
-            ruleset = processor.process_markdown_file(source_file, domain, category)
-            _generate_ruleset_files(ruleset, output_path, format, domain, category)
+        jobs = [
+            (_load_source(source_file, domain, source_file.stem), domain, source_file.stem)
+            for source_file in domain_dir.glob("*.md")
+        ]
+        _generate_all_ruleset_files(jobs, output_path, format, workers)
             
     else:
         # Generate all domains and categories
-        all_rulesets = processor.process_all_sources()
-        
-        for domain_name, categories in all_rulesets.items():
-            for category_name, ruleset in categories.items():
-                _generate_ruleset_files(ruleset, output_path, format, domain_name, category_name)
+        all_rulesets = _load_all_sources(sources_path)
+        _generate_all_ruleset_files(_iter_jobs(all_rulesets), output_path, format, workers)
     
     click.echo("Ruleset generation completed!")
 
 
-def _generate_ruleset_files(ruleset, output_path: Path, format: str, domain: str, category: str):
+_T = TypeVar("_T")
+
+# Parsed sources are also pickled here so unchanged inputs skip parsing on the
+# next invocation, not just within one process.
+_CACHE_DIR = user_cache_dir("sources")
+# Bump when the pickled core classes change layout so stale entries are skipped
+_CACHE_FORMAT = 6
+
+
+def _cache_key(*parts: object) -> str:
+    """Hash the parts that identify a cached parse, including package and cache versions."""
+    raw = "|".join(str(part) for part in (__version__, _CACHE_FORMAT, *parts))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _disk_cached(key: str, build: Callable[[], _T]) -> _T:
+    """Return the value pickled under ``key``, building and storing it on a miss.
+    
+    The cache is best effort: unreadable entries are rebuilt and write failures
+    are ignored.
+    """
+    cache_file = _CACHE_DIR / f"{key}.pkl.gz"
+    try:
+        with gzip.open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Corrupt or written by an incompatible version; rebuild below
+        pass
+    
+    value = build()
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp_file, "wb", compresslevel=1) as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_source(path: Path, mtime_ns: int, size: int, domain: str, category: str) -> Ruleset:
+    """Parse a markdown source file; ``mtime_ns`` and ``size`` key the caches so edits invalidate them."""
+    return _disk_cached(
+        _cache_key(path.resolve(), mtime_ns, size, domain, category),
+        lambda: SourceProcessor(path.parent.parent).process_markdown_file(path, domain, category),
+    )
+
+
+def _load_source(path: Path, domain: str, category: str) -> Ruleset:
+    """Load a ruleset from a markdown source, reusing earlier parses of the same file."""
+    st = path.stat()
+    return _parse_source(path, st.st_mtime_ns, st.st_size, domain, category)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_all(sources_root: Path, mtime_hash: str) -> Dict[str, Dict[str, Ruleset]]:
+    """Parse every source under ``sources_root``; ``mtime_hash`` keys the caches."""
+    return _disk_cached(
+        _cache_key(sources_root.resolve(), mtime_hash),
+        lambda: SourceProcessor(sources_root).process_all_sources(),
+    )
+
+
+def _load_all_sources(sources_root: Path) -> Dict[str, Dict[str, Ruleset]]:
+    """Load all rulesets from a sources tree, reusing the last parse if nothing changed."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(sources_root.rglob("*.md")):
+        st = path.stat()
+        digest.update(f"{path}|{st.st_mtime_ns}|{st.st_size}\n".encode("utf-8"))
+    return _parse_all(sources_root, digest.hexdigest())
+
+
+def _iter_jobs(all_rulesets: Dict[str, Dict[str, Ruleset]]) -> Iterable[Tuple[Ruleset, str, str]]:
+    """Flatten ``{domain: {category: ruleset}}`` into ``(ruleset, domain, category)`` jobs."""
+    for domain_name, categories in all_rulesets.items():
+        for category_name, ruleset in categories.items():
+            yield ruleset, domain_name, category_name
+
+
+def _generate_ruleset_files(ruleset, output_path: Path, format: str, domain: str, category: str,
+                            workers: Optional[int] = None):
     """Generate ruleset files in the specified format(s)."""
+    _generate_all_ruleset_files([(ruleset, domain, category)], output_path, format, workers)
+
+
+def _generate_all_ruleset_files(jobs: Iterable[Tuple[Ruleset, str, str]], output_path: Path, format: str,
+                                workers: Optional[int] = None):
+    """Render every ``(ruleset, domain, category)`` job in every requested format.
+    
+    Each (ruleset, format) pair is independent and renderers only read from the
+    ruleset, so all of them are submitted to one pool; rendering one file
+    overlaps with the disk write of another. By default the pool is threads in
+    this process; ``workers`` switches to that many processes so large trees
+    render outside the GIL. Output is reported in job order.
+    """
+    jobs = list(jobs)
+    
+    # Create every output directory up front rather than once per job
     output_path.mkdir(parents=True, exist_ok=True)
+    for domain in {domain for _, domain, _ in jobs}:
+        (output_path / domain).mkdir(exist_ok=True)
+    
+    if workers:
+        executor: Executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
     
-    # Create domain directory
+    with executor:
+        pending: List[Tuple[Path, Future]] = []
+        for ruleset, domain, category in jobs:
+            pending.extend(_submit_ruleset_files(executor, ruleset, output_path, format, domain, category))
+        
+        for output_file, future in pending:
+            future.result()
+            click.echo(f"Generated: {output_file}")
+
+
+def _submit_ruleset_files(executor: Executor, ruleset, output_path: Path, format: str,
+                          domain: str, category: str) -> List[Tuple[Path, Future]]:
+    """Submit the render of one ruleset in the specified format(s); directories must exist."""
     domain_dir = output_path / domain
-    domain_dir.mkdir(exist_ok=True)
     
-    formats = [format] if format != "all" else ["cursor", "copilot", "generic"]
+    formats = [format] if format != "all" else _ALL_FORMATS
     
+    pending = []
     for fmt in formats:
-        if fmt == "cursor":
-            renderer = CursorRenderer()
-            filename = f"{domain}-{category}-standards.mdc"
-        elif fmt == "copilot":
-            renderer = CopilotRenderer()
-            filename = f"{domain}-{category}-standards.instructions.md"
-        else:  # generic
-            renderer = GenericRenderer()
-            filename = f"{domain}-{category}-standards.md"
+        filename = _FORMAT_TABLE[fmt][1].format(domain=domain, category=category)
         
         output_file = domain_dir / filename
-        renderer.render_file(ruleset, output_file)
-        click.echo(f"Generated: {output_file}")
+        pending.append((output_file, executor.submit(_render_file, fmt, ruleset, output_file)))
+    
+    return pending
+
+
+def _render_file(fmt: str, ruleset: Ruleset, output_file: Path) -> None:
+    """Render one file with the shared renderer for ``fmt``.
+    
+    Module-level so it can be sent to worker processes; each worker looks up
+    its own renderer instead of pickling a compiled template.
+    """
+    _FORMAT_TABLE[fmt][0].render_file(ruleset, output_file)
 
 
 @click.command()
@@ -112,11 +251,7 @@ def generate_from_sources(sources: str, output: str, format: str):
     click.echo(f"Generating {format} rulesets from: {sources_path}")
     click.echo(f"Output directory: {output_path}")
     
-    processor = SourceProcessor(sources_path)
-    all_rulesets = processor.process_all_sources()
-    
-    for domain_name, categories in all_rulesets.items():
-        for category_name, ruleset in categories.items():
-            _generate_ruleset_files(ruleset, output_path, format, domain_name, category_name)
+    all_rulesets = _load_all_sources(sources_path)
+    _generate_all_ruleset_files(_iter_jobs(all_rulesets), output_path, format)
     
     click.echo(f"Generated {format} rulesets in {output_path}")
@@ -1,7 +1,7 @@
 """Quality checking CLI commands."""
 
 import click
-from ai_rulesets.validation.quality_checker import QualityChecker
+from ai_rulesets.cli.quality_checker import QualityChecker
 
 
 @click.command()
@@ -24,6 +24,22 @@ def check_quality(project_root: str, export: str, fail_on_error: bool, verbose:
     click.echo("\n✅ Quality check completed")
 
 
+def _format_location(issue) -> str:
+    """Format an issue's `` (file:line)`` suffix, or an empty string without a file."""
+    if not issue.file_path:
+        return ""
+    if issue.line_number:
+        return f" ({issue.file_path}:{issue.line_number})"
+    return f" ({issue.file_path})"
+
+
+def _echo_issues(issues) -> None:
+    """Print one line per issue in a single write rather than one echo per issue."""
+    click.echo("\n".join(
+        f"  {issue.severity.upper()}: {issue.message}{_format_location(issue)}" for issue in issues
+    ))
+
+
 @click.command()
 @click.option("--project-root", default=".", help="Project root directory")
 def check_readmes(project_root: str):
@@ -37,15 +53,7 @@ def check_readmes(project_root: str):
         click.echo("✅ All README files are valid")
     else:
         click.echo(f"❌ Found {len(issues)} README issues")
-        for issue in issues:
-            location = ""
-            if issue.file_path:
-                location = f" ({issue.file_path}"
-                if issue.line_number:
-                    location += f":{issue.line_number}"
-                location += ")"
-            
-            click.echo(f"  {issue.severity.upper()}: {issue.message}{location}")
+        _echo_issues(issues)
 
 
 @click.command()
@@ -61,15 +69,7 @@ def check_workflows(project_root: str):
         click.echo("✅ All workflow files are valid")
     else:
         click.echo(f"❌ Found {len(issues)} workflow issues")
-        for issue in issues:
-            location = ""
-            if issue.file_path:
-                location = f" ({issue.file_path}"
-                if issue.line_number:
-                    location += f":{issue.line_number}"
-                location += ")"
-            
-            click.echo(f"  {issue.severity.upper()}: {issue.message}{location}")
+        _echo_issues(issues)
 
 
 @click.command()
@@ -85,15 +85,7 @@ def check_tests(project_root: str):
         click.echo("✅ All tests are valid")
     else:
         click.echo(f"❌ Found {len(issues)} test issues")
-        for issue in issues:
-            location = ""
-            if issue.file_path:
-                location = f" ({issue.file_path}"
-                if issue.line_number:
-                    location += f":{issue.line_number}"
-                location += ")"
-            
-            click.echo(f"  {issue.severity.upper()}: {issue.message}{location}")
+        _echo_issues(issues)
 
 
 @click.group()
@@ -9,8 +9,12 @@ or as part of the ai-rulesets package.
 import sys
 import os
 import argparse
+import functools
+import hashlib
+import json
+import itertools
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 # Add the ai_rulesets package to the path
 script_dir = Path(__file__).parent
@@ -18,40 +22,199 @@ package_dir = script_dir.parent.parent
 sys.path.insert(0, str(package_dir))
 
 from ai_rulesets.validation.base import ValidationResult
-from ai_rulesets.validation.readme_validator import ReadmeValidator
-from ai_rulesets.validation.workflow_validator import WorkflowValidator
-from ai_rulesets.validation.test_validator import TestValidator
-from ai_rulesets.validation.version_validator import VersionValidator
-from ai_rulesets.validation.issue_fixer import IssueFixer
+
+
+# (category, progress heading, validator attribute, method) for each check, in report order
+_CHECKS = (
+    ("README", "📚 Validating README files...", "readme_validator", "validate"),
+    ("Workflows", "⚙️ Validating GitHub workflows...", "workflow_validator", "validate"),
+    ("Tests", "🧪 Validating test execution...", "test_validator", "validate"),
+    ("Allure", "📊 Validating Allure reporting...", "test_validator", "validate_allure_reporting"),
+    ("Versions", "🔢 Validating version consistency...", "version_validator", "validate"),
+)
+
+# Categories checked one file at a time, with the validator that re-checks a single file
+_PER_FILE_CHECKS = {"README": "readme_validator", "Workflows": "workflow_validator"}
+
+# Categories that read README and workflow files as a whole; rerun in full when those change
+_CROSS_FILE_CHECKS = ("Versions",)
+
+
+def _bucket(issues: List[ValidationResult]) -> Tuple[List[ValidationResult], List[ValidationResult], List[ValidationResult]]:
+    """Split issues into ``(errors, warnings, info)`` in a single pass, keeping their order."""
+    errors: List[ValidationResult] = []
+    warnings: List[ValidationResult] = []
+    info: List[ValidationResult] = []
+    append = {"error": errors.append, "warning": warnings.append, "info": info.append}
+    
+    for issue in issues:
+        add = append.get(issue.severity)
+        if add is not None:
+            add(issue)
+    
+    return errors, warnings, info
 
 
 class QualityChecker:
     """Main quality checker orchestrator."""
     
-    def __init__(self, project_root: str = "."):
-        """Initialize quality checker with project root."""
+    def __init__(self, project_root: Union[str, Path] = ".", use_cache: bool = True, jobs: Optional[int] = None,
+                 dedup: bool = True):
+        """Initialize quality checker with project root and per-validator thread count."""
         self.project_root = Path(project_root)
+        self.use_cache = use_cache
+        self.jobs = jobs
+        self.dedup = dedup
         self.all_issues: List[ValidationResult] = []
+        self.results: Dict[str, List[ValidationResult]] = {}
+        self._seen: Set[Tuple] = set()
+        # severity_buckets' split of all_issues; cleared whenever all_issues changes
+        self._buckets: Optional[Tuple[List[ValidationResult], List[ValidationResult], List[ValidationResult]]] = None
+    
+    # Validators and the cache are created on first use, so a single check
+    # only imports its own validator module. They share the project root Path
+    # instead of each rebuilding one.
+    
+    @functools.cached_property
+    def cache(self):
+        """Per-file results store, reused across runs for unchanged files.
+        
+        Kept in the user's cache directory, one store per project, rather
+        than inside the checked project, which may be someone else's clone.
+        """
+        if not self.use_cache:
+            return None
+        from ai_rulesets._paths import user_cache_dir
+        from ai_rulesets.validation.cache import ValidationCache
+        project_key = hashlib.blake2b(os.fsencode(self.project_root.resolve()), digest_size=16).hexdigest()
+        return ValidationCache(user_cache_dir("validation", project_key))
+    
+    @functools.cached_property
+    def readme_validator(self):
+        """README validator, created on first use."""
+        from ai_rulesets.validation.readme_validator import ReadmeValidator
+        return ReadmeValidator(self.project_root, jobs=self.jobs)
+    
+    @functools.cached_property
+    def workflow_validator(self):
+        """GitHub workflow validator, created on first use."""
+        from ai_rulesets.validation.workflow_validator import WorkflowValidator
+        return WorkflowValidator(self.project_root, cache=self.cache, jobs=self.jobs)
+    
+    @functools.cached_property
+    def test_validator(self):
+        """Test execution validator, created on first use."""
+        from ai_rulesets.validation.test_validator import TestValidator
+        return TestValidator(self.project_root, jobs=self.jobs)
+    
+    @functools.cached_property
+    def version_validator(self):
+        """Version consistency validator, created on first use."""
+        from ai_rulesets.validation.version_validator import VersionValidator
+        return VersionValidator(self.project_root)
+    
+    def run_checks(self, parallel: bool = True) -> List[Tuple[str, List[ValidationResult]]]:
+        """Run every check and return ``(category, issues)`` pairs in report order.
+        
+        The checks are independent file walks and parses, so by default each one
+        runs in its own worker process. Workers get a copy of the validator, so
+        the validators' own ``issues`` lists are not updated in this process.
+        """
+        tasks = [getattr(getattr(self, attr), method) for _, _, attr, method in _CHECKS]
+        
+        if parallel:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(task) for task in tasks]
+                results = [future.result() for future in futures]
+        else:
+            results = [task() for task in tasks]
         
-        # Initialize validators
-        self.readme_validator = ReadmeValidator(str(project_root))
-        self.workflow_validator = WorkflowValidator(str(project_root))
-        self.test_validator = TestValidator(str(project_root))
-        self.version_validator = VersionValidator(str(project_root))
+        return [(check[0], issues) for check, issues in zip(_CHECKS, results)]
     
-    def run_all_checks(self) -> List[ValidationResult]:
+    def run_all_checks(self, parallel: bool = True) -> List[ValidationResult]:
         """Run all quality checks."""
-        self.all_issues = []
+        self._reset_issues()
         
-        # Run all validators
-        self.all_issues.extend(self.readme_validator.validate())
-        self.all_issues.extend(self.workflow_validator.validate())
-        self.all_issues.extend(self.test_validator.validate())
-        self.all_issues.extend(self.test_validator.validate_allure_reporting())
-        self.all_issues.extend(self.version_validator.validate())
+        for category, issues in self.run_checks(parallel):
+            self._record(category, issues)
         
         return self.all_issues
     
+    def _reset_issues(self) -> None:
+        """Forget collected issues before a new run."""
+        self.all_issues = []
+        self.results = {}
+        self._seen = set()
+        self._buckets = None
+    
+    def _record(self, category: str, issues: List[ValidationResult]) -> None:
+        """Keep a check's issues under its category and add them to ``all_issues``."""
+        self.results[category] = issues
+        self._ingest(issues)
+    
+    def _ingest(self, issues: Iterable[ValidationResult]) -> None:
+        """Add issues to ``all_issues``, skipping ones already reported unless dedup is off.
+        
+        Checks can report the same problem for the same file and line; only
+        the first report is kept, in the order the issues arrive.
+        """
+        self._buckets = None
+        if not self.dedup:
+            self.all_issues.extend(issues)
+            return
+        
+        seen = self._seen
+        for issue in issues:
+            key = (issue.severity, issue.message, issue.file_path, issue.line_number, issue.rule)
+            if key not in seen:
+                seen.add(key)
+                self.all_issues.append(issue)
+    
+    def revalidate_files(self, file_paths: Iterable[str]) -> bool:
+        """Re-check only ``file_paths`` after they were edited, keeping other results.
+        
+        Issues the per-file checks reported for these files are replaced with a
+        fresh check of each file, and checks that read them as a whole are
+        rerun. Returns False, changing nothing, when a file is not covered by a
+        per-file check that has run; the caller should then rerun everything.
+        """
+        paths = [Path(file_path) for file_path in dict.fromkeys(file_paths)]
+        validators = {category: getattr(self, attr) for category, attr in _PER_FILE_CHECKS.items()
+                      if category in self.results}
+        if not paths or not all(any(v.handles_file(path) for v in validators.values()) for path in paths):
+            return False
+        
+        touched = {str(path) for path in paths}
+        results = {}
+        for category, issues in self.results.items():
+            if category in validators:
+                validator = validators[category]
+                issues = [issue for issue in issues if issue.file_path not in touched]
+                for path in paths:
+                    if validator.handles_file(path):
+                        issues.extend(validator.validate_file(path))
+            elif category in _CROSS_FILE_CHECKS:
+                _, _, attr, method = next(check for check in _CHECKS if check[0] == category)
+                issues = getattr(getattr(self, attr), method)()
+            results[category] = issues
+        
+        self._reset_issues()
+        for category, issues in results.items():
+            self._record(category, issues)
+        return True
+    
+    def severity_buckets(self) -> Tuple[List[ValidationResult], List[ValidationResult], List[ValidationResult]]:
+        """Return ``all_issues`` split into ``(errors, warnings, info)``.
+        
+        The split is reused until issues are reset or added, so the summary,
+        export and fix report share one pass over the issues.
+        """
+        if self._buckets is None:
+            self._buckets = _bucket(self.all_issues)
+        return self._buckets
+    
     def _print_validation_results(self, category: str, issues: List[ValidationResult]) -> None:
         """Print validation results for a category."""
         if not issues:
@@ -59,9 +222,7 @@ class QualityChecker:
             return
         
         # Categorize issues by severity
-        errors = [i for i in issues if i.severity == "error"]
-        warnings = [i for i in issues if i.severity == "warning"]
-        info = [i for i in issues if i.severity == "info"]
+        errors, warnings, info = _bucket(issues)
         
         # Choose appropriate symbol based on severity
         if errors:
@@ -99,9 +260,7 @@ class QualityChecker:
             return
         
         # Categorize all issues
-        errors = [i for i in self.all_issues if i.severity == "error"]
-        warnings = [i for i in self.all_issues if i.severity == "warning"]
-        info = [i for i in self.all_issues if i.severity == "info"]
+        errors, warnings, info = self.severity_buckets()
         
         print("\n" + "=" * 60)
         print("📋 QUALITY CHECK SUMMARY")
@@ -120,40 +279,120 @@ class QualityChecker:
     
     def has_critical_issues(self) -> bool:
         """Check if there are any critical issues."""
-        return any(issue.severity == "error" for issue in self.all_issues)
+        return bool(self.severity_buckets()[0])
     
     def export_results(self, filename: str) -> None:
-        """Export results to JSON file."""
-        import json
+        """Export results to JSON file.
         
-        results = {
-            "summary": {
-                "total": len(self.all_issues),
-                "errors": len([i for i in self.all_issues if i.severity == "error"]),
-                "warnings": len([i for i in self.all_issues if i.severity == "warning"]),
-                "info": len([i for i in self.all_issues if i.severity == "info"])
-            },
-            "issues": [
-                {
+        Issues are encoded and written one at a time, so the export never holds
+        a dict or JSON string for the whole issue list. The file is laid out
+        exactly as ``json.dump(..., indent=2)`` would write it.
+        """
+        def dumps(obj) -> str:
+            return json.dumps(obj, indent=2)
+        
+        errors, warnings, info = self.severity_buckets()
+        summary = {
+            "total": len(self.all_issues),
+            "errors": len(errors),
+            "warnings": len(warnings),
+            "info": len(info)
+        }
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('{\n  "summary": ' + dumps(summary).replace("\n", "\n  ") + ',\n  "issues": [')
+            separator = "\n    "
+            for issue in self.all_issues:
+                f.write(separator + dumps({
                     "severity": issue.severity,
                     "message": issue.message,
                     "file_path": issue.file_path,
                     "line_number": issue.line_number,
                     "rule": issue.rule
-                }
-                for issue in self.all_issues
-            ]
-        }
-        
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+                }).replace("\n", "\n    "))
+                separator = ",\n    "
+            f.write("\n  ]\n}" if self.all_issues else "]\n}")
         
         print(f"\n📄 Results exported to {filename}")
 
 
-def main():
-    """Main entry point for the quality checker CLI."""
-    parser = argparse.ArgumentParser(description="AI Rulesets Quality Checker")
+# Static text of the --fix report; the issue lists are filled in per run
+_AI_ASSISTANCE_TEMPLATE = """
+{rule}
+🤖 AI ASSISTANCE FOR MANUAL FIXES
+{rule}
+
+The following issues require manual attention. Here's how AI can help:
+
+📋 **Issues That Need Manual Fixing:**
+{summary}
+{rule}
+🤖 **AI PROMPT FOR MANUAL FIXES:**
+{rule}
+
+Copy and paste this prompt to your AI assistant:
+
+{thin_rule}
+I need help fixing quality issues in my codebase. Here are the specific issues:
+
+{prompt_issues}Please help me fix these issues systematically. For each issue:
+1. Identify the root cause
+2. Provide the specific fix
+3. Explain why this fix is correct
+4. Suggest prevention strategies
+
+Focus on critical errors first, then warnings. Provide code examples
+and step-by-step instructions where applicable.
+{thin_rule}
+
+💡 **Tip**: You can also run specific checks:
+  - `ai-rulesets quality check --readmes-only`
+  - `ai-rulesets quality check --workflows-only`
+  - `ai-rulesets quality check --versions-only`
+  - `ai-rulesets quality check --tests-only`
+"""
+
+
+def _format_issue_sample(heading: str, issues: List[ValidationResult], noun: str) -> str:
+    """Format a heading and the first five issues, noting how many were left out."""
+    if not issues:
+        return ""
+    
+    lines = [f"\n{heading} ({len(issues)}):**"]
+    lines.extend(f"  - {issue.message} ({issue.file_path})" for issue in issues[:5])
+    if len(issues) > 5:
+        lines.append(f"  ... and {len(issues) - 5} more {noun}")
+    return "\n".join(lines) + "\n"
+
+
+def _format_ai_assistance(checker: QualityChecker) -> str:
+    """Build the --fix report and AI prompt for the remaining issues as one string."""
+    # Categorize issues for AI assistance
+    critical_issues, warning_issues, _ = checker.severity_buckets()
+    summary = (_format_issue_sample("🔴 **Critical Issues", critical_issues, "critical issues")
+               + _format_issue_sample("🟡 **Warnings", warning_issues, "warnings"))
+    
+    # Generate detailed AI prompt, limited to the first 10 issues
+    prompt_issues = []
+    for i, issue in enumerate(itertools.islice(checker.all_issues, 10), 1):
+        line = f"   Line: {issue.line_number}\n" if issue.line_number else ""
+        prompt_issues.append(
+            f"{i}. **{issue.severity.upper()}**: {issue.message}\n   File: {issue.file_path}\n{line}\n"
+        )
+    if len(checker.all_issues) > 10:
+        prompt_issues.append(f"... and {len(checker.all_issues) - 10} more issues\n\n")
+    
+    return _AI_ASSISTANCE_TEMPLATE.format(
+        rule="=" * 60,
+        thin_rule="─" * 60,
+        summary=summary,
+        prompt_issues="".join(prompt_issues),
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the quality checker CLI; ``argv`` defaults to the process arguments."""
+    parser = argparse.ArgumentParser(prog="quality-check", description="AI Rulesets Quality Checker")
     parser.add_argument("--readmes-only", action="store_true", help="Check only README files")
     parser.add_argument("--workflows-only", action="store_true", help="Check only GitHub workflows")
     parser.add_argument("--tests-only", action="store_true", help="Check only test execution")
@@ -162,74 +401,56 @@ def main():
     parser.add_argument("--export", help="Export results to JSON file")
     parser.add_argument("--fail-on-error", action="store_true", help="Exit with error code if critical issues found")
     parser.add_argument("--project-root", default=".", help="Project root directory to check")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the validation cache")
+    parser.add_argument("--no-dedup", action="store_true",
+                        help="Keep issues that repeat an earlier one (same severity, message, file, line and rule)")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Threads each validator uses for per-file checks (default: 4 per CPU)")
+    
+    args = parser.parse_args(argv)
     
-    args = parser.parse_args()
+    # Initialize the quality checker; its validators are only created when used
+    checker = QualityChecker(args.project_root, use_cache=not args.no_cache, jobs=args.jobs,
+                             dedup=not args.no_dedup)
     
     print("🔍 AI Rulesets Quality Checker")
     print("=" * 60)
-    print(f"Checking quality in: {Path(args.project_root).absolute()}")
+    print(f"Checking quality in: {checker.project_root.absolute()}")
     print()
     
-    # Initialize the quality checker
-    checker = QualityChecker(args.project_root)
-    
     # Run specific checks based on arguments
     if args.readmes_only:
         print("📚 Validating README files...")
         issues = checker.readme_validator.validate()
-        checker.all_issues = issues
+        checker._record("README", issues)
         checker._print_validation_results("README", issues)
     elif args.workflows_only:
         print("⚙️ Validating GitHub workflows...")
         issues = checker.workflow_validator.validate()
-        checker.all_issues = issues
+        checker._record("Workflows", issues)
         checker._print_validation_results("Workflows", issues)
     elif args.tests_only:
         print("🧪 Validating test execution...")
         issues = checker.test_validator.validate()
         allure_issues = checker.test_validator.validate_allure_reporting()
-        checker.all_issues = issues + allure_issues
+        checker._record("Tests", issues)
+        checker._record("Allure", allure_issues)
         checker._print_validation_results("Tests", issues)
         checker._print_validation_results("Allure", allure_issues)
     elif args.versions_only:
         print("🔢 Validating version consistency...")
         issues = checker.version_validator.validate()
-        checker.all_issues = issues
+        checker._record("Versions", issues)
         checker._print_validation_results("Versions", issues)
     else:
-        # Run all checks
+        # Run all checks concurrently, then report them in order
         print("🔍 Running comprehensive quality checks...")
         print("=" * 60)
         
-        # Run README validation
-        print("\n📚 Validating README files...")
-        readme_issues = checker.readme_validator.validate()
-        checker.all_issues.extend(readme_issues)
-        checker._print_validation_results("README", readme_issues)
-        
-        # Run workflow validation
-        print("\n⚙️ Validating GitHub workflows...")
-        workflow_issues = checker.workflow_validator.validate()
-        checker.all_issues.extend(workflow_issues)
-        checker._print_validation_results("Workflows", workflow_issues)
-        
-        # Run test validation
-        print("\n🧪 Validating test execution...")
-        test_issues = checker.test_validator.validate()
-        checker.all_issues.extend(test_issues)
-        checker._print_validation_results("Tests", test_issues)
-        
-        # Run Allure validation
-        print("\n📊 Validating Allure reporting...")
-        allure_issues = checker.test_validator.validate_allure_reporting()
-        checker.all_issues.extend(allure_issues)
-        checker._print_validation_results("Allure", allure_issues)
-        
-        # Run version validation
-        print("\n🔢 Validating version consistency...")
-        version_issues = checker.version_validator.validate()
-        checker.all_issues.extend(version_issues)
-        checker._print_validation_results("Versions", version_issues)
+        for (category, issues), check in zip(checker.run_checks(), _CHECKS):
+            print(f"\n{check[1]}")
+            checker._record(category, issues)
+            checker._print_validation_results(category, issues)
     
     # Apply fixes if requested
     if args.fix and checker.all_issues:
@@ -237,7 +458,8 @@ def main():
         print("🔧 APPLYING AUTOMATIC FIXES")
         print("=" * 60)
         
-        fixer = IssueFixer(str(checker.project_root))
+        from ai_rulesets.validation.issue_fixer import IssueFixer
+        fixer = IssueFixer(checker.project_root)
         fix_results = fixer.fix_issues(checker.all_issues)
         
         print(f"\n{fixer.get_fix_summary()}")
@@ -247,20 +469,28 @@ def main():
             print("\n🔄 Re-running validation after fixes...")
             print("=" * 60)
             
-            # Clear previous issues and re-run
-            checker.all_issues = []
-            if args.readmes_only:
+            # Re-check just the fixed files when per-file checks cover them all
+            if checker.revalidate_files(fixer.fixed_files()):
+                if args.readmes_only or args.workflows_only or args.tests_only or args.versions_only:
+                    for category, issues in checker.results.items():
+                        checker._print_validation_results(category, issues)
+            # Otherwise clear previous issues and re-run
+            elif args.readmes_only:
+                checker._reset_issues()
                 issues = checker.readme_validator.validate()
-                checker.all_issues = issues
+                checker._record("README", issues)
                 checker._print_validation_results("README", issues)
             elif args.workflows_only:
+                checker._reset_issues()
                 issues = checker.workflow_validator.validate()
-                checker.all_issues = issues
+                checker._record("Workflows", issues)
                 checker._print_validation_results("Workflows", issues)
             elif args.tests_only:
+                checker._reset_issues()
                 issues = checker.test_validator.validate()
                 allure_issues = checker.test_validator.validate_allure_reporting()
-                checker.all_issues = issues + allure_issues
+                checker._record("Tests", issues)
+                checker._record("Allure", allure_issues)
                 checker._print_validation_results("Tests", issues)
                 checker._print_validation_results("Allure", allure_issues)
             else:
@@ -271,64 +501,7 @@ def main():
     
     # If using --fix, provide AI instructions for manual fixes
     if args.fix and checker.all_issues:
-        print("\n" + "=" * 60)
-        print("🤖 AI ASSISTANCE FOR MANUAL FIXES")
-        print("=" * 60)
-        print("\nThe following issues require manual attention. Here's how AI can help:")
-        print("\n📋 **Issues That Need Manual Fixing:**")
-        
-        # Categorize issues for AI assistance
-        critical_issues = [issue for issue in checker.all_issues if issue.severity == "error"]
-        warning_issues = [issue for issue in checker.all_issues if issue.severity == "warning"]
-        
-        if critical_issues:
-            print(f"\n🔴 **Critical Issues ({len(critical_issues)}):**")
-            for issue in critical_issues[:5]:  # Show first 5
-                print(f"  - {issue.message} ({issue.file_path})")
-            if len(critical_issues) > 5:
-                print(f"  ... and {len(critical_issues) - 5} more critical issues")
-        
-        if warning_issues:
-            print(f"\n🟡 **Warnings ({len(warning_issues)}):**")
-            for issue in warning_issues[:5]:  # Show first 5
-                print(f"  - {issue.message} ({issue.file_path})")
-            if len(warning_issues) > 5:
-                print(f"  ... and {len(warning_issues) - 5} more warnings")
-        
-        print("\n" + "=" * 60)
-        print("🤖 **AI PROMPT FOR MANUAL FIXES:**")
-        print("=" * 60)
-        print("\nCopy and paste this prompt to your AI assistant:")
-        print("\n" + "─" * 60)
-        print("I need help fixing quality issues in my codebase. Here are the specific issues:")
-        print()
-        
-        # Generate detailed AI prompt
-        for i, issue in enumerate(checker.all_issues[:10], 1):  # Limit to first 10 issues
-            print(f"{i}. **{issue.severity.upper()}**: {issue.message}")
-            print(f"   File: {issue.file_path}")
-            if issue.line_number:
-                print(f"   Line: {issue.line_number}")
-            print()
-        
-        if len(checker.all_issues) > 10:
-            print(f"... and {len(checker.all_issues) - 10} more issues")
-            print()
-        
-        print("Please help me fix these issues systematically. For each issue:")
-        print("1. Identify the root cause")
-        print("2. Provide the specific fix")
-        print("3. Explain why this fix is correct")
-        print("4. Suggest prevention strategies")
-        print()
-        print("Focus on critical errors first, then warnings. Provide code examples")
-        print("and step-by-step instructions where applicable.")
-        print("─" * 60)
-        print("\n💡 **Tip**: You can also run specific checks:")
-        print("  - `ai-rulesets quality check --readmes-only`")
-        print("  - `ai-rulesets quality check --workflows-only`")
-        print("  - `ai-rulesets quality check --versions-only`")
-        print("  - `ai-rulesets quality check --tests-only`")
+        sys.stdout.write(_format_ai_assistance(checker))
     
     # Export results if requested
     if args.export:
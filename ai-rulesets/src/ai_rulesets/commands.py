@@ -1,216 +1,241 @@
 """
-Command-line interface for AI rulesets and organizational standards.
+Command implementations shared by the click CLI and the argparse fast path.
+
+Nothing here imports click, so ``python -m ai_rulesets`` can run the common
+commands without paying for it.
 """
 
-import click
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-
-from .core import Ruleset, RulesetMetadata, RulesetItem, RulesetManager
-from .renderers import CursorRenderer, CopilotRenderer, GenericRenderer
-from .cli.generate import generate_rulesets, generate_from_sources
-
+from typing import Optional, Sequence, Tuple
 
-@click.group()
-def main():
-    """AI Rulesets - Organizational development standards and utilities."""
-    pass
+from .core import Ruleset, RulesetMetadata, RulesetItem, RulesetManager, iter_ruleset_files
 
 
-@main.command()
-@click.option("--output", "-o", type=click.Path(), default=".cursor/rules", 
-              help="Output directory for Cursor rulesets")
-@click.option("--type", "-t", "ruleset_types", multiple=True, 
-              help="Ruleset types to generate (python, typescript, testing, cicd, security)")
-@click.option("--all", "generate_all", is_flag=True, help="Generate all available rulesets")
-def generate_cursor(output: str, ruleset_types: List[str], generate_all: bool):
+def generate_cursor(output: str, ruleset_types: Sequence[str] = (), generate_all: bool = False) -> None:
     """Generate Cursor ruleset files."""
     output_path = Path(output)
     
     if generate_all:
-        ruleset_types = ["python", "typescript", "testing", "cicd", "security"]
+        ruleset_types = _ALL_RULESET_TYPES
     elif not ruleset_types:
-        ruleset_types = ["python", "testing"]
+        ruleset_types = ("python", "testing")
     
-    click.echo(f"Generating Cursor rulesets for: {', '.join(ruleset_types)}")
-    click.echo(f"Output directory: {output_path}")
+    unknown = set(ruleset_types) - _RULESET_BUILDERS.keys()
+    if unknown:
+        print(f"Error: Unknown ruleset type(s): {', '.join(sorted(unknown))}")
+        return
     
-    # Create rulesets
-    rulesets = []
+    print(f"Generating Cursor rulesets for: {', '.join(ruleset_types)}")
+    print(f"Output directory: {output_path}")
     
-    for ruleset_type in ruleset_types:
-        if ruleset_type == "python":
-            ruleset = _create_python_development_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "typescript":
-            ruleset = _create_typescript_development_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "testing":
-            ruleset = _create_testing_guidelines_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "cicd":
-            ruleset = _create_cicd_infrastructure_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "security":
-            ruleset = _create_security_standards_ruleset()
-            rulesets.append(ruleset)
+    # Create rulesets
+    rulesets = [_RULESET_BUILDERS[ruleset_type]() for ruleset_type in ruleset_types]
     
     # Render files
-    renderer = CursorRenderer()
+    renderer = _get_renderer("cursor")
     renderer.render_multiple(rulesets, output_path)
     
-    click.echo(f"Generated {len(rulesets)} Cursor ruleset files in {output_path}")
+    print(f"Generated {len(rulesets)} Cursor ruleset files in {output_path}")
 
 
-@main.command()
-@click.option("--output", "-o", type=click.Path(), default=".github/instructions", 
-              help="Output directory for GitHub Copilot instructions")
-@click.option("--type", "-t", "ruleset_types", multiple=True, 
-              help="Ruleset types to generate (python, typescript, testing, cicd, security)")
-@click.option("--all", "generate_all", is_flag=True, help="Generate all available rulesets")
-def generate_copilot(output: str, ruleset_types: List[str], generate_all: bool):
+def generate_copilot(output: str, ruleset_types: Sequence[str] = (), generate_all: bool = False) -> None:
     """Generate GitHub Copilot instruction files."""
     output_path = Path(output)
     
     if generate_all:
-        ruleset_types = ["python", "typescript", "testing", "cicd", "security"]
+        ruleset_types = _ALL_RULESET_TYPES
     elif not ruleset_types:
-        ruleset_types = ["python", "testing"]
+        ruleset_types = ("python", "testing")
     
-    click.echo(f"Generating GitHub Copilot instructions for: {', '.join(ruleset_types)}")
-    click.echo(f"Output directory: {output_path}")
+    unknown = set(ruleset_types) - _RULESET_BUILDERS.keys()
+    if unknown:
+        print(f"Error: Unknown ruleset type(s): {', '.join(sorted(unknown))}")
+        return
     
-    # Create rulesets
-    rulesets = []
+    print(f"Generating GitHub Copilot instructions for: {', '.join(ruleset_types)}")
+    print(f"Output directory: {output_path}")
     
-    for ruleset_type in ruleset_types:
-        if ruleset_type == "python":
-            ruleset = _create_python_development_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "typescript":
-            ruleset = _create_typescript_development_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "testing":
-            ruleset = _create_testing_guidelines_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "cicd":
-            ruleset = _create_cicd_infrastructure_ruleset()
-            rulesets.append(ruleset)
-        elif ruleset_type == "security":
-            ruleset = _create_security_standards_ruleset()
-            rulesets.append(ruleset)
+    # Create rulesets
+    rulesets = [_RULESET_BUILDERS[ruleset_type]() for ruleset_type in ruleset_types]
     
     # Render files
-    renderer = CopilotRenderer()
+    renderer = _get_renderer("copilot")
     renderer.render_multiple(rulesets, output_path)
     
-    click.echo(f"Generated {len(rulesets)} GitHub Copilot instruction files in {output_path}")
+    print(f"Generated {len(rulesets)} GitHub Copilot instruction files in {output_path}")
 
 
-@main.command()
-@click.option("--input", "-i", type=click.Path(), required=True,
-              help="Input directory or file containing documentation")
-@click.option("--output", "-o", type=click.Path(), default=".cursor/rules",
-              help="Output directory for generated rulesets")
-@click.option("--type", "-t", "ruleset_type", default="generic",
-              help="Type of ruleset to generate (generic, python, typescript)")
-@click.option("--format", "-f", "output_format", type=click.Choice(["cursor", "copilot", "generic"]),
-              default="cursor", help="Output format for rulesets")
-def generate_from_docs(input: str, output: str, ruleset_type: str, output_format: str):
+def generate_from_docs(input: str, output: str, ruleset_type: str = "generic", output_format: str = "cursor") -> None:
     """Generate rulesets from company documentation."""
     input_path = Path(input)
     output_path = Path(output)
     
     if not input_path.exists():
-        click.echo(f"Error: Input path {input_path} does not exist")
+        print(f"Error: Input path {input_path} does not exist")
         return
     
-    click.echo(f"Generating {ruleset_type} rulesets from: {input_path}")
-    click.echo(f"Output format: {output_format}")
-    click.echo(f"Output directory: {output_path}")
+    print(f"Generating {ruleset_type} rulesets from: {input_path}")
+    print(f"Output format: {output_format}")
+    print(f"Output directory: {output_path}")
     
     # For now, create a placeholder ruleset
     # In a real implementation, this would process the documentation
     ruleset = _create_generic_ruleset_from_docs(input_path, ruleset_type)
     
     # Choose renderer based on format
-    if output_format == "cursor":
-        renderer = CursorRenderer()
-        filename = f"{ruleset.metadata.name}.mdc"
-    elif output_format == "copilot":
-        renderer = CopilotRenderer()
-        filename = f"{ruleset.metadata.name}.instructions.md"
-    else:
-        renderer = GenericRenderer()
-        filename = f"{ruleset.metadata.name}.md"
+    renderer = _get_renderer(output_format)
+    filename = f"{ruleset.metadata.name}{renderer.suffix}"
     
     output_file = output_path / filename
     renderer.render_file(ruleset, output_file)
     
-    click.echo(f"Generated ruleset: {output_file}")
+    print(f"Generated ruleset: {output_file}")
 
 
-@main.command()
-@click.option("--input", "-i", type=click.Path(), required=True,
-              help="Input directory containing rulesets to validate")
-def validate(input: str):
+def validate(input: str) -> None:
     """Validate rulesets for completeness and correctness."""
     input_path = Path(input)
     
     if not input_path.exists():
-        click.echo(f"Error: Input path {input_path} does not exist")
+        print(f"Error: Input path {input_path} does not exist")
         return
     
-    click.echo(f"Validating rulesets in: {input_path}")
+    print(f"Validating rulesets in: {input_path}")
     
     manager = RulesetManager()
     issues_found = False
     
-    # Find all ruleset files
-    for ruleset_file in input_path.rglob("*.yaml"):
-        try:
-            ruleset = manager.load_ruleset_from_file(ruleset_file)
-            issues = manager.validate_ruleset(ruleset)
-            
-            if issues:
-                click.echo(f"❌ {ruleset_file}: {len(issues)} issues found")
-                for issue in issues:
-                    click.echo(f"  - {issue}")
-                issues_found = True
-            else:
-                click.echo(f"✅ {ruleset_file}: Valid")
-                
-        except Exception as e:
-            click.echo(f"❌ {ruleset_file}: Error loading - {e}")
+    # Find all ruleset files once and read them concurrently; reads are I/O bound
+    ruleset_files = list(iter_ruleset_files(input_path)) if input_path.is_dir() else [input_path]
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as executor:
+        contents = list(executor.map(_read_ruleset_file, ruleset_files))
+    
+    # Parse and report on the main thread, in discovery order
+    for ruleset_file, (data, error) in zip(ruleset_files, contents):
+        if error is None:
+            try:
+                ruleset = manager.load_ruleset_from_bytes(ruleset_file, data)
+            except Exception as e:
+                error = e
+        if error is not None:
+            print(f"❌ {ruleset_file}: Error loading - {error}")
+            issues_found = True
+            continue
+        
+        issues = manager.validate_ruleset(ruleset)
+        
+        if issues:
+            print(f"❌ {ruleset_file}: {len(issues)} issues found")
+            for issue in issues:
+                print(f"  - {issue}")
             issues_found = True
+        else:
+            print(f"✅ {ruleset_file}: Valid")
     
     if not issues_found:
-        click.echo("All rulesets are valid!")
+        print("All rulesets are valid!")
     else:
-        click.echo("Some rulesets have issues that need to be fixed.")
+        print("Some rulesets have issues that need to be fixed.")
 
 
-@main.command()
-@click.option("--type", "-t", "ruleset_types", multiple=True, 
-              help="Ruleset types to list (python, typescript, testing, cicd, security)")
-def list_rulesets(ruleset_types: List[str]):
+def list_rulesets(ruleset_types: Sequence[str] = ()) -> None:
     """List available rulesets."""
     if not ruleset_types:
-        ruleset_types = ["python", "typescript", "testing", "cicd", "security"]
+        ruleset_types = _ALL_RULESET_TYPES
     
-    click.echo("Available rulesets:")
+    print("Available rulesets:")
     for ruleset_type in ruleset_types:
-        click.echo(f"  - {ruleset_type}")
+        print(f"  - {ruleset_type}")
+
+
+def _read_ruleset_file(ruleset_file: Path) -> Tuple[Optional[bytes], Optional[Exception]]:
+    """Read a ruleset file's raw content, returning the error instead of raising it."""
+    try:
+        return ruleset_file.read_bytes(), None
+    except Exception as e:
+        return None, e
 
 
-# Add generate commands
-main.add_command(generate_rulesets, name="generate-rulesets")
-main.add_command(generate_from_sources, name="generate-from-sources")
+# Shared renderer instance per output format
+_FORMAT_RENDERERS = {
+    "cursor": "cursor_renderer",
+    "copilot": "copilot_renderer",
+    "generic": "generic_renderer",
+}
+
+
+def _get_renderer(output_format: str):
+    """Return the shared renderer for a format, importing it on first use."""
+    from . import renderers
+    return getattr(renderers, _FORMAT_RENDERERS[output_format])
 
 
 # Ruleset creators
 # In a real implementation, these would load from YAML files
+# Builders are pure, so each one is cached and the same Ruleset is shared
+# between commands; renderers only read from it.
+
+# Rule bodies live at module level so every build shares the same string objects
+_PY_CODE_STYLE_CONTENT = """# Use Black for code formatting with 88-character line limit
+# Use Ruff for linting and code analysis
+# Follow PEP 8 with organizational modifications
+# Use type hints extensively for better IDE support
+# Use meaningful variable and function names
+# Group imports: standard library, third-party, local imports"""
+
+_PY_TESTING_CONTENT = """# Use pytest for all testing
+# Write descriptive test names that explain behavior
+# Use fixtures for test data and setup
+# Aim for 80%+ test coverage
+# Use parametrized tests for multiple test cases
+# Mock external dependencies appropriately"""
 
+_TS_CODE_STYLE_CONTENT = """# Use ESLint and Prettier for code formatting
+# Follow Airbnb TypeScript style guide
+# Use strict type checking and strict mode
+# Leverage modern ES6+ features: arrow functions, destructuring, template literals
+# Use meaningful variable and function names
+# Implement proper interfaces and type definitions"""
+
+_TESTING_PRINCIPLES_CONTENT = """# Write tests that are fast, independent, repeatable, and self-validating
+# Use the Arrange-Act-Assert pattern for test structure
+# Implement proper test data management
+# Use Page Object Model for UI testing
+# Implement proper test isolation and cleanup
+# Use appropriate test doubles (mocks, stubs, fakes)"""
+
+_CICD_PRACTICES_CONTENT = """# Use path-based triggers to run only relevant jobs
+# Implement proper caching for dependencies
+# Use matrix strategies for multi-version testing
+# Implement proper error handling and rollback strategies
+# Use proper secret management
+# Include linting, testing, and security scanning in all pipelines"""
+
+_SECURITY_PRACTICES_CONTENT = """# Never commit secrets or sensitive data
+# Use environment variables for configuration
+# Implement proper authentication and authorization
+# Use proper input validation
+# Use encryption at rest and in transit
+# Follow OWASP security guidelines
+# Implement proper secret rotation strategies"""
+
+# Rule tags are immutable tuples, likewise shared by every build
+_PY_CODE_STYLE_TAGS = ("style", "formatting", "linting")
+_PY_TESTING_TAGS = ("testing", "pytest", "coverage")
+_TS_CODE_STYLE_TAGS = ("style", "formatting", "typescript")
+_TESTING_PRINCIPLES_TAGS = ("principles", "best-practices")
+_CICD_PRACTICES_TAGS = ("cicd", "pipelines", "automation")
+_SECURITY_PRACTICES_TAGS = ("security", "secrets", "encryption")
+_PLACEHOLDER_TAGS = ("placeholder", "generated")
+
+
+# The built-in builders below are cached, so every caller gets the same
+# Ruleset. They freeze it, so add_rule raises instead of leaking into later
+# calls; callers must also leave its metadata lists alone.
+@functools.lru_cache(maxsize=1)
 def _create_python_development_ruleset() -> Ruleset:
     """Create a Python development standards ruleset."""
     metadata = RulesetMetadata(
@@ -229,13 +254,8 @@ def _create_python_development_ruleset() -> Ruleset:
     ruleset.add_rule(RulesetItem(
         name="Code Style",
         description="Python code style guidelines",
-        content="""# Use Black for code formatting with 88-character line limit
-# Use Ruff for linting and code analysis
-# Follow PEP 8 with organizational modifications
-# Use type hints extensively for better IDE support
-# Use meaningful variable and function names
-# Group imports: standard library, third-party, local imports""",
-        tags=["style", "formatting", "linting"],
+        content=_PY_CODE_STYLE_CONTENT,
+        tags=_PY_CODE_STYLE_TAGS,
         priority=1,
         category="code-quality"
     ))
@@ -244,20 +264,17 @@ def _create_python_development_ruleset() -> Ruleset:
     ruleset.add_rule(RulesetItem(
         name="Testing Standards",
         description="Python testing guidelines and patterns",
-        content="""# Use pytest for all testing
-# Write descriptive test names that explain behavior
-# Use fixtures for test data and setup
-# Aim for 80%+ test coverage
-# Use parametrized tests for multiple test cases
-# Mock external dependencies appropriately""",
-        tags=["testing", "pytest", "coverage"],
+        content=_PY_TESTING_CONTENT,
+        tags=_PY_TESTING_TAGS,
         priority=1,
         category="testing"
     ))
     
+    ruleset.freeze()
     return ruleset
 
 
+@functools.lru_cache(maxsize=1)
 def _create_typescript_development_ruleset() -> Ruleset:
     """Create a TypeScript development standards ruleset."""
     metadata = RulesetMetadata(
@@ -276,20 +293,17 @@ def _create_typescript_development_ruleset() -> Ruleset:
     ruleset.add_rule(RulesetItem(
         name="TypeScript Code Style",
         description="TypeScript code style guidelines",
-        content="""# Use ESLint and Prettier for code formatting
-# Follow Airbnb TypeScript style guide
-# Use strict type checking and strict mode
-# Leverage modern ES6+ features: arrow functions, destructuring, template literals
-# Use meaningful variable and function names
-# Implement proper interfaces and type definitions""",
-        tags=["style", "formatting", "typescript"],
+        content=_TS_CODE_STYLE_CONTENT,
+        tags=_TS_CODE_STYLE_TAGS,
         priority=1,
         category="code-quality"
     ))
     
+    ruleset.freeze()
     return ruleset
 
 
+@functools.lru_cache(maxsize=1)
 def _create_testing_guidelines_ruleset() -> Ruleset:
     """Create a testing guidelines ruleset."""
     metadata = RulesetMetadata(
@@ -308,20 +322,17 @@ def _create_testing_guidelines_ruleset() -> Ruleset:
     ruleset.add_rule(RulesetItem(
         name="Testing Principles",
         description="Core testing principles and best practices",
-        content="""# Write tests that are fast, independent, repeatable, and self-validating
-# Use the Arrange-Act-Assert pattern for test structure
-# Implement proper test data management
-# Use Page Object Model for UI testing
-# Implement proper test isolation and cleanup
-# Use appropriate test doubles (mocks, stubs, fakes)""",
-        tags=["principles", "best-practices"],
+        content=_TESTING_PRINCIPLES_CONTENT,
+        tags=_TESTING_PRINCIPLES_TAGS,
         priority=1,
         category="testing"
     ))
     
+    ruleset.freeze()
     return ruleset
 
 
+@functools.lru_cache(maxsize=1)
 def _create_cicd_infrastructure_ruleset() -> Ruleset:
     """Create a CI/CD infrastructure ruleset."""
     metadata = RulesetMetadata(
@@ -340,20 +351,17 @@ def _create_cicd_infrastructure_ruleset() -> Ruleset:
     ruleset.add_rule(RulesetItem(
         name="CI/CD Best Practices",
         description="CI/CD pipeline best practices and standards",
-        content="""# Use path-based triggers to run only relevant jobs
-# Implement proper caching for dependencies
-# Use matrix strategies for multi-version testing
-# Implement proper error handling and rollback strategies
-# Use proper secret management
-# Include linting, testing, and security scanning in all pipelines""",
-        tags=["cicd", "pipelines", "automation"],
+        content=_CICD_PRACTICES_CONTENT,
+        tags=_CICD_PRACTICES_TAGS,
         priority=1,
         category="infrastructure"
     ))
     
+    ruleset.freeze()
     return ruleset
 
 
+@functools.lru_cache(maxsize=1)
 def _create_security_standards_ruleset() -> Ruleset:
     """Create a security standards ruleset."""
     metadata = RulesetMetadata(
@@ -372,18 +380,13 @@ def _create_security_standards_ruleset() -> Ruleset:
     ruleset.add_rule(RulesetItem(
         name="Security Best Practices",
         description="Security-first development practices",
-        content="""# Never commit secrets or sensitive data
-# Use environment variables for configuration
-# Implement proper authentication and authorization
-# Use proper input validation
-# Use encryption at rest and in transit
-# Follow OWASP security guidelines
-# Implement proper secret rotation strategies""",
-        tags=["security", "secrets", "encryption"],
+        content=_SECURITY_PRACTICES_CONTENT,
+        tags=_SECURITY_PRACTICES_TAGS,
         priority=1,
         category="security"
     ))
     
+    ruleset.freeze()
     return ruleset
 
 
@@ -405,7 +408,7 @@ def _create_generic_ruleset_from_docs(input_path: Path, ruleset_type: str) -> Ru
         name="Documentation Processing",
         description="Placeholder rule for documentation processing",
         content=f"# This ruleset was generated from documentation in {input_path}\n# In a real implementation, this would process the actual documentation content",
-        tags=["placeholder", "generated"],
+        tags=_PLACEHOLDER_TAGS,
         priority=1,
         category="custom"
     ))
@@ -413,5 +416,12 @@ def _create_generic_ruleset_from_docs(input_path: Path, ruleset_type: str) -> Ru
     return ruleset
 
 
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+# Each builder returns the one shared, frozen ruleset for its type; treat it as read-only
+_RULESET_BUILDERS = {
+    "python": _create_python_development_ruleset,
+    "typescript": _create_typescript_development_ruleset,
+    "testing": _create_testing_guidelines_ruleset,
+    "cicd": _create_cicd_infrastructure_ruleset,
+    "security": _create_security_standards_ruleset,
+}
+_ALL_RULESET_TYPES = tuple(_RULESET_BUILDERS)
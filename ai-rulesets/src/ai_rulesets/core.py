@@ -2,23 +2,72 @@
 Core data structures for AI rulesets and organizational standards.
 """
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+import bisect
+import functools
+import itertools
+import operator
+import os
 import yaml
 import json
 
+try:
+    # libyaml-backed loader/emitter, an order of magnitude faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
-@dataclass
+try:
+    # Optional fast JSON decoder, used to read .json ruleset files when
+    # installed; to_json and save_to_file always encode with the json module
+    import orjson
+except ImportError:
+    orjson = None
+
+RULESET_FILE_SUFFIXES = (".yaml", ".yml")
+
+
+def iter_ruleset_files(root: Union[str, Path]) -> Iterator[Path]:
+    """Yield YAML ruleset files under ``root``, skipping hidden directories.
+    
+    Walks with ``os.scandir`` so directory entries come back with their file
+    type already known, instead of building and matching a ``Path`` per entry.
+    Directories wait on an explicit stack as plain strings, so deep trees
+    neither recurse nor hold one open directory handle per level; only
+    matches become ``Path`` objects.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(RULESET_FILE_SUFFIXES):
+                    yield Path(entry.path)
+        # Reversed so subdirectories are visited in the order they were listed
+        stack.extend(reversed(subdirs))
+
+
+@dataclass(slots=True, frozen=True)
 class RulesetItem:
     """Represents a single rule or guideline within a ruleset."""
     
     name: str
     description: str
     content: str
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = field(default_factory=tuple)
     priority: int = 1  # 1 = highest priority
     category: Optional[str] = None
+    # Tags as the templates print them, joined once here rather than per render
+    tags_joined: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tags_joined", ", ".join(map(str, self.tags)))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert ruleset item to dictionary representation."""
@@ -26,13 +75,13 @@ class RulesetItem:
             "name": self.name,
             "description": self.description,
             "content": self.content,
-            "tags": self.tags,
+            "tags": list(self.tags),
             "priority": self.priority,
             "category": self.category,
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class RulesetMetadata:
     """Metadata for a ruleset."""
     
@@ -46,6 +95,26 @@ class RulesetMetadata:
     license: Optional[str] = None
     target_tools: List[str] = field(default_factory=lambda: ["cursor", "copilot"])
     
+    @property
+    def categories_joined(self) -> str:
+        """Categories as the templates print them."""
+        return ", ".join(map(str, self.categories))
+    
+    @property
+    def tags_joined(self) -> str:
+        """Tags as the templates print them."""
+        return ", ".join(map(str, self.tags))
+    
+    @property
+    def categories_markdown(self) -> str:
+        """Categories as a markdown bullet list, one ``- category`` line each."""
+        return "".join(f"- {category}\n" for category in self.categories)
+    
+    @property
+    def tags_markdown(self) -> str:
+        """Tags as a markdown bullet list, one ``- tag`` line each."""
+        return "".join(f"- {tag}\n" for tag in self.tags)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary representation."""
         return {
@@ -61,37 +130,121 @@ class RulesetMetadata:
         }
 
 
-@dataclass
+def _negated_priority(rule: RulesetItem) -> int:
+    """Sort key that orders rules highest priority first."""
+    return -rule.priority
+
+
+def _same_items(snapshot: Tuple[RulesetItem, ...], rules: Sequence[RulesetItem]) -> bool:
+    """Return True if ``rules`` still holds exactly the objects in ``snapshot``, in order.
+    
+    Items are compared by identity, so a rule replaced in place is noticed
+    even when the list keeps its length; the snapshot keeps its items alive,
+    so their identities cannot be reused.
+    """
+    return snapshot is rules or (
+        len(snapshot) == len(rules) and all(map(operator.is_, snapshot, rules))
+    )
+
+
+@dataclass(slots=True)
+class _RuleIndex:
+    """Lookup tables over a ruleset's rules, built in one pass."""
+    
+    # The rules the tables were built from
+    rules: Tuple[RulesetItem, ...]
+    by_tag: Dict[str, List[RulesetItem]]
+    by_category: Dict[Optional[str], List[RulesetItem]]
+    # Negated priorities in rule order, or None if the rules are not sorted by priority
+    sorted_priorities: Optional[List[int]]
+
+
+@dataclass(slots=True)
 class Ruleset:
     """A collection of rules and guidelines for organizational standards."""
     
     metadata: RulesetMetadata
     rules: List[RulesetItem] = field(default_factory=list)
+    _index: Optional[_RuleIndex] = field(default=None, init=False, repr=False, compare=False)
+    # The rules as add_rule last left them, sorted by priority
+    _sorted_rules: Optional[Tuple[RulesetItem, ...]] = field(default=None, init=False, repr=False, compare=False)
+    # The rules the blocks were built from, and the blocks
+    _blocks: Optional[Tuple[Tuple[RulesetItem, ...], Tuple[str, ...]]] = field(default=None, init=False, repr=False, compare=False)
     
     def add_rule(self, rule_item: RulesetItem) -> None:
         """Add a rule item to the ruleset."""
-        self.rules.append(rule_item)
-        # Sort by priority (highest first)
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
+        rules = self.rules
+        if isinstance(rules, tuple):
+            raise ValueError(f"Ruleset '{self.metadata.name}' is frozen; rules cannot be added")
+        if self._sorted_rules is not None and _same_items(self._sorted_rules, rules):
+            # Still sorted since the last add; insert after any equal priorities,
+            # where the stable sort below would also place it
+            bisect.insort_right(rules, rule_item, key=_negated_priority)
+        else:
+            rules.append(rule_item)
+            # Sort by priority (highest first)
+            rules.sort(key=lambda r: r.priority, reverse=True)
+        self._sorted_rules = tuple(rules)
+        self._index = None
+    
+    def freeze(self) -> None:
+        """Store the rules as a tuple so they can no longer change.
+        
+        Built-in rulesets freeze once loaded, so their rules can be shared and
+        iterated as a tuple; add_rule raises ValueError afterwards.
+        """
+        self.rules = tuple(self.rules)
+        self._sorted_rules = None
+    
+    def _get_index(self) -> _RuleIndex:
+        """Return the lookup tables, rebuilding them if ``rules`` was replaced or changed."""
+        rules = self.rules
+        if self._index is None or not _same_items(self._index.rules, rules):
+            by_tag: Dict[str, List[RulesetItem]] = {}
+            by_category: Dict[Optional[str], List[RulesetItem]] = {}
+            priorities = []
+            for rule in rules:
+                for tag in dict.fromkeys(rule.tags):
+                    by_tag.setdefault(tag, []).append(rule)
+                by_category.setdefault(rule.category, []).append(rule)
+                priorities.append(-rule.priority)
+            
+            is_sorted = all(a <= b for a, b in zip(priorities, priorities[1:]))
+            # tuple() hands back a frozen ruleset's rules as they are, uncopied
+            self._index = _RuleIndex(tuple(rules), by_tag, by_category, priorities if is_sorted else None)
+        return self._index
+    
+    def rule_blocks(self) -> Tuple[str, ...]:
+        """Return each rule's name, description and content as one markdown block.
+        
+        This is the part of a rule that every output format shares, so it is
+        built once and reused by each renderer until ``rules`` is replaced or
+        changed, the same way the lookup tables are invalidated.
+        """
+        rules = self.rules
+        if self._blocks is None or not _same_items(self._blocks[0], rules):
+            self._blocks = (tuple(rules), tuple(f"{rule.name}\n\n{rule.description}\n\n{rule.content}\n\n" for rule in rules))
+        return self._blocks[1]
     
     def get_rules_by_tag(self, tag: str) -> List[RulesetItem]:
         """Get all rules that contain the specified tag."""
-        return [rule for rule in self.rules if tag in rule.tags]
+        return list(self._get_index().by_tag.get(tag, ()))
     
     def get_rules_by_category(self, category: str) -> List[RulesetItem]:
         """Get all rules in the specified category."""
-        return [rule for rule in self.rules if rule.category == category]
+        return list(self._get_index().by_category.get(category, ()))
     
     def get_rules_by_priority(self, min_priority: int = 1) -> List[RulesetItem]:
         """Get all rules with priority >= min_priority."""
-        return [rule for rule in self.rules if rule.priority >= min_priority]
+        priorities = self._get_index().sorted_priorities
+        if priorities is None:
+            return [rule for rule in self.rules if rule.priority >= min_priority]
+        # Rules are highest priority first, so the matches are a prefix
+        return list(itertools.islice(self.rules, bisect.bisect_right(priorities, -min_priority)))
     
     def get_all_tags(self) -> Set[str]:
         """Get all unique tags used in this ruleset."""
-        tags = set()
-        for rule in self.rules:
-            tags.update(rule.tags)
-        return tags
+        return set(self._get_index().by_tag)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert ruleset to dictionary representation."""
@@ -102,10 +255,16 @@ class Ruleset:
     
     def to_yaml(self) -> str:
         """Convert ruleset to YAML string."""
-        return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=False)
+        return yaml.dump(
+            self.to_dict(), Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
     
     def to_json(self) -> str:
-        """Convert ruleset to JSON string."""
+        """Convert ruleset to JSON string.
+        
+        Always encoded by the json module, so the string is the same whether
+        or not orjson is installed.
+        """
         return json.dumps(self.to_dict(), indent=2)
     
     @classmethod
@@ -124,58 +283,119 @@ class Ruleset:
             target_tools=metadata_data.get("target_tools", ["cursor", "copilot"]),
         )
         
-        rules = []
-        for rule_data in data.get("rules", []):
-            rule_item = RulesetItem(
-                name=rule_data["name"],
-                description=rule_data["description"],
-                content=rule_data["content"],
-                tags=rule_data.get("tags", []),
-                priority=rule_data.get("priority", 1),
-                category=rule_data.get("category"),
+        # One comprehension with positional arguments, in RulesetItem field
+        # order, avoids per-rule keyword matching and list appends
+        item = RulesetItem
+        rules = [
+            item(
+                rule_data["name"],
+                rule_data["description"],
+                rule_data["content"],
+                rule_data.get("tags", []),
+                rule_data.get("priority", 1),
+                rule_data.get("category"),
             )
-            rules.append(rule_item)
+            for rule_data in data.get("rules", [])
+        ]
         
         return cls(metadata=metadata, rules=rules)
     
     @classmethod
     def from_yaml(cls, yaml_content: str) -> "Ruleset":
         """Create ruleset from YAML string."""
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
         return cls.from_dict(data)
     
     @classmethod
     def from_json(cls, json_content: str) -> "Ruleset":
         """Create ruleset from JSON string."""
-        data = json.loads(json_content)
+        data = orjson.loads(json_content) if orjson is not None else json.loads(json_content)
         return cls.from_dict(data)
     
     @classmethod
-    def from_file(cls, file_path: Path) -> "Ruleset":
+    def from_file(cls, file_path: Union[str, Path]) -> "Ruleset":
         """Load ruleset from YAML or JSON file."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            
-        if file_path.suffix.lower() in [".yaml", ".yml"]:
-            return cls.from_yaml(content)
-        elif file_path.suffix.lower() == ".json":
-            return cls.from_json(content)
+        suffix = os.path.splitext(file_path)[1]
+        with open(file_path, "rb") as f:
+            if suffix.lower() in RULESET_FILE_SUFFIXES:
+                # The loader pulls the file through in chunks, so it is never held whole
+                data = yaml.load(f, Loader=_YamlLoader)
+            elif suffix.lower() == ".json":
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+            else:
+                raise ValueError(f"Unsupported file format: {suffix}")
+        
+        return cls.from_dict(data)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, suffix: str) -> "Ruleset":
+        """Create ruleset from raw file content, choosing the format by file suffix."""
+        if suffix.lower() in RULESET_FILE_SUFFIXES:
+            return cls.from_dict(yaml.load(data, Loader=_YamlLoader))
+        elif suffix.lower() == ".json":
+            return cls.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
         else:
-            raise ValueError(f"Unsupported file format: {file_path.suffix}")
+            raise ValueError(f"Unsupported file format: {suffix}")
     
     def save_to_file(self, file_path: Path) -> None:
         """Save ruleset to YAML or JSON file."""
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        if file_path.suffix.lower() in [".yaml", ".yml"]:
-            content = self.to_yaml()
+        if file_path.suffix.lower() in RULESET_FILE_SUFFIXES:
+            with open(file_path, "w", encoding="utf-8") as f:
+                # Emit straight into the file instead of building the whole document first
+                yaml.dump(
+                    self.to_dict(), f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+                )
         elif file_path.suffix.lower() == ".json":
-            content = self.to_json()
+            # Through to_json, so the file is the same whether or not orjson is installed
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(self.to_json())
         else:
             raise ValueError(f"Unsupported file format: {file_path.suffix}")
-        
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+
+
+# Bundled rulesets ship inside the package, next to this module
+_STANDARD_RULESETS_PATH = Path(__file__).parent / "rulesets"
+
+
+def _try_load_ruleset(file_path: Path) -> Union[Ruleset, Exception]:
+    """Load a ruleset file, returning the error instead of raising it."""
+    try:
+        return Ruleset.from_file(file_path)
+    except Exception as e:
+        return e
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_ruleset_fields(name: str, description: str, has_categories: bool,
+                             rules: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    """Check the fields validate_ruleset looks at; ``rules`` holds each rule's name and content.
+    
+    Keyed on exactly the values that are checked, so a changed ruleset can
+    never be served a stale result and no version bump is needed.
+    """
+    issues = []
+    
+    # Check metadata
+    if not name:
+        issues.append("Ruleset name is required")
+    if not description:
+        issues.append("Ruleset description is required")
+    if not has_categories:
+        issues.append("At least one category is required")
+    
+    # Check rules
+    if not rules:
+        issues.append("At least one rule is required")
+    
+    for i, (rule_name, rule_content) in enumerate(rules):
+        if not rule_name:
+            issues.append(f"Rule {i+1}: Name is required")
+        if not rule_content:
+            issues.append(f"Rule {i+1}: Content is required")
+    
+    return tuple(issues)
 
 
 class RulesetManager:
@@ -183,7 +403,7 @@ class RulesetManager:
     
     def __init__(self):
         self.rulesets: Dict[str, Ruleset] = {}
-        self.standard_rulesets_path = Path(__file__).parent / "rulesets"
+        self.standard_rulesets_path = _STANDARD_RULESETS_PATH
     
     def add_ruleset(self, ruleset: Ruleset) -> None:
         """Add a ruleset to the manager."""
@@ -197,22 +417,33 @@ class RulesetManager:
         """List all available ruleset names."""
         return list(self.rulesets.keys())
     
-    def load_ruleset_from_file(self, file_path: Path) -> Ruleset:
+    def load_ruleset_from_file(self, file_path: Union[str, Path]) -> Ruleset:
         """Load a ruleset from file and add to manager."""
         ruleset = Ruleset.from_file(file_path)
         self.add_ruleset(ruleset)
         return ruleset
     
+    def load_ruleset_from_bytes(self, file_path: Union[str, Path], data: bytes) -> Ruleset:
+        """Load a ruleset from content already read from ``file_path`` and add to manager."""
+        ruleset = Ruleset.from_bytes(data, os.path.splitext(file_path)[1])
+        self.add_ruleset(ruleset)
+        return ruleset
+    
     def load_standard_rulesets(self) -> None:
         """Load all standard rulesets from the package."""
-        if not self.standard_rulesets_path.exists():
+        try:
+            ruleset_files = tuple(iter_ruleset_files(self.standard_rulesets_path))
+        except FileNotFoundError:
             return
         
-        for ruleset_file in self.standard_rulesets_path.rglob("*.yaml"):
-            try:
-                self.load_ruleset_from_file(ruleset_file)
-            except Exception as e:
-                print(f"Warning: Failed to load ruleset {ruleset_file}: {e}")
+        # Reads and libyaml parses overlap across threads; results are added
+        # here in file order so later files still win on duplicate names
+        with ThreadPoolExecutor(max_workers=min(8, len(ruleset_files) or 1)) as executor:
+            for ruleset_file, loaded in zip(ruleset_files, executor.map(_try_load_ruleset, ruleset_files)):
+                if isinstance(loaded, Exception):
+                    print(f"Warning: Failed to load ruleset {ruleset_file}: {loaded}")
+                else:
+                    self.add_ruleset(loaded)
     
     def get_rulesets_by_category(self, category: str) -> List[Ruleset]:
         """Get all rulesets that contain the specified category."""
@@ -238,24 +469,15 @@ class RulesetManager:
     
     def validate_ruleset(self, ruleset: Ruleset) -> List[str]:
         """Validate a ruleset and return any issues found."""
-        issues = []
-        
-        # Check metadata
-        if not ruleset.metadata.name:
-            issues.append("Ruleset name is required")
-        if not ruleset.metadata.description:
-            issues.append("Ruleset description is required")
-        if not ruleset.metadata.categories:
-            issues.append("At least one category is required")
-        
-        # Check rules
-        if not ruleset.rules:
-            issues.append("At least one rule is required")
-        
-        for i, rule in enumerate(ruleset.rules):
-            if not rule.name:
-                issues.append(f"Rule {i+1}: Name is required")
-            if not rule.content:
-                issues.append(f"Rule {i+1}: Content is required")
-        
-        return issues
\ No newline at end of file
+        metadata = ruleset.metadata
+        fields = (
+            metadata.name,
+            metadata.description,
+            bool(metadata.categories),
+            tuple((rule.name, rule.content) for rule in ruleset.rules),
+        )
+        try:
+            return list(_validate_ruleset_fields(*fields))
+        except TypeError:
+            # Malformed files can load unhashable values; check those uncached
+            return list(_validate_ruleset_fields.__wrapped__(*fields))
\ No newline at end of file
@@ -2,8 +2,20 @@
 Renderers for different AI coding assistants.
 """
 
-from .cursor import CursorRenderer
-from .copilot import CopilotRenderer
-from .generic import GenericRenderer
+import importlib
 
-__all__ = ["CursorRenderer", "CopilotRenderer", "GenericRenderer"]
+__all__ = [
+    "MarkdownRenderer", "CursorRenderer", "CopilotRenderer", "GenericRenderer",
+    "cursor_renderer", "copilot_renderer", "generic_renderer",
+]
+
+
+# Renderers are imported on first access so importing the package does not load jinja2
+_LAZY_MODULES = dict.fromkeys(__all__, ".markdown")
+
+
+def __getattr__(name):
+    """Import renderers on first access."""
+    if name in _LAZY_MODULES:
+        return getattr(importlib.import_module(_LAZY_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,112 @@
+"""
+Direct renderers that build ruleset markdown without going through Jinja.
+
+Each function produces exactly what the matching template in ``_env`` renders,
+using plain string building, so no template is compiled or walked per render.
+"""
+
+from typing import Callable, Dict, List
+
+from ..core import Ruleset, RulesetMetadata
+
+_COPILOT_FOOTER = """
+
+## Usage Instructions
+
+When writing code, please follow these organizational standards:
+
+1. **Code Quality**: Follow the code quality standards defined above
+2. **Naming**: Use descriptive names that follow organizational conventions
+3. **Structure**: Organize code according to the patterns defined
+4. **Testing**: Follow the testing guidelines and patterns
+5. **Documentation**: Include appropriate documentation and comments
+6. **Security**: Adhere to security best practices and guidelines
+
+## Example Prompts
+
+- "Create a new Python class following our organizational standards"
+- "Write unit tests for this function using our testing guidelines"
+- "Refactor this code to follow our code quality standards"
+- "Add error handling following our security guidelines"
+
+Remember to adapt these standards to the specific context and requirements of your project."""
+
+
+def _categories_and_tags(parts: List[str], metadata: RulesetMetadata) -> None:
+    """Append the bulleted category and tag lists shared by the Cursor and Copilot formats."""
+    parts.append(f"## Categories\n{metadata.categories_markdown}\n\n")
+    if metadata.tags:
+        parts.append(f"\n## Tags\n{metadata.tags_markdown}\n")
+    parts.append("\n\n---\n\n")
+
+
+def render_cursor(ruleset: Ruleset) -> str:
+    """Render a Cursor ruleset file (.mdc format)."""
+    metadata = ruleset.metadata
+    parts = [
+        f'---\ndescription: {metadata.description}\nglobs: ["**/*"]\nalwaysApply: true\n---\n\n'
+        f"# {metadata.name}\n\n{metadata.description}\n\n"
+    ]
+    _categories_and_tags(parts, metadata)
+    for rule, block in zip(ruleset.rules, ruleset.rule_blocks()):
+        parts.append("\n## ")
+        parts.append(block)
+        if rule.tags:
+            parts.append(f"\n**Tags:** {rule.tags_joined}\n")
+        parts.append("\n\n---\n\n")
+    return "".join(parts)
+
+
+def render_copilot(ruleset: Ruleset) -> str:
+    """Render a GitHub Copilot instructions file."""
+    metadata = ruleset.metadata
+    parts = [f"# {metadata.name} - GitHub Copilot Instructions\n\n{metadata.description}\n\n"]
+    _categories_and_tags(parts, metadata)
+    parts.append("## Development Standards and Guidelines\n\n")
+    for rule, block in zip(ruleset.rules, ruleset.rule_blocks()):
+        parts.append("\n### ")
+        parts.append(block)
+        if rule.tags:
+            parts.append(f"\n**Related concepts:** {rule.tags_joined}\n")
+        parts.append("\n\n")
+    parts.append(_COPILOT_FOOTER)
+    return "".join(parts)
+
+
+def render_generic(ruleset: Ruleset) -> str:
+    """Render a generic markdown ruleset file."""
+    metadata = ruleset.metadata
+    parts = [
+        f"# {metadata.name}\n\n{metadata.description}\n\n## Metadata\n"
+        f"- **Version:** {metadata.version}\n- **Categories:** {metadata.categories_joined}\n"
+    ]
+    if metadata.tags:
+        parts.append(f"- **Tags:** {metadata.tags_joined}\n")
+    parts.append("\n")
+    if metadata.author:
+        parts.append(f"- **Author:** {metadata.author}\n")
+    parts.append("\n")
+    if metadata.maintainer:
+        parts.append(f"- **Maintainer:** {metadata.maintainer}\n")
+    parts.append("\n")
+    if metadata.license:
+        parts.append(f"- **License:** {metadata.license}\n")
+    parts.append("\n\n---\n\n")
+    for rule, block in zip(ruleset.rules, ruleset.rule_blocks()):
+        parts.append("\n## ")
+        parts.append(block)
+        if rule.tags:
+            parts.append(f"\n**Tags:** {rule.tags_joined}\n")
+        parts.append("\n")
+        if rule.category:
+            parts.append(f"\n**Category:** {rule.category}\n")
+        parts.append("\n\n---\n\n")
+    return "".join(parts)
+
+
+# Direct renderer per template name in the shared Jinja environment
+RENDER_FUNCTIONS: Dict[str, Callable[[Ruleset], str]] = {
+    "cursor": render_cursor,
+    "copilot": render_copilot,
+    "generic": render_generic,
+}
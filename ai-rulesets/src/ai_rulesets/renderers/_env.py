@@ -0,0 +1,181 @@
+"""
+Shared Jinja environment holding the renderer templates.
+"""
+
+import os
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+from .._paths import user_cache_dir
+
+# Compiled template bytecode is kept here between runs; jinja2 checks the
+# source checksum, so edited templates are recompiled automatically
+_BYTECODE_DIR = os.fspath(user_cache_dir("jinja"))
+
+# The environment trims the newline after each block tag, so a tag that ends a
+# line is followed by an empty line wherever the output keeps that newline
+_CURSOR_SRC = """---
+description: {{ metadata.description }}
+globs: ["**/*"]
+alwaysApply: true
+---
+
+# {{ metadata.name }}
+
+{{ metadata.description }}
+
+## Categories
+{{ metadata.categories_markdown }}
+
+{% if metadata.tags %}
+
+## Tags
+{{ metadata.tags_markdown }}
+{% endif %}
+
+
+---
+
+{% for rule in rules %}
+
+## {{ rule.name }}
+
+{{ rule.description }}
+
+{{ rule.content }}
+
+{% if rule.tags %}
+
+**Tags:** {{ rule.tags_joined }}
+{% endif %}
+
+
+---
+
+{% endfor %}
+
+"""
+
+_COPILOT_SRC = """# {{ metadata.name }} - GitHub Copilot Instructions
+
+{{ metadata.description }}
+
+## Categories
+{{ metadata.categories_markdown }}
+
+{% if metadata.tags %}
+
+## Tags
+{{ metadata.tags_markdown }}
+{% endif %}
+
+
+---
+
+## Development Standards and Guidelines
+
+{% for rule in rules %}
+
+### {{ rule.name }}
+
+{{ rule.description }}
+
+{{ rule.content }}
+
+{% if rule.tags %}
+
+**Related concepts:** {{ rule.tags_joined }}
+{% endif %}
+
+
+{% endfor %}
+
+
+## Usage Instructions
+
+When writing code, please follow these organizational standards:
+
+1. **Code Quality**: Follow the code quality standards defined above
+2. **Naming**: Use descriptive names that follow organizational conventions
+3. **Structure**: Organize code according to the patterns defined
+4. **Testing**: Follow the testing guidelines and patterns
+5. **Documentation**: Include appropriate documentation and comments
+6. **Security**: Adhere to security best practices and guidelines
+
+## Example Prompts
+
+- "Create a new Python class following our organizational standards"
+- "Write unit tests for this function using our testing guidelines"
+- "Refactor this code to follow our code quality standards"
+- "Add error handling following our security guidelines"
+
+Remember to adapt these standards to the specific context and requirements of your project.
+"""
+
+_GENERIC_SRC = """# {{ metadata.name }}
+
+{{ metadata.description }}
+
+## Metadata
+- **Version:** {{ metadata.version }}
+- **Categories:** {{ metadata.categories_joined }}
+{% if metadata.tags %}- **Tags:** {{ metadata.tags_joined }}
+{% endif %}
+
+{% if metadata.author %}- **Author:** {{ metadata.author }}
+{% endif %}
+
+{% if metadata.maintainer %}- **Maintainer:** {{ metadata.maintainer }}
+{% endif %}
+
+{% if metadata.license %}- **License:** {{ metadata.license }}
+{% endif %}
+
+
+---
+
+{% for rule in rules %}
+
+## {{ rule.name }}
+
+{{ rule.description }}
+
+{{ rule.content }}
+
+{% if rule.tags %}
+
+**Tags:** {{ rule.tags_joined }}
+{% endif %}
+
+{% if rule.category %}
+
+**Category:** {{ rule.category }}
+{% endif %}
+
+
+---
+
+{% endfor %}
+
+"""
+
+
+def _bytecode_cache():
+    """Return the on-disk bytecode cache, or None if its directory cannot be created."""
+    try:
+        os.makedirs(_BYTECODE_DIR, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory=_BYTECODE_DIR)
+
+
+# Built once at import; every renderer fetches its compiled template from here
+ENV = Environment(
+    loader=DictLoader({"cursor": _CURSOR_SRC, "copilot": _COPILOT_SRC, "generic": _GENERIC_SRC}),
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=False,
+    bytecode_cache=_bytecode_cache(),
+)
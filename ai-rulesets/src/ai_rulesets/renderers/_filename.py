@@ -0,0 +1,28 @@
+"""
+Filename helpers shared by the renderers.
+"""
+
+import re
+
+_SANITIZE_STRIP = re.compile(r'[^\w\s-]')
+_SANITIZE_DASH = re.compile(r'[-\s]+')
+_SANITIZE_COLLAPSE = re.compile(r'-{2,}')
+
+# ASCII table for the same rules: word characters and hyphens are kept,
+# whitespace becomes a hyphen and everything else is dropped
+_SANITIZE_TABLE = str.maketrans({
+    c: (c if c.isalnum() or c in "_-" else "-" if c.isspace() else None)
+    for c in map(chr, range(128))
+})
+
+
+def sanitize_filename(name: str) -> str:
+    """Sanitize a name for use as a filename."""
+    # Replace spaces and special characters with hyphens
+    name = name.lower()
+    if name.isascii():
+        sanitized = _SANITIZE_COLLAPSE.sub('-', name.translate(_SANITIZE_TABLE))
+    else:
+        sanitized = _SANITIZE_STRIP.sub('', name)
+        sanitized = _SANITIZE_DASH.sub('-', sanitized)
+    return sanitized.strip('-')
@@ -0,0 +1,74 @@
+"""
+File output helpers shared by the renderers.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Tuple
+
+# Small markdown writes spend most of their time in open/close, which release the GIL
+_MAX_WRITERS = 8
+
+# open() in text mode also stats, probes for a terminal and seeks; on POSIX the
+# bulk path writes with bare open/write/close calls instead
+_RAW_WRITES = os.name == "posix"
+_RAW_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def _unchanged(path: Path, data: bytes) -> bool:
+    """Return True if ``path`` already holds exactly ``data``.
+    
+    Files of a different size are told apart by a stat alone; only a file
+    of the same size is read back and compared.
+    """
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def write_text(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` as UTF-8 in a single call.
+    
+    A file that already has this content is left alone, so regenerating
+    unchanged rulesets does not touch their modification times.
+    """
+    if _unchanged(path, text.encode("utf-8")):
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _write_raw(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` as UTF-8 with one open, write and close system call each.
+    
+    Like write_text, a file that already has this content is left alone.
+    """
+    data = text.encode("utf-8")
+    if _unchanged(path, data):
+        return
+    data = memoryview(data)
+    fd = os.open(path, _RAW_FLAGS, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def write_many(outputs: Iterable[Tuple[Path, str]]) -> None:
+    """Write each ``(path, text)`` pair, overlapping the writes on a small thread pool."""
+    outputs = list(outputs)
+    write = _write_raw if _RAW_WRITES else write_text
+    if len(outputs) < 2:
+        for path, text in outputs:
+            write(path, text)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(_MAX_WRITERS, len(outputs))) as executor:
+        # list() re-raises the first write error, as a sequential loop would
+        list(executor.map(lambda output: write(*output), outputs))
@@ -0,0 +1,169 @@
+"""
+Markdown ruleset renderers for organizational AI standards.
+"""
+
+import functools
+import os
+import threading
+from typing import Dict, List, Optional, Set, TextIO, Tuple
+from pathlib import Path
+
+from ..core import Ruleset
+from ._direct import RENDER_FUNCTIONS
+from ._filename import sanitize_filename
+from ._io import write_many, write_text
+
+# Rendered rulesets kept per renderer; the oldest entry is dropped past this
+_RENDER_CACHE_SIZE = 128
+
+# Set to 1 to render through the Jinja templates instead of the direct renderers,
+# e.g. to check that both produce the same files
+_USE_JINJA = os.environ.get("AI_RULESETS_JINJA_RENDERING") == "1"
+
+
+class MarkdownRenderer:
+    """Renders ruleset files in one of the shared template formats.
+    
+    Format subclasses only set ``template_name`` and ``suffix``; every
+    renderer shares the rendering and file output code below.
+    """
+    
+    template_name: str = ""
+    suffix: str = ""
+    
+    def __init__(self, template_name: Optional[str] = None, suffix: Optional[str] = None,
+                 use_jinja: Optional[bool] = None):
+        """Initialize renderer, overriding the class template name and output file suffix if given.
+        
+        Rulesets are rendered by plain string building unless ``use_jinja`` is
+        true, or it is None and AI_RULESETS_JINJA_RENDERING=1 is set.
+        """
+        if template_name is not None:
+            self.template_name = template_name
+        if suffix is not None:
+            self.suffix = suffix
+        self.use_jinja = _USE_JINJA if use_jinja is None else use_jinja
+        self._render_direct = RENDER_FUNCTIONS[self.template_name]
+        # id(ruleset) -> (ruleset, fingerprint, rendered text)
+        self._cache: Dict[int, Tuple[Ruleset, tuple, str]] = {}
+        # Shared renderers are used from several threads; guards cache eviction
+        self._cache_lock = threading.Lock()
+        # Output directories this renderer has already created
+        self._created_dirs: Set[Path] = set()
+    
+    @functools.cached_property
+    def template(self):
+        """Compiled Jinja template, loaded only when something asks for it."""
+        from ._env import ENV
+        return ENV.get_template(self.template_name)
+    
+    def render_ruleset(self, ruleset: Ruleset) -> str:
+        """Render ruleset content from a ruleset.
+        
+        Output for a ruleset that was rendered before, and whose metadata
+        values and rules are unchanged since, is returned from the cache
+        instead of being rendered again.
+        """
+        fingerprint = self._fingerprint(ruleset)
+        cached = self._cache.get(id(ruleset))
+        if cached is not None and cached[0] is ruleset and cached[1] == fingerprint:
+            return cached[2]
+        
+        if self.use_jinja:
+            text = self.template.render(metadata=ruleset.metadata, rules=ruleset.rules)
+        else:
+            text = self._render_direct(ruleset)
+        
+        with self._cache_lock:
+            if len(self._cache) >= _RENDER_CACHE_SIZE:
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[id(ruleset)] = (ruleset, fingerprint, text)
+        return text
+    
+    def render_to_stream(self, ruleset: Ruleset, stream: TextIO) -> None:
+        """Render ruleset content into a text stream."""
+        stream.write(self.render_ruleset(ruleset))
+    
+    @staticmethod
+    def _fingerprint(ruleset: Ruleset) -> tuple:
+        """Snapshot of everything a render reads from ``ruleset``.
+        
+        Metadata lists are copied to tuples and the rules are kept as a tuple,
+        so edits made in place, such as an appended category or a rule
+        assigned into the list, no longer compare equal. Unchanged rules are
+        the same objects, so comparing them is an identity check per rule.
+        """
+        metadata_values = tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in vars(ruleset.metadata).values()
+        )
+        return (metadata_values, tuple(ruleset.rules))
+    
+    def _ensure_dir(self, directory: Path, force: bool = False) -> None:
+        """Create ``directory`` unless this renderer already did."""
+        if force or directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def render_file(self, ruleset: Ruleset, output_path: Path) -> None:
+        """Render and save a ruleset file."""
+        # Ensure output directory exists
+        self._ensure_dir(output_path.parent)
+        
+        # Rendered files are small, so one write beats streaming chunk by chunk
+        text = self.render_ruleset(ruleset)
+        try:
+            write_text(output_path, text)
+        except FileNotFoundError:
+            # The directory was removed since this renderer created it
+            self._ensure_dir(output_path.parent, force=True)
+            write_text(output_path, text)
+    
+    def render_multiple(self, rulesets: List[Ruleset], output_dir: Path) -> None:
+        """Render multiple ruleset files."""
+        # Create filenames from ruleset names; every file goes in output_dir
+        outputs = [
+            (output_dir / (sanitize_filename(ruleset.metadata.name) + self.suffix), self.render_ruleset(ruleset))
+            for ruleset in rulesets
+        ]
+        if not outputs:
+            return
+        
+        self._ensure_dir(output_dir)
+        try:
+            write_many(outputs)
+        except FileNotFoundError:
+            # The directory was removed since this renderer created it
+            self._ensure_dir(output_dir, force=True)
+            write_many(outputs)
+    
+    # Kept as a method for callers that used it before it was shared
+    _sanitize_filename = staticmethod(sanitize_filename)
+
+
+class CursorRenderer(MarkdownRenderer):
+    """Renders Cursor-compatible ruleset files (.mdc format)."""
+    
+    template_name = "cursor"
+    suffix = ".mdc"
+
+
+class CopilotRenderer(MarkdownRenderer):
+    """Renders GitHub Copilot-compatible ruleset files (.md format)."""
+    
+    template_name = "copilot"
+    suffix = ".instructions.md"
+
+
+class GenericRenderer(MarkdownRenderer):
+    """Renders generic markdown ruleset files."""
+    
+    template_name = "generic"
+    suffix = ".md"
+
+
+# One instance per format is shared; a renderer's only state is its render cache
+# and the directories it created, both safe to use from several threads
+cursor_renderer = CursorRenderer()
+copilot_renderer = CopilotRenderer()
+generic_renderer = GenericRenderer()
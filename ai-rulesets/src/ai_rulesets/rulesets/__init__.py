@@ -21,13 +21,29 @@ from .ci_cd import CICDDomain
 from .security import SecurityDomain
 from .testing import TestingDomain
 
-# Domain-level imports
-python = PythonDomain()
-typescript = TypeScriptDomain()
-documentation = DocumentationDomain()
-ci_cd = CICDDomain()
-security = SecurityDomain()
-testing = TestingDomain()
+# Convenience domains, built on first access so importing the package stays cheap.
+# Importing the submodules above bound their names here; drop those bindings
+# so lookups reach __getattr__.
+_FACTORIES = {
+    "python": PythonDomain,
+    "typescript": TypeScriptDomain,
+    "documentation": DocumentationDomain,
+    "ci_cd": CICDDomain,
+    "security": SecurityDomain,
+    "testing": TestingDomain,
+}
+for _name in _FACTORIES:
+    globals().pop(_name, None)
+del _name
+
+
+def __getattr__(name):
+    """Build a convenience domain on first access and keep it for later lookups."""
+    if name not in _FACTORIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    instance = globals()[name] = _FACTORIES[name]()
+    return instance
+
 
 __all__ = [
     "python",
@@ -5,6 +5,8 @@ This module provides CI/CD guidelines including GitHub Actions, deployment,
 and infrastructure patterns.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .github_actions import GitHubActionsRuleset
 from .deployment import DeploymentRuleset
 
@@ -17,9 +19,15 @@ class CICDDomain:
         self.deployment = DeploymentRuleset()
     
     def apply_all(self, output_dir: str = ".cursor/rules"):
-        """Apply all CI/CD rulesets to the specified output directory."""
-        self.github_actions.apply(output_dir)
-        self.deployment.apply(output_dir)
+        """Apply all CI/CD rulesets to the specified output directory.
+        
+        Each ruleset writes its own file, so they are rendered and written
+        concurrently.
+        """
+        rulesets = (self.github_actions, self.deployment)
+        with ThreadPoolExecutor(max_workers=len(rulesets)) as executor:
+            # list() re-raises the first error, as applying them in turn would
+            list(executor.map(lambda ruleset: ruleset.apply(output_dir), rulesets))
     
     def list_rulesets(self):
         """List all available CI/CD rulesets."""
@@ -29,9 +37,25 @@ class CICDDomain:
         }
 
 
-# Convenience imports
-github_actions = GitHubActionsRuleset()
-deployment = DeploymentRuleset()
+# Convenience instances, built on first access so importing the package stays cheap.
+# Importing the submodules above bound their names here; drop those bindings
+# so lookups reach __getattr__.
+_FACTORIES = {
+    "github_actions": GitHubActionsRuleset,
+    "deployment": DeploymentRuleset,
+}
+for _name in _FACTORIES:
+    globals().pop(_name, None)
+del _name
+
+
+def __getattr__(name):
+    """Build a convenience instance on first access and keep it for later lookups."""
+    if name not in _FACTORIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    instance = globals()[name] = _FACTORIES[name]()
+    return instance
+
 
 __all__ = [
     "CICDDomain",
@@ -5,6 +5,8 @@ This module provides documentation guidelines including style, structure,
 and content standards.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .style import StyleRuleset
 from .structure import StructureRuleset
 
@@ -17,9 +19,15 @@ class DocumentationDomain:
         self.structure = StructureRuleset()
     
     def apply_all(self, output_dir: str = ".cursor/rules"):
-        """Apply all documentation rulesets to the specified output directory."""
-        self.style.apply(output_dir)
-        self.structure.apply(output_dir)
+        """Apply all documentation rulesets to the specified output directory.
+        
+        Each ruleset writes its own file, so they are rendered and written
+        concurrently.
+        """
+        rulesets = (self.style, self.structure)
+        with ThreadPoolExecutor(max_workers=len(rulesets)) as executor:
+            # list() re-raises the first error, as applying them in turn would
+            list(executor.map(lambda ruleset: ruleset.apply(output_dir), rulesets))
     
     def list_rulesets(self):
         """List all available documentation rulesets."""
@@ -29,9 +37,25 @@ class DocumentationDomain:
         }
 
 
-# Convenience imports
-style = StyleRuleset()
-structure = StructureRuleset()
+# Convenience instances, built on first access so importing the package stays cheap.
+# Importing the submodules above bound their names here; drop those bindings
+# so lookups reach __getattr__.
+_FACTORIES = {
+    "style": StyleRuleset,
+    "structure": StructureRuleset,
+}
+for _name in _FACTORIES:
+    globals().pop(_name, None)
+del _name
+
+
+def __getattr__(name):
+    """Build a convenience instance on first access and keep it for later lookups."""
+    if name not in _FACTORIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    instance = globals()[name] = _FACTORIES[name]()
+    return instance
+
 
 __all__ = [
     "DocumentationDomain",
@@ -3,36 +3,15 @@ Documentation structure standards ruleset.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from ...core import Ruleset, RulesetMetadata, RulesetItem
-from ...renderers import CursorRenderer, CopilotRenderer
+from ...renderers import cursor_renderer, copilot_renderer
 
+# Shared renderer per supported output format
+_RENDERERS = {"cursor": cursor_renderer, "copilot": copilot_renderer}
 
-class StructureRuleset:
-    """Documentation structure standards ruleset."""
-    
-    def __init__(self):
-        self.metadata = RulesetMetadata(
-            name="Documentation Structure Standards",
-            version="1.0.0",
-            description="Organizational documentation structure guidelines and best practices",
-            categories=["documentation", "structure"],
-            tags=["documentation", "structure", "organization", "navigation"],
-            author="Dan Holman",
-            maintainer="engineering@company.com"
-        )
-        
-        self.ruleset = Ruleset(metadata=self.metadata)
-        self._load_rules()
-    
-    def _load_rules(self):
-        """Load documentation structure rules."""
-        
-        # File organization rule
-        self.ruleset.add_rule(RulesetItem(
-            name="File Organization",
-            description="Documentation file organization standards",
-            content="""# Use consistent file naming conventions
+# Rule bodies live at module level so every StructureRuleset shares the same string objects
+_FILE_ORGANIZATION_CONTENT = """# Use consistent file naming conventions
 # Organize documentation by topic and audience
 # Use README.md for project overview
 # Use docs/ directory for detailed documentation
@@ -50,17 +29,9 @@ project/
 │   ├── basic-usage.py
 │   └── advanced-features.py
 └── tests/                 # Test documentation
-    └── README.md""",
-            tags=["organization", "files", "structure"],
-            priority=1,
-            category="organization"
-        ))
-        
-        # Content structure rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Content Structure",
-            description="Documentation content structure guidelines",
-            content="""# Start with an overview and purpose
+    └── README.md"""
+
+_CONTENT_STRUCTURE_CONTENT = """# Start with an overview and purpose
 # Include installation and setup instructions
 # Provide usage examples and tutorials
 # Document all public APIs
@@ -76,17 +47,9 @@ project/
 # 6. API Documentation
 # 7. Contributing
 # 8. License
-# 9. Changelog""",
-            tags=["content", "structure", "readme"],
-            priority=1,
-            category="content"
-        ))
-        
-        # Navigation rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Navigation",
-            description="Documentation navigation and linking standards",
-            content="""# Use consistent navigation patterns
+# 9. Changelog"""
+
+_NAVIGATION_CONTENT = """# Use consistent navigation patterns
 # Include table of contents for long documents
 # Use cross-references between related documents
 # Provide breadcrumb navigation
@@ -100,8 +63,60 @@ project/
 #   - [Basic Usage](#basic-usage)
 #   - [Advanced Usage](#advanced-usage)
 # - [API Reference](#api-reference)
-# - [Contributing](#contributing)""",
-            tags=["navigation", "links", "toc"],
+# - [Contributing](#contributing)"""
+
+
+class StructureRuleset:
+    """Documentation structure standards ruleset."""
+    
+    # Shared renderer and output filename per supported format
+    _FORMATS = {fmt: (renderer, f"documentation-structure-standards{renderer.suffix}") for fmt, renderer in _RENDERERS.items()}
+    
+    # Built once and shared by every instance
+    metadata = RulesetMetadata(
+        name="Documentation Structure Standards",
+        version="1.0.0",
+        description="Organizational documentation structure guidelines and best practices",
+        categories=["documentation", "structure"],
+        tags=["documentation", "structure", "organization", "navigation"],
+        author="Dan Holman",
+        maintainer="engineering@company.com"
+    )
+    
+    def __init__(self):
+        self.ruleset = Ruleset(metadata=self.metadata)
+        self._load_rules()
+        self.ruleset.freeze()
+    
+    def _load_rules(self):
+        """Load documentation structure rules."""
+        
+        # File organization rule
+        self.ruleset.add_rule(RulesetItem(
+            name="File Organization",
+            description="Documentation file organization standards",
+            content=_FILE_ORGANIZATION_CONTENT,
+            tags=("organization", "files", "structure"),
+            priority=1,
+            category="organization"
+        ))
+        
+        # Content structure rule
+        self.ruleset.add_rule(RulesetItem(
+            name="Content Structure",
+            description="Documentation content structure guidelines",
+            content=_CONTENT_STRUCTURE_CONTENT,
+            tags=("content", "structure", "readme"),
+            priority=1,
+            category="content"
+        ))
+        
+        # Navigation rule
+        self.ruleset.add_rule(RulesetItem(
+            name="Navigation",
+            description="Documentation navigation and linking standards",
+            content=_NAVIGATION_CONTENT,
+            tags=("navigation", "links", "toc"),
             priority=2,
             category="navigation"
         ))
@@ -110,18 +125,24 @@ project/
         """Apply the structure ruleset to the specified output directory."""
         output_path = Path(output_dir)
         
-        if format == "cursor":
-            renderer = CursorRenderer()
-            filename = "documentation-structure-standards.mdc"
-        elif format == "copilot":
-            renderer = CopilotRenderer()
-            filename = "documentation-structure-standards.instructions.md"
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        try:
+            renderer, filename = self._FORMATS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}") from None
         
         output_file = output_path / filename
         renderer.render_file(self.ruleset, output_file)
     
+    def apply_all(self, output_dir: str = ".cursor/rules", formats: Iterable[str] = ("cursor", "copilot")):
+        """Apply the structure ruleset in each of ``formats``; the rendered rule blocks are shared between them."""
+        formats = tuple(formats)
+        for format in formats:
+            if format not in self._FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
+        
+        for format in formats:
+            self.apply(output_dir, format)
+    
     def get_rules(self):
         """Get all rules in this ruleset."""
         return self.ruleset.rules
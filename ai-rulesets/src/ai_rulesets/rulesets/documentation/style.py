@@ -3,51 +3,22 @@ Documentation style standards ruleset.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from ...core import Ruleset, RulesetMetadata, RulesetItem
-from ...renderers import CursorRenderer, CopilotRenderer
+from ...renderers import cursor_renderer, copilot_renderer
 
+# Shared renderer per supported output format
+_RENDERERS = {"cursor": cursor_renderer, "copilot": copilot_renderer}
 
-class StyleRuleset:
-    """Documentation style standards ruleset."""
-    
-    def __init__(self):
-        self.metadata = RulesetMetadata(
-            name="Documentation Style Standards",
-            version="1.0.0",
-            description="Organizational documentation style guidelines and best practices",
-            categories=["documentation", "style"],
-            tags=["documentation", "style", "markdown", "writing"],
-            author="Dan Holman",
-            maintainer="engineering@company.com"
-        )
-        
-        self.ruleset = Ruleset(metadata=self.metadata)
-        self._load_rules()
-    
-    def _load_rules(self):
-        """Load documentation style rules."""
-        
-        # Writing style rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Writing Style",
-            description="Documentation writing style guidelines",
-            content="""# Use clear, concise language
+# Rule bodies live at module level so every StyleRuleset shares the same string objects
+_WRITING_STYLE_CONTENT = """# Use clear, concise language
 # Write in active voice when possible
 # Use present tense for current functionality
 # Use future tense for planned features
 # Be consistent with terminology
-# Use proper grammar and spelling""",
-            tags=["writing", "style", "clarity"],
-            priority=1,
-            category="writing"
-        ))
-        
-        # Markdown formatting rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Markdown Formatting",
-            description="Markdown formatting standards",
-            content="""# Use consistent heading hierarchy (H1, H2, H3)
+# Use proper grammar and spelling"""
+
+_MARKDOWN_FORMATTING_CONTENT = """# Use consistent heading hierarchy (H1, H2, H3)
 # Use proper code block formatting with language specification
 # Use bullet points for lists
 # Use tables for structured data
@@ -62,17 +33,9 @@ def example_function():
 
 | Column 1 | Column 2 |
 |----------|----------|
-| Data 1   | Data 2   |""",
-            tags=["markdown", "formatting", "structure"],
-            priority=1,
-            category="formatting"
-        ))
-        
-        # Code documentation rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Code Documentation",
-            description="Code documentation standards",
-            content="""# Document all public APIs
+| Data 1   | Data 2   |"""
+
+_CODE_DOCUMENTATION_CONTENT = """# Document all public APIs
 # Use docstrings for functions and classes
 # Include parameter descriptions and return types
 # Provide usage examples
@@ -97,8 +60,60 @@ def calculate_total(items: List[Item], tax_rate: float) -> float:
         raise ValueError("Tax rate cannot be negative")
     
     subtotal = sum(item.price for item in items)
-    return subtotal * (1 + tax_rate)""",
-            tags=["docstrings", "api", "documentation"],
+    return subtotal * (1 + tax_rate)"""
+
+
+class StyleRuleset:
+    """Documentation style standards ruleset."""
+    
+    # Shared renderer and output filename per supported format
+    _FORMATS = {fmt: (renderer, f"documentation-style-standards{renderer.suffix}") for fmt, renderer in _RENDERERS.items()}
+    
+    # Built once and shared by every instance
+    metadata = RulesetMetadata(
+        name="Documentation Style Standards",
+        version="1.0.0",
+        description="Organizational documentation style guidelines and best practices",
+        categories=["documentation", "style"],
+        tags=["documentation", "style", "markdown", "writing"],
+        author="Dan Holman",
+        maintainer="engineering@company.com"
+    )
+    
+    def __init__(self):
+        self.ruleset = Ruleset(metadata=self.metadata)
+        self._load_rules()
+        self.ruleset.freeze()
+    
+    def _load_rules(self):
+        """Load documentation style rules."""
+        
+        # Writing style rule
+        self.ruleset.add_rule(RulesetItem(
+            name="Writing Style",
+            description="Documentation writing style guidelines",
+            content=_WRITING_STYLE_CONTENT,
+            tags=("writing", "style", "clarity"),
+            priority=1,
+            category="writing"
+        ))
+        
+        # Markdown formatting rule
+        self.ruleset.add_rule(RulesetItem(
+            name="Markdown Formatting",
+            description="Markdown formatting standards",
+            content=_MARKDOWN_FORMATTING_CONTENT,
+            tags=("markdown", "formatting", "structure"),
+            priority=1,
+            category="formatting"
+        ))
+        
+        # Code documentation rule
+        self.ruleset.add_rule(RulesetItem(
+            name="Code Documentation",
+            description="Code documentation standards",
+            content=_CODE_DOCUMENTATION_CONTENT,
+            tags=("docstrings", "api", "documentation"),
             priority=2,
             category="code-docs"
         ))
@@ -107,18 +122,24 @@ def calculate_total(items: List[Item], tax_rate: float) -> float:
         """Apply the style ruleset to the specified output directory."""
         output_path = Path(output_dir)
         
-        if format == "cursor":
-            renderer = CursorRenderer()
-            filename = "documentation-style-standards.mdc"
-        elif format == "copilot":
-            renderer = CopilotRenderer()
-            filename = "documentation-style-standards.instructions.md"
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        try:
+            renderer, filename = self._FORMATS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}") from None
         
         output_file = output_path / filename
         renderer.render_file(self.ruleset, output_file)
     
+    def apply_all(self, output_dir: str = ".cursor/rules", formats: Iterable[str] = ("cursor", "copilot")):
+        """Apply the style ruleset in each of ``formats``; the rendered rule blocks are shared between them."""
+        formats = tuple(formats)
+        for format in formats:
+            if format not in self._FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
+        
+        for format in formats:
+            self.apply(output_dir, format)
+    
     def get_rules(self):
         """Get all rules in this ruleset."""
         return self.ruleset.rules
@@ -5,6 +5,8 @@ This module provides rulesets for Python development including coding standards,
 testing guidelines, and security practices.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .coding import CodingRuleset
 from .testing import TestingRuleset
 from .security import SecurityRuleset
@@ -19,10 +21,15 @@ class PythonDomain:
         self.security = SecurityRuleset()
     
     def apply_all(self, output_dir: str = ".cursor/rules"):
-        """Apply all Python rulesets to the specified output directory."""
-        self.coding.apply(output_dir)
-        self.testing.apply(output_dir)
-        self.security.apply(output_dir)
+        """Apply all Python rulesets to the specified output directory.
+        
+        Each ruleset writes its own file, so they are rendered and written
+        concurrently.
+        """
+        rulesets = (self.coding, self.testing, self.security)
+        with ThreadPoolExecutor(max_workers=len(rulesets)) as executor:
+            # list() re-raises the first error, as applying them in turn would
+            list(executor.map(lambda ruleset: ruleset.apply(output_dir), rulesets))
     
     def list_rulesets(self):
         """List all available Python rulesets."""
@@ -33,10 +40,26 @@ class PythonDomain:
         }
 
 
-# Convenience imports
-coding = CodingRuleset()
-testing = TestingRuleset()
-security = SecurityRuleset()
+# Convenience instances, built on first access so importing the package stays cheap.
+# Importing the submodules above bound their names here; drop those bindings
+# so lookups reach __getattr__.
+_FACTORIES = {
+    "coding": CodingRuleset,
+    "testing": TestingRuleset,
+    "security": SecurityRuleset,
+}
+for _name in _FACTORIES:
+    globals().pop(_name, None)
+del _name
+
+
+def __getattr__(name):
+    """Build a convenience instance on first access and keep it for later lookups."""
+    if name not in _FACTORIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    instance = globals()[name] = _FACTORIES[name]()
+    return instance
+
 
 __all__ = [
     "PythonDomain",
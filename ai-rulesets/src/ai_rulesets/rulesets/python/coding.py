@@ -6,15 +6,21 @@ organizational Python coding standards.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from ai_rulesets.core import Ruleset, RulesetMetadata, RulesetItem
-from ai_rulesets.renderers import CursorRenderer, CopilotRenderer
+from ai_rulesets.renderers import cursor_renderer, copilot_renderer
 from ai_rulesets.sources.processor import SourceProcessor
 
+# Shared renderer per supported output format
+_RENDERERS = {"cursor": cursor_renderer, "copilot": copilot_renderer}
+
 
 class CodingRuleset:
     """Python coding standards ruleset."""
     
+    # Shared renderer and output filename per supported format
+    _FORMATS = {fmt: (renderer, f"python-coding-standards{renderer.suffix}") for fmt, renderer in _RENDERERS.items()}
+    
     def __init__(self):
         self.sources_dir = Path(__file__).parent.parent.parent / "sources"
         self.processor = SourceProcessor(self.sources_dir)
@@ -31,18 +37,24 @@ class CodingRuleset:
         """Apply the coding ruleset to the specified output directory."""
         output_path = Path(output_dir)
         
-        if format == "cursor":
-            renderer = CursorRenderer()
-            filename = "python-coding-standards.mdc"
-        elif format == "copilot":
-            renderer = CopilotRenderer()
-            filename = "python-coding-standards.instructions.md"
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        try:
+            renderer, filename = self._FORMATS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}") from None
         
         output_file = output_path / filename
         renderer.render_file(self.ruleset, output_file)
     
+    def apply_all(self, output_dir: str = ".cursor/rules", formats: Iterable[str] = ("cursor", "copilot")):
+        """Apply the coding ruleset in each of ``formats``; the rendered rule blocks are shared between them."""
+        formats = tuple(formats)
+        for format in formats:
+            if format not in self._FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
+        
+        for format in formats:
+            self.apply(output_dir, format)
+    
     def get_rules(self):
         """Get all rules in this ruleset."""
         return self.ruleset.rules
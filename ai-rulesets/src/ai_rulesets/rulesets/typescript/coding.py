@@ -2,52 +2,36 @@
 TypeScript coding standards ruleset.
 """
 
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from ...core import Ruleset, RulesetMetadata, RulesetItem
-from ...renderers import CursorRenderer, CopilotRenderer
+from ...renderers import cursor_renderer, copilot_renderer
 
+# Shared renderer per supported output format
+_RENDERERS = {"cursor": cursor_renderer, "copilot": copilot_renderer}
 
-class CodingRuleset:
-    """TypeScript coding standards ruleset."""
-    
-    def __init__(self):
-        self.metadata = RulesetMetadata(
-            name="TypeScript Coding Standards",
-            version="1.0.0",
-            description="Organizational TypeScript coding standards and best practices",
-            categories=["development", "typescript", "coding"],
-            tags=["typescript", "coding", "eslint", "prettier", "es6"],
-            author="Dan Holman",
-            maintainer="engineering@company.com"
-        )
-        
-        self.ruleset = Ruleset(metadata=self.metadata)
-        self._load_rules()
-    
-    def _load_rules(self):
-        """Load coding standards rules."""
-        
-        # Code style rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Code Style",
-            description="TypeScript code style guidelines",
-            content="""# Use ESLint and Prettier for code formatting
+# Rule definitions, turned into RulesetItems the first time ``ruleset`` is used
+_CODING_RULES = (
+    # Code style rule
+    {
+        "name": "Code Style",
+        "description": "TypeScript code style guidelines",
+        "content": """# Use ESLint and Prettier for code formatting
 # Follow Airbnb TypeScript style guide
 # Use strict type checking and strict mode
 # Leverage modern ES6+ features: arrow functions, destructuring, template literals
 # Use meaningful variable and function names
 # Implement proper interfaces and type definitions""",
-            tags=["style", "formatting", "eslint"],
-            priority=1,
-            category="code-quality"
-        ))
-        
-        # Type safety rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Type Safety",
-            description="TypeScript type safety best practices",
-            content="""# Use strict type checking
+        "tags": ("style", "formatting", "eslint"),
+        "priority": 1,
+        "category": "code-quality",
+    },
+    # Type safety rule
+    {
+        "name": "Type Safety",
+        "description": "TypeScript type safety best practices",
+        "content": """# Use strict type checking
 # Define interfaces for object shapes
 # Use union types and type guards
 # Leverage generics for reusable components
@@ -69,16 +53,15 @@ class Success<T> {
 class Error<E> {
   constructor(public error: E) {}
 }""",
-            tags=["types", "interfaces", "generics"],
-            priority=1,
-            category="type-safety"
-        ))
-        
-        # Modern ES6+ rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Modern ES6+",
-            description="Modern JavaScript/TypeScript patterns",
-            content="""# Use const for immutable values, let for mutable values
+        "tags": ("types", "interfaces", "generics"),
+        "priority": 1,
+        "category": "type-safety",
+    },
+    # Modern ES6+ rule
+    {
+        "name": "Modern ES6+",
+        "description": "Modern JavaScript/TypeScript patterns",
+        "content": """# Use const for immutable values, let for mutable values
 # Prefer arrow functions for short functions
 # Use template literals for string interpolation
 # Implement proper destructuring for objects and arrays
@@ -103,27 +86,65 @@ async function fetchUser(id: number): Promise<User> {
   const response = await fetch(`/api/users/${id}`);
   return response.json();
 }""",
-            tags=["es6", "modern", "async"],
-            priority=2,
-            category="modern-patterns"
-        ))
+        "tags": ("es6", "modern", "async"),
+        "priority": 2,
+        "category": "modern-patterns",
+    },
+)
+
+
+class CodingRuleset:
+    """TypeScript coding standards ruleset."""
+    
+    # Shared renderer and output filename per supported format
+    _FORMATS = {fmt: (renderer, f"typescript-coding-standards{renderer.suffix}") for fmt, renderer in _RENDERERS.items()}
+    
+    def __init__(self):
+        # Built per instance, so the categories and tags lists are never shared
+        self.metadata = RulesetMetadata(
+            name="TypeScript Coding Standards",
+            version="1.0.0",
+            description="Organizational TypeScript coding standards and best practices",
+            categories=["development", "typescript", "coding"],
+            tags=["typescript", "coding", "eslint", "prettier", "es6"],
+            author="Dan Holman",
+            maintainer="engineering@company.com"
+        )
+    
+    @cached_property
+    def ruleset(self) -> Ruleset:
+        """The ruleset, built from ``_CODING_RULES`` on first access.
+        
+        Each instance gets its own ruleset, so rules can still be added to it;
+        repeat renders of an unchanged ruleset come from the renderers' cache.
+        """
+        ruleset = Ruleset(metadata=self.metadata)
+        for spec in _CODING_RULES:
+            ruleset.add_rule(RulesetItem(**spec))
+        return ruleset
     
     def apply(self, output_dir: str = ".cursor/rules", format: str = "cursor"):
         """Apply the coding ruleset to the specified output directory."""
         output_path = Path(output_dir)
         
-        if format == "cursor":
-            renderer = CursorRenderer()
-            filename = "typescript-coding-standards.mdc"
-        elif format == "copilot":
-            renderer = CopilotRenderer()
-            filename = "typescript-coding-standards.instructions.md"
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        try:
+            renderer, filename = self._FORMATS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}") from None
         
         output_file = output_path / filename
         renderer.render_file(self.ruleset, output_file)
     
+    def apply_all(self, output_dir: str = ".cursor/rules", formats: Iterable[str] = ("cursor", "copilot")):
+        """Apply the coding ruleset in each of ``formats``; the rendered rule blocks are shared between them."""
+        formats = tuple(formats)
+        for format in formats:
+            if format not in self._FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
+        
+        for format in formats:
+            self.apply(output_dir, format)
+    
     def get_rules(self):
         """Get all rules in this ruleset."""
         return self.ruleset.rules
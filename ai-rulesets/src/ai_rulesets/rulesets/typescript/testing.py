@@ -2,37 +2,22 @@
 TypeScript testing standards ruleset.
 """
 
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from ...core import Ruleset, RulesetMetadata, RulesetItem
-from ...renderers import CursorRenderer, CopilotRenderer
+from ...renderers import cursor_renderer, copilot_renderer
 
+# Shared renderer per supported output format
+_RENDERERS = {"cursor": cursor_renderer, "copilot": copilot_renderer}
 
-class TestingRuleset:
-    """TypeScript testing standards ruleset."""
-    
-    def __init__(self):
-        self.metadata = RulesetMetadata(
-            name="TypeScript Testing Standards",
-            version="1.0.0",
-            description="Organizational TypeScript testing guidelines and best practices",
-            categories=["development", "typescript", "testing"],
-            tags=["typescript", "testing", "jest", "coverage", "mocking"],
-            author="Dan Holman",
-            maintainer="engineering@company.com"
-        )
-        
-        self.ruleset = Ruleset(metadata=self.metadata)
-        self._load_rules()
-    
-    def _load_rules(self):
-        """Load testing standards rules."""
-        
-        # Jest testing rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Jest Testing",
-            description="Jest testing framework best practices",
-            content="""# Use Jest for all testing
+# Rule definitions, turned into RulesetItems the first time ``ruleset`` is used
+_TESTING_RULES = (
+    # Jest testing rule
+    {
+        "name": "Jest Testing",
+        "description": "Jest testing framework best practices",
+        "content": """# Use Jest for all testing
 # Write descriptive test names that explain behavior
 # Use describe() and it() for test organization
 # Aim for 80%+ test coverage
@@ -48,16 +33,15 @@ describe('UserService', () => {
     // Test implementation
   });
 });""",
-            tags=["jest", "testing", "coverage"],
-            priority=1,
-            category="testing"
-        ))
-        
-        # Mocking rule
-        self.ruleset.add_rule(RulesetItem(
-            name="Mocking",
-            description="Mocking and test isolation guidelines",
-            content="""# Use Jest mocks for external dependencies
+        "tags": ("jest", "testing", "coverage"),
+        "priority": 1,
+        "category": "testing",
+    },
+    # Mocking rule
+    {
+        "name": "Mocking",
+        "description": "Mocking and test isolation guidelines",
+        "content": """# Use Jest mocks for external dependencies
 # Mock at the boundary of your system
 # Use jest.fn() for function mocks
 # Use jest.mock() for module mocks
@@ -77,16 +61,15 @@ jest.mock('../api/client', () => ({
 // Verify mock calls
 expect(mockFetch).toHaveBeenCalledWith('/api/users');
 expect(mockFetch).toHaveBeenCalledTimes(1);""",
-            tags=["mocking", "jest", "isolation"],
-            priority=2,
-            category="testing"
-        ))
-        
-        # TypeScript testing rule
-        self.ruleset.add_rule(RulesetItem(
-            name="TypeScript Testing",
-            description="TypeScript-specific testing patterns",
-            content="""# Use proper TypeScript types in tests
+        "tags": ("mocking", "jest", "isolation"),
+        "priority": 2,
+        "category": "testing",
+    },
+    # TypeScript testing rule
+    {
+        "name": "TypeScript Testing",
+        "description": "TypeScript-specific testing patterns",
+        "content": """# Use proper TypeScript types in tests
 # Test type safety and compile-time errors
 # Use type assertions when necessary
 # Test generic functions with different types
@@ -117,27 +100,65 @@ describe('processData', () => {
     expect(result).toEqual([1, 2, 3]);
   });
 });""",
-            tags=["typescript", "types", "generics"],
-            priority=2,
-            category="testing"
-        ))
+        "tags": ("typescript", "types", "generics"),
+        "priority": 2,
+        "category": "testing",
+    },
+)
+
+
+class TestingRuleset:
+    """TypeScript testing standards ruleset."""
+    
+    # Shared renderer and output filename per supported format
+    _FORMATS = {fmt: (renderer, f"typescript-testing-standards{renderer.suffix}") for fmt, renderer in _RENDERERS.items()}
+    
+    def __init__(self):
+        # Built per instance, so the categories and tags lists are never shared
+        self.metadata = RulesetMetadata(
+            name="TypeScript Testing Standards",
+            version="1.0.0",
+            description="Organizational TypeScript testing guidelines and best practices",
+            categories=["development", "typescript", "testing"],
+            tags=["typescript", "testing", "jest", "coverage", "mocking"],
+            author="Dan Holman",
+            maintainer="engineering@company.com"
+        )
+    
+    @cached_property
+    def ruleset(self) -> Ruleset:
+        """The ruleset, built from ``_TESTING_RULES`` on first access.
+        
+        Each instance gets its own ruleset, so rules can still be added to it;
+        repeat renders of an unchanged ruleset come from the renderers' cache.
+        """
+        ruleset = Ruleset(metadata=self.metadata)
+        for spec in _TESTING_RULES:
+            ruleset.add_rule(RulesetItem(**spec))
+        return ruleset
     
     def apply(self, output_dir: str = ".cursor/rules", format: str = "cursor"):
         """Apply the testing ruleset to the specified output directory."""
         output_path = Path(output_dir)
         
-        if format == "cursor":
-            renderer = CursorRenderer()
-            filename = "typescript-testing-standards.mdc"
-        elif format == "copilot":
-            renderer = CopilotRenderer()
-            filename = "typescript-testing-standards.instructions.md"
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        try:
+            renderer, filename = self._FORMATS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}") from None
         
         output_file = output_path / filename
         renderer.render_file(self.ruleset, output_file)
     
+    def apply_all(self, output_dir: str = ".cursor/rules", formats: Iterable[str] = ("cursor", "copilot")):
+        """Apply the testing ruleset in each of ``formats``; the rendered rule blocks are shared between them."""
+        formats = tuple(formats)
+        for format in formats:
+            if format not in self._FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
+        
+        for format in formats:
+            self.apply(output_dir, format)
+    
     def get_rules(self):
         """Get all rules in this ruleset."""
         return self.ruleset.rules
@@ -3,10 +3,134 @@ Source file processor for generating rulesets from markdown files.
 """
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, FrozenSet, Pattern, Set, Tuple
 from ..core import Ruleset, RulesetMetadata, RulesetItem
 
+# Below this many source files, process_all_sources parses them in this process,
+# since starting a worker pool costs more than it saves
+_PARALLEL_MIN_FILES = 16
+
+# Patterns used on every processed file, compiled once
+_H1_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+# A code fence line: ``` plus an optional language name
+_CODEFENCE_RE = re.compile(r'```\w*')
+
+# Categories are checked in this order; the first one whose keywords appear wins
+_CATEGORY_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('code-quality', ('style', 'formatting', 'linting')),
+    ('testing', ('test', 'fixture', 'mock')),
+    ('security', ('security', 'encrypt', 'auth')),
+    ('performance', ('performance', 'optimization')),
+    ('error-handling', ('error', 'exception', 'handling')),
+)
+
+# Common tag patterns
+_TAG_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('pytest', ('pytest', 'test')),
+    ('black', ('black', 'formatting')),
+    ('ruff', ('ruff', 'linting')),
+    ('mypy', ('mypy', 'typing')),
+    ('security', ('security', 'encryption', 'authentication')),
+    ('performance', ('performance', 'optimization', 'caching')),
+    ('error-handling', ('error', 'exception', 'logging')),
+    ('testing', ('test', 'fixture', 'mock', 'coverage')),
+)
+
+
+def _keyword_scanner(groups: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Tuple[Pattern[str], Dict[str, FrozenSet[str]]]:
+    """Build a single-pass scanner for keyword groups.
+    
+    The pattern is a lookahead alternation, longest keyword first, so one
+    ``findall`` pass reports a keyword at every position where one starts.
+    Each keyword maps to every group with a keyword contained in it, which
+    covers shorter keywords hidden inside a longer match (``test`` inside
+    ``pytest``) and keeps the result identical to per-keyword ``in`` checks.
+    """
+    keywords = sorted({keyword for _, keywords in groups for keyword in keywords}, key=len, reverse=True)
+    names = {
+        keyword: frozenset(name for name, group in groups if any(k in keyword for k in group))
+        for keyword in keywords
+    }
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+    return pattern, names
+
+
+def _matching_groups(scanner: Tuple[Pattern[str], Dict[str, FrozenSet[str]]], text: str) -> Set[str]:
+    """Return the names of all groups with a keyword occurring in text."""
+    pattern, names = scanner
+    hits = set()
+    for keyword in set(pattern.findall(text)):
+        hits |= names[keyword]
+    return hits
+
+
+_CATEGORY_SCANNER = _keyword_scanner(_CATEGORY_KEYWORDS)
+_TAG_SCANNER = _keyword_scanner(_TAG_KEYWORDS)
+
+
+def _parse_sections(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(name, content)`` for each H2 section of a markdown document.
+    
+    Walks the lines once, collecting each section's lines and cleaning them
+    when the next H2 (or the end) is reached. Text before the first H2 is
+    not part of any section.
+    """
+    # A substring search rules out documents without any H2 before splitting them
+    if not content.startswith('## ') and '\n## ' not in content:
+        return
+    
+    name = None
+    lines: List[str] = []
+    for line in content.split('\n'):
+        if line.startswith('## ') and len(line) > 3:
+            if name is not None:
+                yield name, _clean_section(lines)
+            name = line[3:].strip()
+            lines = []
+        elif name is not None:
+            lines.append(line)
+    
+    if name is not None:
+        yield name, _clean_section(lines)
+
+
+def _clean_section(lines: List[str]) -> str:
+    """Clean a section's lines into rule content.
+    
+    Code fence lines are dropped but the code kept, runs of blank lines
+    collapse into one, and surrounding whitespace is stripped. A fence line
+    with a language name is only dropped when another line follows it.
+    """
+    # Trim surrounding whitespace first, as fence lines are matched after it
+    start, end = 0, len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    if start == end:
+        return ''
+    lines = lines[start:end]
+    lines[0] = lines[0].lstrip()
+    lines[-1] = lines[-1].rstrip()
+    
+    last = len(lines) - 1
+    cleaned = []
+    blank = False
+    for i, line in enumerate(lines):
+        if line.startswith('```') and (line == '```' or (i < last and _CODEFENCE_RE.fullmatch(line))):
+            continue
+        if not line.strip():
+            if not blank:
+                cleaned.append('')
+                blank = True
+            continue
+        blank = False
+        cleaned.append(line)
+    
+    return '\n'.join(cleaned).strip()
+
 
 class SourceProcessor:
     """Processes markdown source files to generate rulesets."""
@@ -16,11 +140,11 @@ class SourceProcessor:
     
     def process_markdown_file(self, file_path: Path, domain: str, category: str) -> Ruleset:
         """Process a markdown file and generate a ruleset."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Decoded in one call; text mode keeps CRLF sources parsing like LF ones
+        content = file_path.read_text(encoding='utf-8')
         
         # Extract title from first H1
-        title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+        title_match = _H1_RE.search(content)
         title = title_match.group(1) if title_match else file_path.stem.title()
         
         # Create metadata
@@ -44,102 +168,67 @@ class SourceProcessor:
         return ruleset
     
     def _parse_markdown_content(self, content: str) -> List[RulesetItem]:
-        """Parse markdown content into rules."""
+        """Parse markdown content into rules, one per H2 section."""
         rules = []
         
-        # Split content by H2 headers
-        sections = re.split(r'^## (.+)$', content, flags=re.MULTILINE)
-        
-        for i in range(1, len(sections), 2):
-            if i + 1 < len(sections):
-                rule_name = sections[i].strip()
-                rule_content = sections[i + 1].strip()
-                
-                # Clean up the content
-                rule_content = self._clean_markdown_content(rule_content)
-                
-                # Determine category based on rule name
-                category = self._determine_category(rule_name)
-                
-                # Extract tags from content
-                tags = self._extract_tags(rule_content)
-                
-                rule = RulesetItem(
-                    name=rule_name,
-                    description=f"{rule_name} guidelines and best practices",
-                    content=rule_content,
-                    tags=tags,
-                    priority=1,
-                    category=category
-                )
-                rules.append(rule)
+        for rule_name, rule_content in _parse_sections(content):
+            # Determine category based on rule name
+            category = self._determine_category(rule_name)
+            
+            # Extract tags from content
+            tags = self._extract_tags(rule_content)
+            
+            rule = RulesetItem(
+                name=rule_name,
+                description=f"{rule_name} guidelines and best practices",
+                content=rule_content,
+                tags=tags,
+                priority=1,
+                category=category
+            )
+            rules.append(rule)
         
         return rules
     
-    def _clean_markdown_content(self, content: str) -> str:
-        """Clean markdown content for ruleset."""
-        # Remove code block markers but keep the content
-        content = re.sub(r'^```\w*\n', '', content, flags=re.MULTILINE)
-        content = re.sub(r'^```$', '', content, flags=re.MULTILINE)
-        
-        # Clean up extra whitespace
-        content = re.sub(r'\n\s*\n', '\n\n', content)
-        content = content.strip()
-        
-        return content
-    
     def _determine_category(self, rule_name: str) -> str:
         """Determine category based on rule name."""
-        rule_lower = rule_name.lower()
+        hits = _matching_groups(_CATEGORY_SCANNER, rule_name.lower())
         
-        if any(word in rule_lower for word in ['style', 'formatting', 'linting']):
-            return 'code-quality'
-        elif any(word in rule_lower for word in ['test', 'fixture', 'mock']):
-            return 'testing'
-        elif any(word in rule_lower for word in ['security', 'encrypt', 'auth']):
-            return 'security'
-        elif any(word in rule_lower for word in ['performance', 'optimization']):
-            return 'performance'
-        elif any(word in rule_lower for word in ['error', 'exception', 'handling']):
-            return 'error-handling'
-        else:
-            return 'general'
+        for category, _ in _CATEGORY_KEYWORDS:
+            if category in hits:
+                return category
+        return 'general'
     
     def _extract_tags(self, content: str) -> List[str]:
         """Extract tags from content."""
-        tags = []
-        
-        # Common tag patterns
-        tag_patterns = {
-            'pytest': ['pytest', 'test'],
-            'black': ['black', 'formatting'],
-            'ruff': ['ruff', 'linting'],
-            'mypy': ['mypy', 'typing'],
-            'security': ['security', 'encryption', 'authentication'],
-            'performance': ['performance', 'optimization', 'caching'],
-            'error-handling': ['error', 'exception', 'logging'],
-            'testing': ['test', 'fixture', 'mock', 'coverage']
-        }
-        
-        content_lower = content.lower()
-        for tag, keywords in tag_patterns.items():
-            if any(keyword in content_lower for keyword in keywords):
-                tags.append(tag)
+        hits = _matching_groups(_TAG_SCANNER, content.lower())
         
-        return tags
+        return [tag for tag, _ in _TAG_KEYWORDS if tag in hits]
     
     def process_all_sources(self) -> Dict[str, Dict[str, Ruleset]]:
-        """Process all source files and return organized rulesets."""
-        rulesets = {}
+        """Process all source files and return organized rulesets.
+        
+        Parsing is CPU-bound, so once there are enough files to pay for
+        starting worker processes they are spread across a process pool.
+        """
+        rulesets: Dict[str, Dict[str, Ruleset]] = {}
+        jobs = []
         
         for domain_dir in self.sources_dir.iterdir():
             if domain_dir.is_dir():
-                domain = domain_dir.name
-                rulesets[domain] = {}
-                
-                for source_file in domain_dir.glob('*.md'):
-                    category = source_file.stem
-                    ruleset = self.process_markdown_file(source_file, domain, category)
-                    rulesets[domain][category] = ruleset
+                rulesets[domain_dir.name] = {}
+                jobs.extend((source_file, domain_dir.name, source_file.stem) for source_file in domain_dir.glob('*.md'))
+        
+        if len(jobs) < _PARALLEL_MIN_FILES:
+            results = [self.process_markdown_file(*job) for job in jobs]
+        else:
+            source_files, domains, categories = zip(*jobs)
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(
+                    self.process_markdown_file, source_files, domains, categories, chunksize=8
+                ))
+        
+        for (_, domain, category), ruleset in zip(jobs, results):
+            rulesets[domain][category] = ruleset
         
         return rulesets
@@ -1,16 +1,13 @@
 """Code quality validation utilities."""
 
+import importlib
+
 from .base import ValidationResult, BaseValidator
-from .readme_validator import ReadmeValidator
-from .workflow_validator import WorkflowValidator
-from .test_validator import TestValidator
-from .version_validator import VersionValidator
-from .linter_validator import LinterValidator
-from .issue_fixer import IssueFixer
 
 __all__ = [
     "ValidationResult",
     "BaseValidator",
+    "ValidationCache",
     "ReadmeValidator",
     "WorkflowValidator", 
     "TestValidator",
@@ -18,3 +15,22 @@ __all__ = [
     "LinterValidator",
     "IssueFixer"
 ]
+
+
+# Validators are imported on first access so a single check loads only its own module
+_LAZY_MODULES = {
+    "ValidationCache": ".cache",
+    "ReadmeValidator": ".readme_validator",
+    "WorkflowValidator": ".workflow_validator",
+    "TestValidator": ".test_validator",
+    "VersionValidator": ".version_validator",
+    "LinterValidator": ".linter_validator",
+    "IssueFixer": ".issue_fixer",
+}
+
+
+def __getattr__(name):
+    """Import validators on first access."""
+    if name in _LAZY_MODULES:
+        return getattr(importlib.import_module(_LAZY_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
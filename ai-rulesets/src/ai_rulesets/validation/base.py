@@ -1,12 +1,24 @@
 """Base validation classes and utilities."""
 
+import copy
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
+if TYPE_CHECKING:
+    from .cache import ValidationCache
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Result of a validation check."""
+    """Result of a validation check.
+    
+    Slotted to keep large issue lists compact, and frozen so results can be
+    hashed and shared safely between worker threads and the cache.
+    """
     is_valid: bool
     message: str
     file_path: str
@@ -18,20 +30,67 @@ class ValidationResult:
 class BaseValidator:
     """Base class for all validators."""
     
-    def __init__(self, project_root: str = "."):
-        """Initialize validator with project root."""
-        self.project_root = project_root
+    def __init__(self, project_root: Union[str, Path] = ".", cache: Optional["ValidationCache"] = None,
+                 jobs: Optional[int] = None):
+        """Initialize validator with project root, optional result cache and thread count."""
+        # QualityChecker hands every validator the same Path; reuse it as is
+        self.project_root = project_root if isinstance(project_root, Path) else Path(project_root)
+        self.cache = cache
+        self.jobs = jobs
         self.issues: list[ValidationResult] = []
     
     def validate(self) -> list[ValidationResult]:
         """Run validation and return results."""
         raise NotImplementedError("Subclasses must implement validate method")
     
-    def get_summary(self) -> dict[str, int]:
-        """Get validation summary."""
-        summary = {"total": len(self.issues), "errors": 0, "warnings": 0, "info": 0}
+    def _validate_each(self, method: str, items: Iterable[tuple]) -> None:
+        """Call ``method`` with each argument tuple on a thread pool, appending issues in item order.
         
-        for issue in self.issues:
-            summary[issue.severity + "s"] += 1
+        Per-file checks are dominated by reads and parsing, so threads overlap
+        them well. Each call runs on a shallow copy of this validator with its
+        own ``issues`` list, so results from different files never interleave.
+        """
+        items = list(items)
+        workers = self.jobs or min(32, (os.cpu_count() or 1) * 4)
+        
+        if workers == 1 or len(items) < 2:
+            for args in items:
+                getattr(self, method)(*args)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+            for issues in executor.map(lambda args: self._collect(method, *args), items):
+                self.add_issues(issues)
+    
+    def add_issues(self, results: Iterable[ValidationResult]) -> None:
+        """Append a batch of results to ``issues`` in one call.
         
-        return summary
+        Checks that find several issues at once collect them locally and hand
+        them over here, rather than appending each one separately.
+        """
+        self.issues.extend(results)
+    
+    def _collect(self, method: str, *args) -> list[ValidationResult]:
+        """Call ``method`` on a shallow copy with its own ``issues`` list and return what it found."""
+        worker = copy.copy(self)
+        worker.issues = []
+        getattr(worker, method)(*args)
+        return worker.issues
+    
+    def handles_file(self, file_path: Path) -> bool:
+        """Return True if ``validate_file`` reports every issue this validator finds in ``file_path``."""
+        return False
+    
+    def validate_file(self, file_path: Path) -> list[ValidationResult]:
+        """Validate a single file and return its issues, leaving ``self.issues`` untouched."""
+        raise NotImplementedError(f"{type(self).__name__} does not validate single files")
+    
+    def get_summary(self) -> dict[str, int]:
+        """Get validation summary."""
+        counts = Counter(issue.severity for issue in self.issues)
+        return {
+            "total": len(self.issues),
+            "errors": counts["error"],
+            "warnings": counts["warning"],
+            "info": counts["info"],
+        }
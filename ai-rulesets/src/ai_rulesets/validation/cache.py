@@ -0,0 +1,121 @@
+"""Persistent cache of per-file validation results."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from .base import ValidationResult
+
+
+class ValidationCache:
+    """SQLite store of validation results keyed by file path, content hash and validator.
+    
+    A result is reused only when the file's SHA-256 still matches, so edited
+    files are revalidated automatically. Validators put their rule version in
+    the ``validator`` key to invalidate old entries when their checks change.
+    
+    Results are stored as JSON rows of their fields, never pickled, and an
+    entry that does not decode to that shape is treated as a miss; the
+    database is read back as data only, wherever it came from.
+    """
+    
+    def __init__(self, cache_dir: Path):
+        """Initialize cache stored under ``cache_dir``."""
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / "validations.db"
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def __getstate__(self) -> dict:
+        # Connections cannot cross process boundaries; workers reconnect lazily
+        return {"cache_dir": self.cache_dir, "db_path": self.db_path}
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._connection = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def hash_content(data: bytes) -> bytes:
+        """Hash file content for use as a cache key."""
+        return hashlib.sha256(data).digest()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, creating it if needed."""
+        if self._connection is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Shared by a validator's worker threads; every use holds self._lock
+            self._connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS v("
+                "path TEXT, sha BLOB, validator TEXT, results TEXT, "
+                "PRIMARY KEY(path, validator))"
+            )
+        return self._connection
+    
+    def get(self, path: str, validator: str, sha: bytes) -> Optional[List[ValidationResult]]:
+        """Return cached results for this exact file content, or None on a miss."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT results FROM v WHERE path = ? AND validator = ? AND sha = ?",
+                    (path, validator, sha),
+                ).fetchone()
+            return _decode_results(row[0]) if row else None
+        except (sqlite3.Error, OSError):
+            # Unreadable database; revalidate
+            return None
+    
+    def put(self, path: str, validator: str, sha: bytes, results: List[ValidationResult]) -> None:
+        """Store the results produced for this file content."""
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO v(path, sha, validator, results) VALUES (?, ?, ?, ?)",
+                        (path, sha, validator, _encode_results(results)),
+                    )
+        except (sqlite3.Error, OSError):
+            # Caching is best effort; validation results are still returned
+            pass
+    
+    def close(self) -> None:
+        """Close the database connection if it is open."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _encode_results(results: Sequence[ValidationResult]) -> str:
+    """Encode results as a JSON list of their field values, in field order."""
+    return json.dumps([
+        [r.is_valid, r.message, r.file_path, r.line_number, r.severity, r.rule] for r in results
+    ])
+
+
+def _decode_results(data: Any) -> Optional[List[ValidationResult]]:
+    """Decode what _encode_results stored, or return None if ``data`` is anything else."""
+    try:
+        rows = json.loads(data)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(rows, list):
+        return None
+    
+    results = []
+    for row in rows:
+        if not (isinstance(row, list) and len(row) == 6):
+            return None
+        is_valid, message, file_path, line_number, severity, rule = row
+        if not (isinstance(is_valid, bool) and isinstance(message, str) and isinstance(file_path, str)
+                and (line_number is None or type(line_number) is int) and isinstance(severity, str)
+                and (rule is None or isinstance(rule, str))):
+            return None
+        results.append(ValidationResult(is_valid, message, file_path, line_number, severity, rule))
+    return results
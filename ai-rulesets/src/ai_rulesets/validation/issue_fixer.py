@@ -1,38 +1,250 @@
 """Issue fixing utilities for automatic correction of common problems."""
 
+import ast
+import io
 import re
 import os
+import tokenize
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional, Tuple, Union
 from .base import ValidationResult
 
+try:
+    # Black and isort are called in-process when installed, instead of
+    # starting their command-line tools
+    import black
+except ImportError:
+    black = None
+
+try:
+    import isort
+except ImportError:
+    isort = None
+
+# Below this many files, fix_issues fixes them in this process, since
+# starting a worker pool costs more than it saves
+_PARALLEL_MIN_FILES = 16
+
+# Patterns used by the fixers, compiled once
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+_SQUOTE_RE = re.compile(r"'([^']*)'")
+_OLD_PYTHON_VERSION_RE = re.compile(r'python (\d+\.\d+) found')
+_WORD_RE = re.compile(r'\b\w+\b')
+_TRAILING_WS_RE = re.compile(r'[ \t]+$', re.MULTILINE)
+
+# From Python 3.12, f-strings are tokenized as start, middle and end tokens
+# instead of one STRING token; None on older versions
+_FSTRING_START = getattr(tokenize, 'FSTRING_START', None)
+_FSTRING_END = getattr(tokenize, 'FSTRING_END', None)
+
+# Returns that suggest a return type hint, checked in order
+_RETURN_HINTS = (
+    (('return None',), ' -> None:'),
+    (('return True', 'return False'), ' -> bool:'),
+    (('return ""', 'return str('), ' -> str:'),
+    (('return 0', 'return int('), ' -> int:'),
+)
+
+# Old module names and their replacements
+_OUTDATED_REFERENCES = {
+    "AI Test Generation": "AI Rulesets",
+    "ai-test-generation": "ai-rulesets",
+    "ai_test_generation": "ai_rulesets"
+}
+
+# Deprecated GitHub Actions and their replacements
+_DEPRECATED_ACTIONS = {
+    "actions/checkout@v2": "actions/checkout@v4",
+    "actions/setup-python@v2": "actions/setup-python@v5",
+    "actions/setup-node@v2": "actions/setup-node@v4"
+}
+
+# One alternation per table, so all of its replacements take one pass
+_OUTDATED_REFERENCES_RE = re.compile('|'.join(map(re.escape, _OUTDATED_REFERENCES)))
+_DEPRECATED_ACTIONS_RE = re.compile('|'.join(map(re.escape, _DEPRECATED_ACTIONS)))
+
+# Messages containing any of these can be fixed automatically; they are
+# matched as literal substrings
+_FIXABLE_PATTERNS = (
+    "Trailing whitespace",
+    "Line too long",
+    "Outdated reference found: AI Test Generation",
+    "Missing required field: on",
+    "Job.*step.*missing name or uses",
+    "Deprecated action used",
+    "Code formatting issue",
+    "Import sorting issue",
+    "Missing docstring",
+    "Unused import",
+    "Inconsistent quotes",
+    "Missing type hint",
+    "YAML.*indentation",
+    "Markdown.*formatting",
+    "Version inconsistency",
+    "README should start with a title",
+    "pytest not available",
+    "Error running Node.js tests",
+)
+# One alternation over every pattern, so a message is scanned once
+_FIXABLE_RE = re.compile('|'.join(map(re.escape, _FIXABLE_PATTERNS)))
+
+
+def _format_code(fixer: "IssueFixer", paths: List[Path]) -> None:
+    """Run Black over the files."""
+    fixer._fix_code_formatting(paths)
+
+
+def _sort_imports(fixer: "IssueFixer", paths: List[Path]) -> None:
+    """Run isort over the files."""
+    fixer._fix_import_sorting(paths)
+
+
+# Fixes that run an external tool on the files themselves. Each runs once,
+# over every file that needs it, after the other fixes have been written.
+# They are only used when the tool's library cannot be imported.
+_TOOL_FIXES = (_format_code, _sort_imports)
+
+# Fix per issue type, in priority order: an issue gets the first entry whose
+# substrings all occur in its message and whose skipped suffix (if any) is not
+# the file's. Fixes marked as working on lines take and return the content's
+# list of lines; the others take and return the text. Tool fixes take the
+# paths to run over instead. A fix of None leaves the issue unfixed; these
+# are expected in some environments.
+_FIXERS: Tuple[Tuple[Tuple[str, ...], Optional[str], Optional[Callable[..., Any]], bool], ...] = (
+    (("Trailing whitespace",), None,
+     lambda fixer, content, issue, path: fixer._fix_trailing_whitespace(content, issue.line_number), False),
+    # Skip line length fixes for .md files
+    (("Line too long",), ".md",
+     lambda fixer, lines, issue, path: fixer._fix_long_lines(lines, issue.line_number), True),
+    (("Outdated reference found: AI Test Generation",), None,
+     lambda fixer, content, issue, path: fixer._fix_outdated_references(content), False),
+    (("Missing required field: on",), None,
+     lambda fixer, lines, issue, path: fixer._fix_missing_workflow_trigger(lines), True),
+    (("Job", "step", "missing name or uses"), None,
+     lambda fixer, lines, issue, path: fixer._fix_missing_step_name(lines, issue.line_number), True),
+    (("Deprecated action used",), None,
+     lambda fixer, content, issue, path: fixer._fix_deprecated_actions(content), False),
+    (("Code formatting issue",), None,
+     _format_code if black is None
+     else lambda fixer, content, issue, path: fixer._format_in_process(content), False),
+    (("Import sorting issue",), None,
+     _sort_imports if isort is None
+     else lambda fixer, content, issue, path: fixer._sort_imports_in_process(content, path), False),
+    (("Missing docstring",), None,
+     lambda fixer, lines, issue, path: fixer._fix_missing_docstring(lines, issue.line_number), True),
+    (("Unused import",), None,
+     lambda fixer, content, issue, path: fixer._fix_unused_imports(content, path), False),
+    (("Inconsistent quotes",), None,
+     lambda fixer, content, issue, path: fixer._fix_quote_consistency(content, path), False),
+    (("Missing type hint",), None,
+     lambda fixer, content, issue, path: fixer._fix_missing_type_hints(content, issue.line_number), False),
+    (("YAML", "indentation"), None,
+     lambda fixer, lines, issue, path: fixer._fix_yaml_indentation(lines), True),
+    (("Markdown", "formatting"), None,
+     lambda fixer, lines, issue, path: fixer._fix_markdown_formatting(lines), True),
+    (("Version inconsistency",), None,
+     lambda fixer, content, issue, path: fixer._fix_version_inconsistency(content, issue.message), False),
+    (("README should start with a title",), None,
+     lambda fixer, lines, issue, path: fixer._fix_readme_title(lines), True),
+    (("pytest not available",), None, None, False),
+    (("Error running Node.js tests",), None, None, False),
+)
+
+
+class _LineBuffer:
+    """A file's content, held as text or as lines.
+    
+    Each form is built from the other only when a fix asks for it, so a run of
+    line-based fixes splits the content once and joins it once.
+    """
+    
+    __slots__ = ("_text", "_lines")
+    
+    def __init__(self, text: str):
+        self._text: Optional[str] = text
+        self._lines: Optional[List[str]] = None
+    
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = '\n'.join(self._lines)
+        return self._text
+    
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        self._lines = None
+    
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self._text.split('\n')
+        # The caller may change the lines in place
+        self._text = None
+        return self._lines
+    
+    @lines.setter
+    def lines(self, lines: List[str]) -> None:
+        self._lines = lines
+        self._text = None
+
 
 class IssueFixer:
     """Automatically fixes common issues found by the quality checker."""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: Union[str, Path] = "."):
         """Initialize fixer with project root."""
-        self.project_root = Path(project_root)
+        self.project_root = project_root if isinstance(project_root, Path) else Path(project_root)
         self.fixes_applied = []
         self.fixes_failed = []
     
     def fix_issues(self, issues: List[ValidationResult]) -> Dict[str, int]:
-        """Fix all fixable issues."""
+        """Fix all fixable issues.
+        
+        Issues are grouped by file, so each file is read once, has all of its
+        fixes applied in memory in the order they were reported, and is
+        written at most once. Files are independent, so with enough of them
+        they are fixed in parallel worker processes; outcomes are still
+        recorded in file order. Black and isort fix content in memory like the
+        other fixes when installed; otherwise their command-line tools each
+        run once, over every file with an issue they fix.
+        """
         fixable_issues = [issue for issue in issues if self._is_fixable(issue)]
         
         print(f"\n🔧 Attempting to fix {len(fixable_issues)} fixable issues...")
         
+        issues_by_file: Dict[str, List[ValidationResult]] = {}
         for issue in fixable_issues:
-            try:
-                if self._fix_issue(issue):
-                    self.fixes_applied.append(issue)
-                    print(f"✅ Fixed: {issue.message}")
-                else:
-                    self.fixes_failed.append(issue)
-                    print(f"❌ Could not fix: {issue.message}")
-            except Exception as e:
-                self.fixes_failed.append(issue)
-                print(f"❌ Error fixing {issue.message}: {e}")
+            issues_by_file.setdefault(issue.file_path, []).append(issue)
+        
+        # Content of each file passed to a tool, and the issues each tool fixes per file
+        contents: Dict[Path, str] = {}
+        tool_issues: Dict[Callable[..., None], Dict[Path, List[ValidationResult]]] = {
+            tool: {} for tool in _TOOL_FIXES
+        }
+        file_paths = list(issues_by_file)
+        file_issue_lists = list(issues_by_file.values())
+        if len(file_paths) < _PARALLEL_MIN_FILES:
+            file_fixes = map(self._fix_file, file_paths, file_issue_lists)
+        else:
+            with ProcessPoolExecutor() as executor:
+                file_fixes = list(executor.map(self._fix_file, file_paths, file_issue_lists, chunksize=8))
+        
+        for file_path, file_issues, (outcomes, content, deferred) in zip(file_paths, file_issue_lists, file_fixes):
+            for index, fixed, error in outcomes:
+                self._record(file_issues[index], fixed, error)
+            if deferred:
+                path = Path(file_path)
+                contents[path] = content
+                for tool, index in deferred:
+                    tool_issues[tool].setdefault(path, []).append(file_issues[index])
+        
+        for tool, issues_by_path in tool_issues.items():
+            if issues_by_path:
+                self._run_tool(tool, issues_by_path, contents)
         
         return {
             "total_fixable": len(fixable_issues),
@@ -40,150 +252,202 @@ class IssueFixer:
             "failed": len(self.fixes_failed)
         }
     
+    def fixed_files(self) -> List[str]:
+        """Return the paths of files changed by successful fixes, in the order they were fixed."""
+        return list(dict.fromkeys(issue.file_path for issue in self.fixes_applied if issue.file_path))
+    
     def _is_fixable(self, issue: ValidationResult) -> bool:
         """Check if an issue can be automatically fixed."""
-        fixable_patterns = [
-            "Trailing whitespace",
-            "Line too long",
-            "Outdated reference found: AI Test Generation",
-            "Missing required field: on",
-            "Job.*step.*missing name or uses",
-            "Deprecated action used",
-            "Code formatting issue",
-            "Import sorting issue",
-            "Missing docstring",
-            "Unused import",
-            "Inconsistent quotes",
-            "Missing type hint",
-            "YAML.*indentation",
-            "Markdown.*formatting",
-            "Version inconsistency",
-            "README should start with a title",
-            "pytest not available",
-            "Error running Node.js tests"
-        ]
-        
         # Fix both errors and warnings
-        return any(pattern in issue.message for pattern in fixable_patterns)
-    
-    def _fix_issue(self, issue: ValidationResult) -> bool:
-        """Fix a specific issue."""
-        if not issue.file_path:
-            return False
-        
-        file_path = Path(issue.file_path)
-        if not file_path.exists():
-            return False
-        
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Apply fixes based on issue type
-        if "Trailing whitespace" in issue.message:
-            content = self._fix_trailing_whitespace(content, issue.line_number)
-        elif "Line too long" in issue.message and file_path.suffix.lower() != '.md':
-            # Skip line length fixes for .md files
-            content = self._fix_long_lines(content, issue.line_number)
-        elif "Outdated reference found: AI Test Generation" in issue.message:
-            content = self._fix_outdated_references(content)
-        elif "Missing required field: on" in issue.message:
-            content = self._fix_missing_workflow_trigger(content)
-        elif "Job" in issue.message and "step" in issue.message and "missing name or uses" in issue.message:
-            content = self._fix_missing_step_name(content, issue.line_number)
-        elif "Deprecated action used" in issue.message:
-            content = self._fix_deprecated_actions(content)
-        elif "Code formatting issue" in issue.message:
-            content = self._fix_code_formatting(content, file_path)
-        elif "Import sorting issue" in issue.message:
-            content = self._fix_import_sorting(content, file_path)
-        elif "Missing docstring" in issue.message:
-            content = self._fix_missing_docstring(content, issue.line_number)
-        elif "Unused import" in issue.message:
-            content = self._fix_unused_imports(content)
-        elif "Inconsistent quotes" in issue.message:
-            content = self._fix_quote_consistency(content)
-        elif "Missing type hint" in issue.message:
-            content = self._fix_missing_type_hints(content, issue.line_number)
-        elif "YAML" in issue.message and "indentation" in issue.message:
-            content = self._fix_yaml_indentation(content)
-        elif "Markdown" in issue.message and "formatting" in issue.message:
-            content = self._fix_markdown_formatting(content)
-        elif "Version inconsistency" in issue.message:
-            content = self._fix_version_inconsistency(content, issue.message)
-        elif "README should start with a title" in issue.message:
-            content = self._fix_readme_title(content)
-        elif "pytest not available" in issue.message:
-            # Skip pytest warnings - these are expected in some environments
-            return False
-        elif "Error running Node.js tests" in issue.message:
-            # Skip Node.js test errors - these are environment-specific
-            return False
+        return _FIXABLE_RE.search(issue.message) is not None
+    
+    def _fix_file(self, file_path: str, issues: List[ValidationResult]) -> Tuple[
+            List[Tuple[int, bool, Optional[Exception]]], Optional[str], List[Tuple[Callable[..., None], int]]]:
+        """Apply the fixes for every issue reported in one file, then write it back once.
+        
+        Nothing is recorded here, so this can run in a worker process. Returns
+        the outcome of each issue as ``(index, fixed, error)``; and, for issues
+        fixed by an external tool once the file on disk holds the other fixes,
+        the file's content and each ``(tool, index)``.
+        """
+        path = Path(file_path) if file_path else None
+        if path is None or not path.exists():
+            return [(index, False, None) for index in range(len(issues))], None, []
+        
+        try:
+            original = self._read(path)
+        except Exception as e:
+            return [(index, False, e) for index in range(len(issues))], None, []
+        
+        buffer = _LineBuffer(original)
+        results = []
+        deferred = []
+        # Set once any fix changes the content, so an untouched file is
+        # neither joined back together nor compared with what was read
+        mutated = False
+        suffix = path.suffix.lower()
+        
+        for index, issue in enumerate(issues):
+            fix, on_lines = self._find_fix(issue.message, suffix)
+            if fix in _TOOL_FIXES:
+                deferred.append((fix, index))
+                continue
+            
+            try:
+                if fix is None:
+                    fixed = False
+                elif on_lines:
+                    lines = buffer.lines
+                    before = lines[:]
+                    buffer.lines = fix(self, lines, issue, path)
+                    fixed = buffer.lines != before
+                else:
+                    content = buffer.text
+                    buffer.text = fix(self, content, issue, path)
+                    fixed = buffer.text != content
+            except Exception as e:
+                if on_lines:
+                    # Drop any lines the failed fix had already changed
+                    buffer.lines = before
+                results.append((index, False, e))
+                continue
+            
+            results.append((index, fixed, None))
+            mutated = mutated or fixed
         
         # Write back if changed
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
+        content = buffer.text if mutated else original
+        if mutated:
+            try:
+                self._write(path, content)
+            except Exception as e:
+                results = [(index, False, error if error is not None or not fixed else e)
+                           for index, fixed, error in results]
+                # The tools would run on stale content
+                results.extend((index, False, e) for _, index in deferred)
+                deferred = []
+        
+        return results, content if deferred else None, deferred
+    
+    def _run_tool(self, tool: Callable[..., None], issues_by_path: Dict[Path, List[ValidationResult]],
+                  contents: Dict[Path, str]) -> None:
+        """Run an external tool once over every file in ``issues_by_path`` and record the outcomes.
+        
+        The first issue in a file is fixed if the tool changed the file; the
+        tool has nothing left to do for the rest.
+        """
+        try:
+            tool(self, list(issues_by_path))
+        except Exception as e:
+            for issues in issues_by_path.values():
+                for issue in issues:
+                    self._record(issue, False, e)
+            return
         
-        return False
+        for path, issues in issues_by_path.items():
+            try:
+                content = self._read(path)
+            except Exception as e:
+                for issue in issues:
+                    self._record(issue, False, e)
+                continue
+            
+            self._record(issues[0], content != contents[path])
+            for issue in issues[1:]:
+                self._record(issue, False)
+            contents[path] = content
+    
+    @staticmethod
+    def _find_fix(message: str, suffix: str) -> Tuple[Optional[Callable[..., Any]], bool]:
+        """Return the fix for the first issue type ``message`` matches and whether it works on lines."""
+        for needles, skipped_suffix, fix, on_lines in _FIXERS:
+            if suffix != skipped_suffix and all(needle in message for needle in needles):
+                return fix, on_lines
+        return None, False
+    
+    @staticmethod
+    def _read(path: Path) -> str:
+        """Read a file's content with one read and one decode, skipping the text-mode wrapper."""
+        content = path.read_bytes().decode('utf-8')
+        if '\r' in content:
+            # Translate newlines as a text-mode read would
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    @staticmethod
+    def _write(path: Path, content: str) -> None:
+        """Write fixed content back to a file."""
+        if os.linesep != '\n':
+            # Translate newlines as a text-mode write would
+            content = content.replace('\n', os.linesep)
+        path.write_bytes(content.encode('utf-8'))
+    
+    def _record(self, issue: ValidationResult, fixed: bool, error: Optional[Exception] = None) -> None:
+        """Record and report the outcome of fixing one issue."""
+        if fixed:
+            self.fixes_applied.append(issue)
+            print(f"✅ Fixed: {issue.message}")
+        elif error is None:
+            self.fixes_failed.append(issue)
+            print(f"❌ Could not fix: {issue.message}")
+        else:
+            self.fixes_failed.append(issue)
+            print(f"❌ Error fixing {issue.message}: {error}")
     
     def _fix_trailing_whitespace(self, content: str, line_number: Optional[int]) -> str:
-        """Fix trailing whitespace in content."""
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if line.endswith(' '):
-                lines[i] = line.rstrip()
-        return '\n'.join(lines)
+        """Fix trailing spaces and tabs in content."""
+        return _TRAILING_WS_RE.sub('', content)
     
-    def _fix_long_lines(self, content: str, line_number: Optional[int]) -> str:
-        """Fix lines that are too long by breaking them appropriately."""
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if len(line) > 120:
+    def _fix_long_lines(self, lines: List[str], line_number: Optional[int]) -> List[str]:
+        """Fix lines that are too long by breaking them appropriately.
+        
+        The rest of a broken line is checked again before the next line, and
+        the fixed lines are collected into a new list rather than inserted.
+        """
+        # Most files have no long lines, and are returned after one C-level scan
+        if max(map(len, lines), default=0) <= 120:
+            return lines
+        
+        fixed_lines = []
+        wrapped_url = False
+        for line in lines:
+            while len(line) > 120:
                 # Try to break at logical points
-                if ' - ' in line and len(line) > 120:
+                if ' - ' in line:
                     # Break at bullet points
-                    parts = line.split(' - ')
-                    if len(parts) > 1:
-                        lines[i] = parts[0] + ' -'
-                        lines.insert(i + 1, '  ' + ' - '.join(parts[1:]))
-                elif ' | ' in line and len(line) > 120:
+                    head, _, tail = line.partition(' - ')
+                    fixed_lines.append(head + ' -')
+                    line = '  ' + tail
+                elif ' | ' in line:
                     # Break at table separators
-                    parts = line.split(' | ')
-                    if len(parts) > 1:
-                        lines[i] = parts[0] + ' |'
-                        lines.insert(i + 1, '  ' + ' | '.join(parts[1:]))
-                elif 'http' in line and len(line) > 120:
-                    # Break long URLs
-                    url_match = re.search(r'(https?://[^\s]+)', line)
-                    if url_match:
-                        url = url_match.group(1)
-                        if len(url) > 80:
-                            lines[i] = line.replace(url, url[:80] + '\n  ' + url[80:])
+                    head, _, tail = line.partition(' | ')
+                    fixed_lines.append(head + ' |')
+                    line = '  ' + tail
+                else:
+                    if 'http' in line:
+                        # Break long URLs
+                        url_match = _URL_RE.search(line)
+                        if url_match:
+                            url = url_match.group(1)
+                            if len(url) > 80:
+                                line = line.replace(url, url[:80] + '\n  ' + url[80:])
+                                wrapped_url = True
+                    break
+            fixed_lines.append(line)
         
-        return '\n'.join(lines)
+        if wrapped_url:
+            # Split wrapped URLs into lines of their own
+            fixed_lines = '\n'.join(fixed_lines).split('\n')
+        return fixed_lines
     
     def _fix_outdated_references(self, content: str) -> str:
         """Fix outdated references to old module names."""
-        replacements = {
-            "AI Test Generation": "AI Rulesets",
-            "ai-test-generation": "ai-rulesets",
-            "ai_test_generation": "ai_rulesets"
-        }
-        
-        for old_ref, new_ref in replacements.items():
-            content = content.replace(old_ref, new_ref)
-        
-        return content
+        return _OUTDATED_REFERENCES_RE.sub(lambda match: _OUTDATED_REFERENCES[match.group()], content)
     
-    def _fix_missing_workflow_trigger(self, content: str) -> str:
+    def _fix_missing_workflow_trigger(self, lines: List[str]) -> List[str]:
         """Fix missing workflow triggers by adding a default trigger."""
-        if "on:" not in content and "name:" in content:
+        if not any("on:" in line for line in lines) and any("name:" in line for line in lines):
             # Find the name line and add trigger after it
-            lines = content.split('\n')
             for i, line in enumerate(lines):
                 if line.strip().startswith('name:'):
                     # Add basic trigger
@@ -193,200 +457,318 @@ class IssueFixer:
                     lines.insert(i + 4, '  pull_request:')
                     lines.insert(i + 5, '    branches: [ main ]')
                     break
-            return '\n'.join(lines)
         
-        return content
+        return lines
     
-    def _fix_missing_step_name(self, content: str, line_number: Optional[int]) -> str:
+    def _fix_missing_step_name(self, lines: List[str], line_number: Optional[int]) -> List[str]:
         """Fix missing step names in GitHub workflows."""
-        lines = content.split('\n')
-        
         for i, line in enumerate(lines):
             if 'uses:' in line and not any(lines[j].strip().startswith('name:') for j in range(max(0, i-3), i)):
                 # Add a generic name before the uses line
                 action_name = line.split('uses:')[1].strip().split('@')[0].split('/')[-1]
                 lines.insert(i, f'      - name: {action_name.replace("-", " ").title()}')
         
-        return '\n'.join(lines)
+        return lines
     
     def _fix_deprecated_actions(self, content: str) -> str:
         """Fix deprecated GitHub Actions."""
-        replacements = {
-            "actions/checkout@v2": "actions/checkout@v4",
-            "actions/setup-python@v2": "actions/setup-python@v5",
-            "actions/setup-node@v2": "actions/setup-node@v4"
-        }
-        
-        for old_action, new_action in replacements.items():
-            content = content.replace(old_action, new_action)
-        
-        return content
+        return _DEPRECATED_ACTIONS_RE.sub(lambda match: _DEPRECATED_ACTIONS[match.group()], content)
     
-    def _fix_code_formatting(self, content: str, file_path: Path) -> str:
-        """Fix code formatting using Black."""
+    def _fix_code_formatting(self, file_paths: List[Path]) -> None:
+        """Fix code formatting using Black, in one run over all of the files."""
         try:
             import subprocess
-            result = subprocess.run(
-                ["black", "--quiet", str(file_path)],
+            subprocess.run(
+                ["black", "--quiet", *map(str, file_paths)],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=60
             )
-            if result.returncode == 0:
-                # Read the formatted file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
-        return content
     
-    def _fix_import_sorting(self, content: str, file_path: Path) -> str:
-        """Fix import sorting using isort."""
+    def _fix_import_sorting(self, file_paths: List[Path]) -> None:
+        """Fix import sorting using isort, in one run over all of the files."""
         try:
             import subprocess
-            result = subprocess.run(
-                ["isort", "--quiet", str(file_path)],
+            subprocess.run(
+                ["isort", "--quiet", *map(str, file_paths)],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=60
             )
-            if result.returncode == 0:
-                # Read the sorted file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
-        return content
     
-    def _fix_missing_docstring(self, content: str, line_number: Optional[int]) -> str:
-        """Add basic docstrings to functions and classes."""
-        lines = content.split('\n')
+    def _format_in_process(self, content: str) -> str:
+        """Fix code formatting using Black's API."""
+        try:
+            return black.format_str(content, mode=self._black_mode)
+        except black.InvalidInput:
+            return content
+    
+    @cached_property
+    def _black_mode(self) -> "black.Mode":
+        """Black settings for the project, read once from its [tool.black] table.
         
+        The configuration is found the way Black's command-line tool finds it,
+        searching upwards from the project root; without one, or if it cannot
+        be read, Black's defaults are used.
+        """
+        pyproject = black.find_pyproject_toml((str(self.project_root.resolve()),))
+        if pyproject is None:
+            return black.Mode()
+        try:
+            config = black.parse_pyproject_toml(pyproject)
+            target_versions = config.get("target_version", ())
+            if isinstance(target_versions, str):
+                target_versions = (target_versions,)
+            return black.Mode(
+                target_versions={black.TargetVersion[version.upper()] for version in target_versions},
+                line_length=config.get("line_length", black.DEFAULT_LINE_LENGTH),
+                string_normalization=not config.get("skip_string_normalization", False),
+                magic_trailing_comma=not config.get("skip_magic_trailing_comma", False),
+                preview=config.get("preview", False),
+            )
+        except (OSError, ValueError, KeyError):
+            # An unreadable file or unknown target version
+            return black.Mode()
+    
+    @cached_property
+    def _isort_config(self) -> "isort.Config":
+        """isort settings for the project, looked up once."""
+        if self.project_root.is_dir():
+            return isort.Config(settings_path=str(self.project_root))
+        return isort.Config()
+    
+    def _sort_imports_in_process(self, content: str, file_path: Path) -> str:
+        """Fix import sorting using isort's API."""
+        return isort.code(content, config=self._isort_config, file_path=file_path)
+    
+    def _fix_missing_docstring(self, lines: List[str], line_number: Optional[int]) -> List[str]:
+        """Add basic docstrings to functions and classes."""
         # Look for function/class definitions without docstrings
         for i, line in enumerate(lines):
-            if (line.strip().startswith('def ') or line.strip().startswith('class ')) and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if not next_line.startswith('"""') and not next_line.startswith("'''"):
+            stripped = line.lstrip()
+            if stripped.rstrip().startswith(('def ', 'class ')) and i + 1 < len(lines):
+                if not lines[i + 1].lstrip().startswith(('"""', "'''")):
                     # Add a basic docstring
-                    indent = len(line) - len(line.lstrip())
+                    indent = len(line) - len(stripped)
                     docstring = ' ' * (indent + 4) + '"""TODO: Add docstring."""'
                     lines.insert(i + 1, docstring)
         
-        return '\n'.join(lines)
+        return lines
     
-    def _fix_unused_imports(self, content: str) -> str:
+    def _fix_unused_imports(self, content: str, file_path: Path) -> str:
         """Remove obviously unused imports."""
+        if file_path.suffix.lower() == '.py':
+            try:
+                return self._remove_unused_imports(content)
+            except (SyntaxError, ValueError):
+                # Not valid Python, so fall back to the simple heuristic
+                pass
+        
         lines = content.split('\n')
         new_lines = []
+        # Every word in the file is counted once, so each import is checked
+        # without rescanning the file
+        word_counts = Counter(_WORD_RE.findall(content))
+        line_counts = Counter(lines)
         
         for line in lines:
+            stripped = line.strip()
             # Skip empty lines and comments
-            if not line.strip() or line.strip().startswith('#'):
+            if not stripped or stripped.startswith('#'):
                 new_lines.append(line)
                 continue
             
             # Check if it's an import line
-            if line.strip().startswith(('import ', 'from ')):
+            if stripped.startswith(('import ', 'from ')):
                 # Simple heuristic: if the imported name isn't used in the rest of the file
-                import_name = line.strip().split()[-1].split('.')[-1]
-                if import_name not in content.replace(line, ''):
-                    # Skip this import
-                    continue
+                import_name = stripped.split()[-1].split('.')[-1]
+                # Names such as "*" or "(" say nothing about what is imported, so those imports are kept
+                if import_name.isidentifier():
+                    # Occurrences in this line and its duplicates are not uses
+                    own_count = line_counts[line] * _WORD_RE.findall(line).count(import_name)
+                    if word_counts[import_name] == own_count:
+                        # Skip this import
+                        continue
             
             new_lines.append(line)
         
         return '\n'.join(new_lines)
     
-    def _fix_quote_consistency(self, content: str) -> str:
+    @staticmethod
+    def _remove_unused_imports(content: str) -> str:
+        """Remove module-level imports none of whose names are used, found from the parsed source.
+        
+        A name is used if it is loaded anywhere in the module, or appears as
+        a string constant, as in ``__all__`` or a string annotation. Star and
+        ``__future__`` imports, and imports sharing a line with another
+        statement, are kept.
+        """
+        tree = ast.parse(content)
+        used = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                used.add(node.id)
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                used.add(node.value)
+        
+        removed = set()
+        body = tree.body
+        for i, node in enumerate(body):
+            if isinstance(node, ast.Import):
+                names = [alias.asname or alias.name.split('.')[0] for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module != '__future__':
+                names = [alias.asname or alias.name for alias in node.names]
+            else:
+                continue
+            
+            if '*' in names or not used.isdisjoint(names):
+                continue
+            if (i and body[i - 1].end_lineno >= node.lineno) or (
+                    i + 1 < len(body) and body[i + 1].lineno <= node.end_lineno):
+                continue
+            removed.update(range(node.lineno - 1, node.end_lineno))
+        
+        if not removed:
+            return content
+        
+        return '\n'.join(line for i, line in enumerate(content.split('\n')) if i not in removed)
+    
+    def _fix_quote_consistency(self, content: str, file_path: Path) -> str:
         """Standardize quote usage (prefer double quotes)."""
+        if file_path.suffix.lower() == '.py':
+            try:
+                return self._double_quote_strings(content)
+            except (tokenize.TokenError, SyntaxError):
+                # Not valid Python, so fall back to the simple pattern
+                pass
+        
         # Simple quote standardization
-        content = re.sub(r"'([^']*)'", r'"\1"', content)
+        content = _SQUOTE_RE.sub(r'"\1"', content)
         return content
     
+    @staticmethod
+    def _double_quote_strings(content: str) -> str:
+        """Switch Python's single-quoted string literals to double quotes.
+        
+        The source is tokenized once, so quotes in comments, docstrings and
+        other strings are left alone. A literal is only switched when it is
+        on one line and holds no double quote, which keeps its value the same.
+        F-strings are switched by the same rule, on Python 3.12+ by their
+        start and end tokens; strings nested in their expressions are
+        switched on their own.
+        """
+        replacements = []
+        # Per f-string being read: its start token, and whether a double quote
+        # has been seen inside it
+        open_fstrings: List[List[Any]] = []
+        for token in tokenize.generate_tokens(io.StringIO(content).readline):
+            if open_fstrings and '"' in token.string:
+                for fstring in open_fstrings:
+                    fstring[1] = True
+            
+            if token.type == _FSTRING_START:
+                open_fstrings.append([token, False])
+                continue
+            if token.type == _FSTRING_END:
+                start, has_double_quote = open_fstrings.pop()
+                text = start.string
+                prefix = text[:-1]
+                if (start.start[0] == token.end[0] and text.endswith("'")
+                        and not text.endswith("'''") and not has_double_quote):
+                    replacements.append((start.start[0] - 1, start.start[1], start.end[1], f'{prefix}"'))
+                    replacements.append((token.start[0] - 1, token.start[1], token.end[1], '"'))
+                continue
+            if token.type != tokenize.STRING or token.start[0] != token.end[0]:
+                continue
+            
+            text = token.string
+            prefix = text[:len(text) - len(text.lstrip('rRbBuUfF'))]
+            quoted = text[len(prefix):]
+            if quoted.startswith("'''") or not quoted.startswith("'") or '"' in quoted:
+                continue
+            
+            replacements.append((token.start[0] - 1, token.start[1], token.end[1],
+                                 f'{prefix}"{quoted[1:-1]}"'))
+        
+        if not replacements:
+            return content
+        
+        # An f-string's end is recorded after the strings nested in it
+        replacements.sort()
+        lines = content.split('\n')
+        # Replace from the end, so earlier columns on a line stay valid
+        for row, start, end, literal in reversed(replacements):
+            line = lines[row]
+            lines[row] = line[:start] + literal + line[end:]
+        return '\n'.join(lines)
+    
     def _fix_missing_type_hints(self, content: str, line_number: Optional[int]) -> str:
         """Add basic type hints to function parameters."""
         lines = content.split('\n')
+        # Offset of the current line in content
+        offset = 0
         
         for i, line in enumerate(lines):
             if line.strip().startswith('def ') and '->' not in line:
-                # Try to add basic return type hint
-                if 'return' in content[content.find(line):content.find(line) + 200]:
-                    if 'return None' in content[content.find(line):content.find(line) + 200]:
-                        lines[i] = line.rstrip() + ' -> None:'
-                    elif 'return True' in content[content.find(line):content.find(line) + 200] or 'return False' in content[content.find(line):content.find(line) + 200]:
-                        lines[i] = line.rstrip() + ' -> bool:'
-                    elif 'return ""' in content[content.find(line):content.find(line) + 200] or 'return str(' in content[content.find(line):content.find(line) + 200]:
-                        lines[i] = line.rstrip() + ' -> str:'
-                    elif 'return 0' in content[content.find(line):content.find(line) + 200] or 'return int(' in content[content.find(line):content.find(line) + 200]:
-                        lines[i] = line.rstrip() + ' -> int:'
+                # Try to add basic return type hint from the code that follows
+                following = content[offset:offset + 200]
+                if 'return' in following:
+                    for returns, hint in _RETURN_HINTS:
+                        if any(ret in following for ret in returns):
+                            lines[i] = line.rstrip() + hint
+                            break
+            offset += len(line) + 1
         
         return '\n'.join(lines)
     
-    def _fix_yaml_indentation(self, content: str) -> str:
-        """Fix YAML indentation issues."""
-        lines = content.split('\n')
-        fixed_lines = []
-        indent_stack = [0]
+    def _fix_yaml_indentation(self, lines: List[str]) -> List[str]:
+        """Fix YAML indentation issues.
         
-        for line in lines:
-            if not line.strip():
-                fixed_lines.append(line)
+        Every non-blank line is indented two spaces past the original indent
+        of the last key that opened a block, so only that indent is tracked.
+        """
+        expected_indent = 0
+        
+        for i, line in enumerate(lines):
+            stripped = line.lstrip()
+            if not stripped:
                 continue
             
-            current_indent = len(line) - len(line.lstrip())
-            
-            # Determine expected indentation
-            if line.strip().startswith('- '):
-                # List item
-                expected_indent = indent_stack[-1]
-            elif line.strip().endswith(':'):
-                # Key with value
-                expected_indent = indent_stack[-1]
-                indent_stack.append(current_indent + 2)
-            else:
-                # Regular line
-                expected_indent = indent_stack[-1]
+            current_indent = len(line) - len(stripped)
             
             # Fix indentation
             if current_indent != expected_indent:
-                fixed_line = ' ' * expected_indent + line.lstrip()
-                fixed_lines.append(fixed_line)
-            else:
-                fixed_lines.append(line)
+                lines[i] = ' ' * expected_indent + stripped
+            
+            # A key with a value, but not a list item, opens a block
+            stripped = stripped.rstrip()
+            if stripped.endswith(':') and not stripped.startswith('- '):
+                expected_indent = current_indent + 2
         
-        return '\n'.join(fixed_lines)
+        return lines
     
-    def _fix_markdown_formatting(self, content: str) -> str:
+    def _fix_markdown_formatting(self, lines: List[str]) -> List[str]:
         """Fix common Markdown formatting issues."""
-        lines = content.split('\n')
-        fixed_lines = []
-        
         for i, line in enumerate(lines):
             # Fix heading spacing
             if line.startswith('#'):
                 # Ensure there's a space after #
                 if not line.startswith('# '):
-                    line = line.replace('#', '# ', 1)
-                fixed_lines.append(line)
-            # Fix list formatting
-            elif line.strip().startswith('- ') or line.strip().startswith('* '):
-                # Ensure consistent list markers
-                if line.strip().startswith('* '):
-                    line = line.replace('* ', '- ', 1)
-                fixed_lines.append(line)
-            # Fix code block formatting
-            elif line.strip().startswith('```'):
-                fixed_lines.append(line)
-            else:
-                fixed_lines.append(line)
+                    lines[i] = line.replace('#', '# ', 1)
+            # Fix list formatting: ensure consistent list markers
+            elif line.strip().startswith('* '):
+                lines[i] = line.replace('* ', '- ', 1)
         
-        return '\n'.join(fixed_lines)
+        return lines
     
     def _fix_version_inconsistency(self, content: str, message: str) -> str:
         """Fix Python version inconsistencies by updating to 3.13."""
         # Extract the old version from the message
-        import re
-        version_match = re.search(r'python (\d+\.\d+) found', message)
+        version_match = _OLD_PYTHON_VERSION_RE.search(message)
         if version_match:
             old_version = version_match.group(1)
             # Replace old version with 3.13
@@ -396,28 +778,29 @@ class IssueFixer:
             content = content.replace(f"python {old_version}", "python 3.13")
         return content
     
-    def _fix_readme_title(self, content: str) -> str:
+    def _fix_readme_title(self, lines: List[str]) -> List[str]:
         """Fix README files that don't start with a title."""
-        lines = content.split('\n')
         if lines and not lines[0].startswith('#'):
             # Add a title if the first line doesn't start with #
             lines.insert(0, '# README')
-        return '\n'.join(lines)
+        return lines
     
     def get_fix_summary(self) -> str:
         """Get a summary of fixes applied."""
         if not self.fixes_applied and not self.fixes_failed:
             return "No fixes were attempted."
         
-        summary = f"🔧 Fix Summary:\n"
-        summary += f"  ✅ Successfully fixed: {len(self.fixes_applied)} issues\n"
-        summary += f"  ❌ Failed to fix: {len(self.fixes_failed)} issues\n"
+        parts = [
+            "🔧 Fix Summary:\n",
+            f"  ✅ Successfully fixed: {len(self.fixes_applied)} issues\n",
+            f"  ❌ Failed to fix: {len(self.fixes_failed)} issues\n",
+        ]
         
         if self.fixes_failed:
-            summary += f"\nFailed fixes:\n"
+            parts.append("\nFailed fixes:\n")
             for issue in self.fixes_failed[:5]:  # Show first 5
-                summary += f"  - {issue.message}\n"
+                parts.append(f"  - {issue.message}\n")
             if len(self.fixes_failed) > 5:
-                summary += f"  ... and {len(self.fixes_failed) - 5} more\n"
+                parts.append(f"  ... and {len(self.fixes_failed) - 5} more\n")
         
-        return summary
+        return "".join(parts)
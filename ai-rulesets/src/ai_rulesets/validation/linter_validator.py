@@ -4,11 +4,11 @@ import subprocess
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Optional, Union
 from .base import ValidationResult, BaseValidator
 
 
-@dataclass
+@dataclass(slots=True)
 class LinterResult:
     """Result of a linting check."""
     tool: str
@@ -23,10 +23,9 @@ class LinterResult:
 class LinterValidator(BaseValidator):
     """Validates code quality using various linting tools."""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: Union[str, Path] = "."):
         """Initialize linter validator with project root."""
         super().__init__(project_root)
-        self.project_root = Path(project_root)
         self.linter_results: List[LinterResult] = []
     
     def validate(self) -> List[ValidationResult]:
@@ -432,12 +431,3 @@ class LinterValidator(BaseValidator):
                             line_number=line_num,
                             severity="warning"
                         ))
-    
-    def get_summary(self) -> Dict[str, int]:
-        """Get validation summary."""
-        summary = {"total": len(self.issues), "errors": 0, "warnings": 0, "info": 0}
-        
-        for issue in self.issues:
-            summary[issue.severity + "s"] += 1
-        
-        return summary
@@ -4,17 +4,22 @@ import os
 import re
 import glob
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 from .base import ValidationResult, BaseValidator
 
+# Directories whose names contain any of these are not searched for READMEs
+_EXCLUDED_DIR_PARTS = (
+    "node_modules", ".git", ".venv", "__pycache__",
+    "htmlcov", "reports", "dist", "build", ".next"
+)
+
 
 class ReadmeValidator(BaseValidator):
     """Validates README files for accuracy and completeness."""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: Union[str, Path] = ".", jobs: Optional[int] = None):
         """Initialize validator with project root."""
-        super().__init__(project_root)
-        self.project_root = Path(project_root)
+        super().__init__(project_root, jobs=jobs)
     
     def validate(self) -> List[ValidationResult]:
         """Validate all README files in the project."""
@@ -24,21 +29,44 @@ class ReadmeValidator(BaseValidator):
         """Validate all README files in the project."""
         self.issues = []
         
-        # Find all README files, excluding certain directories
+        readme_files = self._find_readme_files()
+        self._validate_each("_validate_readme_file", ((readme_file,) for readme_file in readme_files))
+        
+        return self.issues
+    
+    def handles_file(self, file_path: Path) -> bool:
+        """Return True for README files, which are checked one at a time."""
+        return file_path.name == "README.md"
+    
+    def validate_file(self, file_path: Path) -> List[ValidationResult]:
+        """Validate a single README file."""
+        return self._collect("_validate_readme_file", file_path)
+    
+    def _find_readme_files(self) -> List[Path]:
+        """Find all README files, excluding certain directories.
+        
+        Excluded directories are pruned during an ``os.scandir`` walk rather
+        than walked in full and filtered afterwards, so large trees such as
+        ``node_modules`` are never listed.
+        """
         readme_files = []
-        for readme_file in self.project_root.rglob("README.md"):
-            # Skip README files in excluded directories
-            if any(excluded in str(readme_file) for excluded in [
-                "node_modules", ".git", ".venv", "__pycache__", 
-                "htmlcov", "reports", "dist", "build", ".next"
-            ]):
+        stack = [str(self.project_root)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not any(excluded in entry.name for excluded in _EXCLUDED_DIR_PARTS):
+                                subdirs.append(entry.path)
+                        elif entry.name == "README.md":
+                            readme_files.append(Path(entry.path))
+            except OSError:
+                # Unreadable directories are skipped, as rglob does
                 continue
-            readme_files.append(readme_file)
-        
-        for readme_file in readme_files:
-            self._validate_readme_file(readme_file)
+            stack.extend(reversed(subdirs))
         
-        return self.issues
+        return readme_files
     
     def _validate_readme_file(self, readme_path: Path) -> None:
         """Validate a single README file."""
@@ -89,14 +117,16 @@ class ReadmeValidator(BaseValidator):
         ]
         
         content_lower = content.lower()
-        for section in essential_sections:
-            if section.lower() not in content_lower:
-                self.issues.append(ValidationResult(
-                    is_valid=False,
-                    message=f"README missing essential section: {section}",
-                    file_path=str(file_path),
-                    severity="info"
-                ))
+        self.add_issues([
+            ValidationResult(
+                is_valid=False,
+                message=f"README missing essential section: {section}",
+                file_path=str(file_path),
+                severity="info"
+            )
+            for section in essential_sections
+            if section.lower() not in content_lower
+        ])
     
     def _check_broken_links(self, file_path: Path, content: str) -> None:
         """Check for broken internal links."""
@@ -142,14 +172,16 @@ class ReadmeValidator(BaseValidator):
             "AI Test Generation"
         ]
         
-        for ref in outdated_refs:
-            if ref in content:
-                self.issues.append(ValidationResult(
-                    is_valid=False,
-                    message=f"Outdated reference found: {ref}",
-                    file_path=str(file_path),
-                    severity="error"
-                ))
+        self.add_issues([
+            ValidationResult(
+                is_valid=False,
+                message=f"Outdated reference found: {ref}",
+                file_path=str(file_path),
+                severity="error"
+            )
+            for ref in outdated_refs
+            if ref in content
+        ])
     
     def _check_code_examples(self, file_path: Path, content: str) -> None:
         """Check code examples for basic syntax."""
@@ -200,7 +232,7 @@ class ReadmeValidator(BaseValidator):
         """Validate YAML code examples."""
         try:
             import yaml
-            yaml.safe_load(code)
+            yaml.load(code, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
         except ImportError:
             # YAML not available, skip validation
             pass
@@ -215,45 +247,30 @@ class ReadmeValidator(BaseValidator):
     def _check_formatting(self, file_path: Path, content: str) -> None:
         """Check README formatting."""
         lines = content.split('\n')
+        # Skip line length checks for .md files; only trailing whitespace is checked there
+        check_length = file_path.suffix.lower() != '.md'
         
+        # Issues for every line are collected first and added in one batch
+        issues = []
         for i, line in enumerate(lines, 1):
-            # Skip line length checks for .md files
-            if file_path.suffix.lower() == '.md':
-                # Only check for trailing whitespace in .md files
-                if line.endswith(' '):
-                    self.issues.append(ValidationResult(
-                        is_valid=False,
-                        message="Trailing whitespace",
-                        file_path=str(file_path),
-                        line_number=i,
-                        severity="warning"
-                    ))
-            else:
-                # Check for lines that are too long (non-.md files)
-                if len(line) > 120:
-                    self.issues.append(ValidationResult(
-                        is_valid=False,
-                        message="Line too long (over 120 characters)",
-                        file_path=str(file_path),
-                        line_number=i,
-                        severity="warning"
-                    ))
-                
-                # Check for trailing whitespace
-                if line.endswith(' '):
-                    self.issues.append(ValidationResult(
-                        is_valid=False,
-                        message="Trailing whitespace",
-                        file_path=str(file_path),
-                        line_number=i,
-                        severity="warning"
-                    ))
-    
-    def get_summary(self) -> Dict[str, int]:
-        """Get validation summary."""
-        summary = {"total": len(self.issues), "errors": 0, "warnings": 0, "info": 0}
-        
-        for issue in self.issues:
-            summary[issue.severity + "s"] += 1
+            # Check for lines that are too long (non-.md files)
+            if check_length and len(line) > 120:
+                issues.append(ValidationResult(
+                    is_valid=False,
+                    message="Line too long (over 120 characters)",
+                    file_path=str(file_path),
+                    line_number=i,
+                    severity="warning"
+                ))
+            
+            # Check for trailing whitespace
+            if line.endswith(' '):
+                issues.append(ValidationResult(
+                    is_valid=False,
+                    message="Trailing whitespace",
+                    file_path=str(file_path),
+                    line_number=i,
+                    severity="warning"
+                ))
         
-        return summary
+        self.add_issues(issues)
@@ -4,17 +4,16 @@ import os
 import subprocess
 import json
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Optional, Union
 from .base import ValidationResult, BaseValidator
 
 
 class TestValidator(BaseValidator):
     """Validates test execution and reporting across all modules."""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: Union[str, Path] = ".", jobs: Optional[int] = None):
         """Initialize validator with project root."""
-        super().__init__(project_root)
-        self.project_root = Path(project_root)
+        super().__init__(project_root, jobs=jobs)
         self.modules = ["automation-framework", "ai-rulesets", "cloud-native-app", "react-playwright-demo"]
     
     def validate(self) -> List[ValidationResult]:
@@ -25,11 +24,12 @@ class TestValidator(BaseValidator):
         """Validate test execution for all modules."""
         self.issues = []
         
-        # Check each module
-        for module in self.modules:
-            module_path = self.project_root / module
-            if module_path.exists():
-                self._validate_module_tests(module_path, module)
+        # Check each module; their test runs are independent subprocesses
+        self._validate_each("_validate_module_tests", (
+            (self.project_root / module, module)
+            for module in self.modules
+            if (self.project_root / module).exists()
+        ))
         
         # Check main test execution
         self._validate_main_test_execution()
@@ -291,12 +291,3 @@ class TestValidator(BaseValidator):
                     ))
         
         return allure_issues
-    
-    def get_summary(self) -> Dict[str, int]:
-        """Get validation summary."""
-        summary = {"total": len(self.issues), "errors": 0, "warnings": 0, "info": 0}
-        
-        for issue in self.issues:
-            summary[issue.severity + "s"] += 1
-        
-        return summary
@@ -5,11 +5,11 @@ import json
 import yaml
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from .base import ValidationResult, BaseValidator
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionInfo:
     """Version information for a specific technology."""
     technology: str
@@ -22,10 +22,9 @@ class VersionInfo:
 class VersionValidator(BaseValidator):
     """Validates version consistency across configuration files."""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: Union[str, Path] = "."):
         """Initialize version validator with project root."""
         super().__init__(project_root)
-        self.project_root = Path(project_root)
         self.version_info: Dict[str, List[VersionInfo]] = {}
         
         # Define version patterns for different technologies
@@ -332,12 +331,3 @@ class VersionValidator(BaseValidator):
                                 line_number=version_info.line_number,
                                 severity="warning"
                             ))
-    
-    def get_summary(self) -> Dict[str, int]:
-        """Get validation summary."""
-        summary = {"total": len(self.issues), "errors": 0, "warnings": 0, "info": 0}
-        
-        for issue in self.issues:
-            summary[issue.severity + "s"] += 1
-        
-        return summary
@@ -5,17 +5,24 @@ import re
 import yaml
 import glob
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from .base import ValidationResult, BaseValidator
+from .cache import ValidationCache
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class WorkflowValidator(BaseValidator):
     """Validates GitHub workflow files for accuracy and completeness."""
     
-    def __init__(self, project_root: str = "."):
+    # Bump when the per-file checks change so cached results are not reused
+    CACHE_KEY = "workflow:3"
+    
+    def __init__(self, project_root: Union[str, Path] = ".", cache: Optional[ValidationCache] = None,
+                 jobs: Optional[int] = None):
         """Initialize validator with project root."""
-        super().__init__(project_root)
-        self.project_root = Path(project_root)
+        super().__init__(project_root, cache, jobs)
     
     def validate(self) -> List[ValidationResult]:
         """Validate all workflow files in the project."""
@@ -35,24 +42,56 @@ class WorkflowValidator(BaseValidator):
                               list(self.project_root.glob(f"{module}/.github/workflows/*.yaml"))
             workflow_files.extend(module_workflows)
         
-        # Filter out files in node_modules and other excluded directories
+        # Filter out files in node_modules and other excluded directories, matched
+        # as whole directory names below the project root; a substring test on
+        # the path would also drop every .github directory for containing ".git"
         excluded_dirs = {'node_modules', '.git', '.venv', '__pycache__', 'htmlcov', 'reports', 'dist', 'build', '.next'}
-        workflow_files = [f for f in workflow_files if not any(excluded_dir in str(f) for excluded_dir in excluded_dirs)]
+        workflow_files = [f for f in workflow_files
+                          if excluded_dirs.isdisjoint(f.relative_to(self.project_root).parts)]
         
-        for workflow_file in workflow_files:
-            self._validate_workflow_file(workflow_file)
+        self._validate_each("_validate_workflow_file", ((workflow_file,) for workflow_file in workflow_files))
         
         return self.issues
     
-    def _validate_workflow_file(self, workflow_path: Path) -> None:
+    def handles_file(self, file_path: Path) -> bool:
+        """Return True for workflow files, which are checked one at a time."""
+        return file_path.suffix in (".yml", ".yaml") and file_path.parent.parts[-2:] == (".github", "workflows")
+    
+    def validate_file(self, file_path: Path) -> List[ValidationResult]:
         """Validate a single workflow file."""
+        return self._collect("_validate_workflow_file", file_path)
+    
+    def _validate_workflow_file(self, workflow_path: Path) -> None:
+        """Validate a single workflow file, reusing cached results for unchanged content."""
+        if self.cache is None:
+            self._check_workflow_file(workflow_path)
+            return
+        
+        try:
+            sha = ValidationCache.hash_content(workflow_path.read_bytes())
+        except OSError:
+            # Let the uncached path report the read error
+            self._check_workflow_file(workflow_path)
+            return
+        
+        cached = self.cache.get(str(workflow_path), self.CACHE_KEY, sha)
+        if cached is not None:
+            self.add_issues(cached)
+            return
+        
+        start = len(self.issues)
+        self._check_workflow_file(workflow_path)
+        self.cache.put(str(workflow_path), self.CACHE_KEY, sha, self.issues[start:])
+    
+    def _check_workflow_file(self, workflow_path: Path) -> None:
+        """Run every check on a single workflow file."""
         try:
             with open(workflow_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
             # Parse YAML
             try:
-                workflow_data = yaml.safe_load(content)
+                workflow_data = yaml.load(content, Loader=_YamlLoader)
             except yaml.YAMLError as e:
                 self.issues.append(ValidationResult(
                     is_valid=False,
@@ -219,12 +258,3 @@ class WorkflowValidator(BaseValidator):
                     file_path=str(file_path),
                     severity="error"
                 ))
-    
-    def get_summary(self) -> Dict[str, int]:
-        """Get validation summary."""
-        summary = {"total": len(self.issues), "errors": 0, "warnings": 0, "info": 0}
-        
-        for issue in self.issues:
-            summary[issue.severity + "s"] += 1
-        
-        return summary
@@ -6,11 +6,13 @@ dependencies, testing the integration between renderers and their dependencies
 without requiring real external services.
 """
 
+import io
+import os
 import pytest
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
 from ai_rulesets.core import Ruleset, RulesetMetadata, RulesetItem
-from ai_rulesets.renderers import CursorRenderer, CopilotRenderer
+from ai_rulesets.renderers import CursorRenderer, CopilotRenderer, GenericRenderer
 
 
 @pytest.mark.component
@@ -73,6 +75,48 @@ class TestCursorRendererComponent:
         assert "Test guidance content" in result
         assert "Test Template" in result
 
+    def test_render_to_stream_matches_string(self, cursor_renderer, sample_template):
+        """Test streamed rendering produces the same content as the string render."""
+        stream = io.StringIO()
+        
+        cursor_renderer.render_to_stream(sample_template, stream)
+        
+        assert stream.getvalue() == cursor_renderer.render_ruleset(sample_template)
+
+    def test_render_reflects_added_rules(self, cursor_renderer, sample_template):
+        """Test a cached render is refreshed after a rule is added."""
+        first = cursor_renderer.render_ruleset(sample_template)
+        assert cursor_renderer.render_ruleset(sample_template) == first
+        
+        sample_template.add_rule(RulesetItem("Added Rule", "Added later", "Added content"))
+        
+        assert "Added content" in cursor_renderer.render_ruleset(sample_template)
+
+    def test_render_reflects_in_place_edits(self, cursor_renderer, sample_template):
+        """Test a cached render is refreshed after metadata or rules are edited in place."""
+        cursor_renderer.render_ruleset(sample_template)
+        
+        sample_template.metadata.categories.append("e2e")
+        assert "e2e" in cursor_renderer.render_ruleset(sample_template)
+        
+        sample_template.rules[0] = RulesetItem("Replaced Rule", "Replaced in place", "Replaced content")
+        result = cursor_renderer.render_ruleset(sample_template)
+        assert "Replaced content" in result
+        assert "Test guidance content" not in result
+
+    def test_render_file_skips_unchanged_content(self, cursor_renderer, sample_template, tmp_path):
+        """Test re-rendering identical content leaves the existing file untouched."""
+        output_path = tmp_path / "test_output.mdc"
+        cursor_renderer.render_file(sample_template, output_path)
+        os.utime(output_path, ns=(0, 0))
+        
+        cursor_renderer.render_file(sample_template, output_path)
+        assert output_path.stat().st_mtime_ns == 0
+        
+        output_path.write_text("stale", encoding="utf-8")
+        cursor_renderer.render_file(sample_template, output_path)
+        assert output_path.read_text(encoding="utf-8") == cursor_renderer.render_ruleset(sample_template)
+
     def test_sanitize_filename(self, cursor_renderer):
         """Test filename sanitization."""
         # Test normal filename
@@ -243,3 +287,25 @@ class TestRendererIntegration:
         # Both should contain the template name
         assert "Compatibility Test" in cursor_result
         assert "Compatibility Test" in copilot_result
+
+    @pytest.mark.parametrize("renderer_class", [CursorRenderer, CopilotRenderer, GenericRenderer])
+    def test_direct_rendering_matches_jinja(self, renderer_class):
+        """Test the direct renderers produce exactly what the Jinja templates render."""
+        metadata = RulesetMetadata(
+            name="Parity Test",
+            version="2.0.0",
+            description="Template for comparing rendering paths",
+            categories=["unit", "e2e"],
+            tags=["parity"],
+            author="Test Author",
+            license="MIT"
+        )
+        
+        template = Ruleset(metadata=metadata)
+        template.add_rule(RulesetItem("Tagged Guidance", "Has tags", "Content 1", tags=["a", "b"], category="style"))
+        template.add_rule(RulesetItem("Plain Guidance", "No tags", "Content 2"))
+        
+        direct_result = renderer_class(use_jinja=False).render_ruleset(template)
+        jinja_result = renderer_class(use_jinja=True).render_ruleset(template)
+        
+        assert direct_result == jinja_result
@@ -91,6 +91,47 @@ class TestCLIIntegration:
         assert result.returncode != 0
         assert "unrecognized arguments" in result.stderr
 
+    def test_module_help_lists_commands(self):
+        """Test the click group's help lists every command, including the lazily loaded ones."""
+        result = subprocess.run(
+            [sys.executable, "-m", "ai_rulesets", "--help"],
+            capture_output=True,
+            text=True
+        )
+        
+        assert result.returncode == 0
+        for command in ("generate-cursor", "generate-rulesets", "quality", "quality-check"):
+            assert command in result.stdout
+
+    def test_module_quality_check_help(self):
+        """Test quality-check hands its arguments, --help included, to the standalone checker."""
+        result = subprocess.run(
+            [sys.executable, "-m", "ai_rulesets", "quality-check", "--help"],
+            capture_output=True,
+            text=True
+        )
+        
+        assert result.returncode == 0
+        assert "AI Rulesets Quality Checker" in result.stdout
+        assert "--readmes-only" in result.stdout
+
+    def test_module_fast_path_generate_cursor(self):
+        """Test the argparse fast path generates Cursor rulesets without importing click."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = subprocess.run(
+                [sys.executable, "-c",
+                 "import sys, runpy; runpy.run_module('ai_rulesets', run_name='__main__'); "
+                 "print('click' in sys.modules)",
+                 "generate-cursor", "-t", "python", "-o", temp_dir],
+                capture_output=True,
+                text=True
+            )
+            
+            assert result.returncode == 0
+            assert "Generated 1 Cursor ruleset files" in result.stdout
+            assert result.stdout.strip().endswith("False")
+            assert (Path(temp_dir) / "python-development-standards.mdc").exists()
+
 
 @pytest.mark.integration
 class TestFileSystemIntegration:
@@ -127,6 +127,28 @@ class TestRuleset:
         assert template.rules[0] == rule1  # priority 2 (higher)
         assert template.rules[1] == rule2  # priority 1 (lower)
     
+    def test_add_rule_keeps_order_of_equal_priorities(self):
+        """Test rules with equal priority stay in the order they were added."""
+        metadata = RulesetMetadata(
+            name="Test RulesetItem Set",
+            version="1.0.0",
+            description="A test rule set",
+            categories=["unit"]
+        )
+        
+        template = Ruleset(metadata=metadata)
+        
+        rules = [
+            RulesetItem(f"RulesetItem {i}", "Rule", "Content", priority=priority)
+            for i, priority in enumerate([1, 3, 2, 3, 1, 2])
+        ]
+        for rule in rules:
+            template.add_rule(rule)
+        
+        assert [rule.name for rule in template.rules] == [
+            "RulesetItem 1", "RulesetItem 3", "RulesetItem 2", "RulesetItem 5", "RulesetItem 0", "RulesetItem 4"
+        ]
+    
     def test_get_rules_by_tag(self):
         """Test getting rules by tag."""
         metadata = RulesetMetadata(
@@ -152,6 +174,119 @@ class TestRuleset:
         assert rule3 in test_rules
         assert rule2 not in test_rules
     
+    def test_lookups_follow_rule_changes(self):
+        """Test tag, category and priority lookups stay current as rules change."""
+        metadata = RulesetMetadata(
+            name="Test RulesetItem Set",
+            version="1.0.0",
+            description="A test rule set",
+            categories=["unit"]
+        )
+        
+        template = Ruleset(metadata=metadata)
+        
+        rule1 = RulesetItem("RulesetItem 1", "First rule", "Content 1", tags=["test"], priority=3, category="a")
+        rule2 = RulesetItem("RulesetItem 2", "Second rule", "Content 2", tags=["e2e"], priority=1, category="b")
+        
+        template.add_rule(rule1)
+        template.add_rule(rule2)
+        
+        assert template.get_rules_by_category("a") == [rule1]
+        assert template.get_rules_by_priority(2) == [rule1]
+        assert template.get_all_tags() == {"test", "e2e"}
+        
+        rule3 = RulesetItem("RulesetItem 3", "Third rule", "Content 3", tags=["test"], priority=2, category="a")
+        template.add_rule(rule3)
+        
+        assert template.get_rules_by_tag("test") == [rule1, rule3]
+        assert template.get_rules_by_category("a") == [rule1, rule3]
+        assert template.get_rules_by_priority(2) == [rule1, rule3]
+        
+        # Rules appended directly, out of priority order, are still found
+        rule4 = RulesetItem("RulesetItem 4", "Fourth rule", "Content 4", tags=["unit"], priority=5)
+        template.rules.append(rule4)
+        
+        assert template.get_rules_by_tag("unit") == [rule4]
+        assert template.get_rules_by_priority(3) == [rule1, rule4]
+        assert template.get_all_tags() == {"test", "e2e", "unit"}
+    
+    def test_lookups_follow_rules_replaced_in_place(self):
+        """Test lookups notice a rule replaced in the list without changing its length."""
+        metadata = RulesetMetadata(
+            name="Test RulesetItem Set",
+            version="1.0.0",
+            description="A test rule set",
+            categories=["unit"]
+        )
+        
+        template = Ruleset(metadata=metadata)
+        template.add_rule(RulesetItem("RulesetItem 1", "First rule", "Content 1", tags=["x"], priority=2, category="a"))
+        template.add_rule(RulesetItem("RulesetItem 2", "Second rule", "Content 2", tags=["x"], priority=1, category="a"))
+        
+        assert len(template.get_rules_by_tag("x")) == 2
+        
+        replacement = RulesetItem("RulesetItem 3", "Third rule", "Content 3", tags=["y"], priority=2, category="b")
+        template.rules[0] = replacement
+        
+        assert template.get_rules_by_tag("y") == [replacement]
+        assert template.get_rules_by_category("b") == [replacement]
+        assert template.get_rules_by_tag("x") == [template.rules[1]]
+        
+        # A rule with a lower priority put in place leaves the list unsorted;
+        # the next add must sort again rather than insert by position
+        template.rules[0] = RulesetItem("RulesetItem 4", "Fourth rule", "Content 4", priority=0)
+        template.add_rule(RulesetItem("RulesetItem 5", "Fifth rule", "Content 5", priority=1))
+        
+        assert [rule.priority for rule in template.rules] == [1, 1, 0]
+    
+    def test_rule_blocks_follow_rule_changes(self):
+        """Test shared rule blocks are reused until the rules change."""
+        metadata = RulesetMetadata(
+            name="Test RulesetItem Set",
+            version="1.0.0",
+            description="A test rule set",
+            categories=["unit"]
+        )
+        
+        template = Ruleset(metadata=metadata)
+        template.add_rule(RulesetItem("RulesetItem 1", "First rule", "Content 1", priority=2))
+        
+        blocks = template.rule_blocks()
+        assert blocks == ("RulesetItem 1\n\nFirst rule\n\nContent 1\n\n",)
+        assert template.rule_blocks() is blocks
+        
+        template.add_rule(RulesetItem("RulesetItem 2", "Second rule", "Content 2", priority=1))
+        
+        assert template.rule_blocks()[1] == "RulesetItem 2\n\nSecond rule\n\nContent 2\n\n"
+        
+        template.rules[1] = RulesetItem("RulesetItem 3", "Third rule", "Content 3", priority=1)
+        
+        assert template.rule_blocks()[1] == "RulesetItem 3\n\nThird rule\n\nContent 3\n\n"
+    
+    def test_freeze_keeps_rules_and_blocks_adds(self):
+        """Test a frozen ruleset keeps its rules and lookups but rejects new rules."""
+        metadata = RulesetMetadata(
+            name="Test RulesetItem Set",
+            version="1.0.0",
+            description="A test rule set",
+            categories=["unit"]
+        )
+        
+        template = Ruleset(metadata=metadata)
+        rule1 = RulesetItem("RulesetItem 1", "First rule", "Content 1", tags=["test"], priority=2)
+        rule2 = RulesetItem("RulesetItem 2", "Second rule", "Content 2", priority=1)
+        template.add_rule(rule1)
+        template.add_rule(rule2)
+        
+        template.freeze()
+        
+        assert template.rules == (rule1, rule2)
+        assert template.get_rules_by_priority(2) == [rule1]
+        assert template.get_rules_by_tag("test") == [rule1]
+        
+        with pytest.raises(ValueError):
+            template.add_rule(RulesetItem("RulesetItem 3", "Third rule", "Content 3"))
+    
     def test_to_yaml(self):
         """Test converting rule set to YAML."""
         metadata = RulesetMetadata(
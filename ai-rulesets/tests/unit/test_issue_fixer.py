@@ -0,0 +1,162 @@
+"""
+Tests for automatic issue fixing.
+"""
+
+import os
+import pytest
+
+from ai_rulesets.validation import issue_fixer
+from ai_rulesets.validation.base import ValidationResult
+from ai_rulesets.validation.issue_fixer import IssueFixer
+
+
+def _issue(message, file_path, line_number=None):
+    """A fixable warning for ``file_path``."""
+    return ValidationResult(False, message, str(file_path), line_number, "warning")
+
+
+def _on_disk(text):
+    """``text`` as written back by the fixer."""
+    return text.replace("\n", os.linesep)
+
+
+@pytest.mark.unit
+class TestRemoveUnusedImports:
+    """Test unused import removal from parsed Python source."""
+    
+    def test_names_in_all_are_used(self):
+        """Test names exported through __all__ keep their imports."""
+        content = 'import os\nimport sys\n\n__all__ = ["os"]\n'
+        
+        assert IssueFixer._remove_unused_imports(content) == 'import os\n\n__all__ = ["os"]\n'
+    
+    def test_multi_line_import(self):
+        """Test a parenthesized import is kept whole if any name is used, and removed whole otherwise."""
+        used = "from typing import (\n    Dict,\n    List,\n)\n\nx: List[int] = []\n"
+        unused = "from typing import (\n    Dict,\n    List,\n)\n\nx = []\n"
+        
+        assert IssueFixer._remove_unused_imports(used) == used
+        assert IssueFixer._remove_unused_imports(unused) == "\nx = []\n"
+    
+    def test_kept_imports(self):
+        """Test star, __future__ and shared-line imports are never removed."""
+        content = "from __future__ import annotations\nfrom os.path import *\nimport sys; x = 1\n"
+        
+        assert IssueFixer._remove_unused_imports(content) == content
+    
+    def test_crlf_file(self, tmp_path):
+        """Test a CRLF file has its unused import removed without stray carriage returns."""
+        path = tmp_path / "module.py"
+        path.write_bytes(b"import os\r\nimport sys\r\n\r\nprint(sys.argv)\r\n")
+        fixer = IssueFixer(tmp_path)
+        
+        fixer.fix_issues([_issue("Unused import: os", path, 1)])
+        
+        assert path.read_bytes() == _on_disk("import sys\n\nprint(sys.argv)\n").encode("utf-8")
+        assert fixer.fixed_files() == [str(path)]
+
+
+@pytest.mark.unit
+class TestDoubleQuoteStrings:
+    """Test switching single-quoted Python strings to double quotes."""
+    
+    def test_quotes_inside_strings_and_comments(self):
+        """Test only the delimiters of plain single-quoted strings change."""
+        content = (
+            "x = 'it\"s'  # don't 'touch' this\n"
+            "y = \"a 'b' c\"\n"
+            "z = 'plain'\n"
+            "doc = '''keep 'these' quotes'''\n"
+        )
+        
+        assert IssueFixer._double_quote_strings(content) == (
+            "x = 'it\"s'  # don't 'touch' this\n"
+            "y = \"a 'b' c\"\n"
+            "z = \"plain\"\n"
+            "doc = '''keep 'these' quotes'''\n"
+        )
+    
+    def test_f_strings(self):
+        """Test f-strings are switched unless they hold a double quote."""
+        content = "a = f'{x}!'\nb = f'{d[\"k\"]}'\n"
+        
+        assert IssueFixer._double_quote_strings(content) == "a = f\"{x}!\"\nb = f'{d[\"k\"]}'\n"
+
+
+@pytest.mark.unit
+class TestFixIssues:
+    """Test fixing every issue in a file with one read and one write."""
+    
+    def test_fixes_in_one_file_are_combined(self, tmp_path):
+        """Test text and line fixes for the same file all land in one write."""
+        path = tmp_path / "notes.txt"
+        path.write_text("AI Test Generation   \n" + "word " * 30 + "- item\n", encoding="utf-8")
+        fixer = IssueFixer(tmp_path)
+        
+        results = fixer.fix_issues([
+            _issue("Trailing whitespace", path, 1),
+            _issue("Outdated reference found: AI Test Generation", path, 1),
+            _issue("Line too long", path, 2),
+        ])
+        
+        assert results == {"total_fixable": 3, "fixed": 3, "failed": 0}
+        assert path.read_text(encoding="utf-8") == "AI Rulesets\n" + ("word " * 30).rstrip() + " -\n  item\n"
+    
+    def test_failed_write_fails_the_file_fixes(self, tmp_path, monkeypatch):
+        """Test fixes whose file could not be written are reported as failed."""
+        path = tmp_path / "notes.txt"
+        path.write_text("text   \n", encoding="utf-8")
+        
+        def fail_write(path, content):
+            raise OSError("read-only file")
+        
+        monkeypatch.setattr(IssueFixer, "_write", staticmethod(fail_write))
+        fixer = IssueFixer(tmp_path)
+        
+        results = fixer.fix_issues([_issue("Trailing whitespace", path, 1)])
+        
+        assert results == {"total_fixable": 1, "fixed": 0, "failed": 1}
+        assert path.read_text(encoding="utf-8") == "text   \n"
+    
+    def test_failed_line_fix_is_rolled_back(self, tmp_path, monkeypatch):
+        """Test a line fix that raises leaves no partial changes for the fixes after it."""
+        path = tmp_path / "notes.txt"
+        path.write_text("text   \n", encoding="utf-8")
+        
+        def broken_fix(self, lines, line_number):
+            lines.append("half-done")
+            raise ValueError("cannot break line")
+        
+        monkeypatch.setattr(IssueFixer, "_fix_long_lines", broken_fix)
+        fixer = IssueFixer(tmp_path)
+        
+        results = fixer.fix_issues([_issue("Line too long", path, 1), _issue("Trailing whitespace", path, 1)])
+        
+        assert results == {"total_fixable": 2, "fixed": 1, "failed": 1}
+        assert path.read_text(encoding="utf-8") == "text\n"
+    
+    def test_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Test fixing enough files for worker processes gives the same files and outcomes as fixing in process."""
+        count = issue_fixer._PARALLEL_MIN_FILES
+        outcomes = {}
+        for mode, min_files in (("serial", count + 1), ("parallel", count)):
+            monkeypatch.setattr(issue_fixer, "_PARALLEL_MIN_FILES", min_files)
+            directory = tmp_path / mode
+            directory.mkdir()
+            paths = [directory / f"notes{i}.txt" for i in range(count)]
+            for i, path in enumerate(paths):
+                # Every third file has nothing to fix
+                path.write_text("text\n" if i % 3 == 0 else "text   \n", encoding="utf-8")
+            fixer = IssueFixer(directory)
+            
+            results = fixer.fix_issues([_issue("Trailing whitespace", path, 1) for path in paths])
+            
+            outcomes[mode] = (
+                results,
+                [os.path.basename(file_path) for file_path in fixer.fixed_files()],
+                [path.read_text(encoding="utf-8") for path in paths],
+            )
+        
+        assert outcomes["parallel"] == outcomes["serial"]
+        assert outcomes["parallel"][0] == {"total_fixable": count, "fixed": count - 6, "failed": 6}
+        assert outcomes["parallel"][2] == ["text\n"] * count
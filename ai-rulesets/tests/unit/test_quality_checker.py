@@ -0,0 +1,206 @@
+"""
+Tests for the quality checker's issue bookkeeping and validation cache.
+"""
+
+import json
+import pickle
+import sqlite3
+import sys
+import pytest
+
+from ai_rulesets.cli import quality_checker
+from ai_rulesets.cli.quality_checker import QualityChecker
+from ai_rulesets.validation.base import ValidationResult
+from ai_rulesets.validation.cache import ValidationCache
+from ai_rulesets.validation.readme_validator import ReadmeValidator
+from ai_rulesets.validation.workflow_validator import WorkflowValidator
+
+
+WORKFLOW = """name: CI
+on: push
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+"""
+
+
+def _issue_keys(issues):
+    """Everything a report shows about each issue, in order."""
+    return [(issue.severity, issue.message, issue.file_path, issue.line_number, issue.rule) for issue in issues]
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project whose README has no title, with one GitHub workflow."""
+    (tmp_path / "README.md").write_text("Some text without a title\n", encoding="utf-8")
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yml").write_text(WORKFLOW, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestRevalidateFiles:
+    """Test re-checking only the files a fix touched."""
+    
+    def test_matches_full_rerun_after_readme_fix(self, project):
+        """Test revalidating a fixed README gives the same issues as checking everything again."""
+        checker = QualityChecker(project, use_cache=False)
+        checker.run_all_checks(parallel=False)
+        assert "README should start with a title (# heading)" in [issue.message for issue in checker.all_issues]
+        
+        readme = project / "README.md"
+        readme.write_text("# Project\n\nSome text\n", encoding="utf-8")
+        
+        assert checker.revalidate_files([str(readme)]) is True
+        
+        rerun = QualityChecker(project, use_cache=False)
+        rerun.run_all_checks(parallel=False)
+        assert _issue_keys(checker.all_issues) == _issue_keys(rerun.all_issues)
+        assert list(checker.results) == list(rerun.results)
+        assert "README should start with a title (# heading)" not in [issue.message for issue in checker.all_issues]
+    
+    def test_declines_files_without_per_file_check(self, project):
+        """Test a file no per-file check covers leaves the results for a full rerun."""
+        checker = QualityChecker(project, use_cache=False)
+        checker.run_all_checks(parallel=False)
+        before = _issue_keys(checker.all_issues)
+        
+        assert checker.revalidate_files([str(project / "setup.py")]) is False
+        assert _issue_keys(checker.all_issues) == before
+
+
+@pytest.mark.unit
+class TestIngest:
+    """Test how reported issues are collected and deduplicated."""
+    
+    def test_repeated_issue_kept_once(self, tmp_path):
+        """Test an issue is dropped only when severity, message, file, line and rule all repeat."""
+        checker = QualityChecker(tmp_path)
+        
+        checker._ingest([
+            ValidationResult(False, "Broken link", "README.md", 3, "warning"),
+            ValidationResult(False, "Broken link", "README.md", 3, "warning"),
+            ValidationResult(False, "Broken link", "README.md", 4, "warning"),
+            ValidationResult(False, "Broken link", "README.md", 3, "error"),
+            ValidationResult(False, "Broken link", "README.md", 3, "warning", rule="links"),
+        ])
+        # Issues from a later check are compared with the earlier ones too
+        checker._ingest([ValidationResult(False, "Broken link", "README.md", 4, "warning")])
+        
+        assert _issue_keys(checker.all_issues) == [
+            ("warning", "Broken link", "README.md", 3, None),
+            ("warning", "Broken link", "README.md", 4, None),
+            ("error", "Broken link", "README.md", 3, None),
+            ("warning", "Broken link", "README.md", 3, "links"),
+        ]
+    
+    def test_dedup_off_keeps_every_issue(self, tmp_path):
+        """Test every issue is kept when dedup is turned off."""
+        checker = QualityChecker(tmp_path, dedup=False)
+        issue = ValidationResult(False, "Broken link", "README.md", 3, "warning")
+        
+        checker._ingest([issue, issue])
+        checker._ingest([issue])
+        
+        assert checker.all_issues == [issue, issue, issue]
+    
+    def test_severity_buckets_follow_reset_and_ingest(self, tmp_path):
+        """Test the severity split is rebuilt after the issues are reset or added to."""
+        checker = QualityChecker(tmp_path)
+        checker._ingest([ValidationResult(False, "Broken link", "README.md", 3, "error")])
+        assert [len(bucket) for bucket in checker.severity_buckets()] == [1, 0, 0]
+        
+        # A fresh list of the same length, as revalidate_files leaves behind
+        checker._reset_issues()
+        checker._ingest([ValidationResult(False, "Missing section", "README.md", None, "info")])
+        assert [len(bucket) for bucket in checker.severity_buckets()] == [0, 0, 1]
+        
+        checker._ingest([ValidationResult(False, "Old action", "ci.yml", None, "warning")])
+        assert [len(bucket) for bucket in checker.severity_buckets()] == [0, 1, 1]
+    
+    @pytest.mark.parametrize("flags, expected_total", [([], 1), (["--no-dedup"], 2)])
+    def test_no_dedup_flag(self, tmp_path, monkeypatch, flags, expected_total):
+        """Test --no-dedup keeps repeated issues in the exported results."""
+        issue = ValidationResult(False, "Broken link", "README.md", 3, "warning")
+        monkeypatch.setattr(ReadmeValidator, "validate", lambda self: [issue, issue])
+        export = tmp_path / "results.json"
+        monkeypatch.setattr(sys, "argv", [
+            "quality-check", "--readmes-only", "--no-cache",
+            "--project-root", str(tmp_path), "--export", str(export), *flags,
+        ])
+        
+        with pytest.raises(SystemExit) as exc_info:
+            quality_checker.main()
+        
+        assert exc_info.value.code == 0
+        assert json.loads(export.read_text(encoding="utf-8"))["summary"]["total"] == expected_total
+
+
+@pytest.mark.unit
+class TestValidationCache:
+    """Test per-file results are reused only for unchanged content."""
+    
+    def test_workflow_results_follow_edits(self, project, monkeypatch):
+        """Test an unchanged workflow is served from the cache and an edited one is checked again."""
+        cache = ValidationCache(project / ".ai-rulesets-cache")
+        workflow = project / ".github" / "workflows" / "ci.yml"
+        checked = []
+        check = WorkflowValidator._check_workflow_file
+        monkeypatch.setattr(WorkflowValidator, "_check_workflow_file",
+                            lambda self, path: checked.append(path) or check(self, path))
+        
+        first = _issue_keys(WorkflowValidator(project, cache=cache).validate_file(workflow))
+        assert _issue_keys(WorkflowValidator(project, cache=cache).validate_file(workflow)) == first
+        assert checked == [workflow]
+        
+        workflow.write_text(WORKFLOW.replace("checkout@v4", "checkout@v2"), encoding="utf-8")
+        issues = WorkflowValidator(project, cache=cache).validate_file(workflow)
+        
+        assert "Deprecated action used: actions/checkout@v2" in [issue.message for issue in issues]
+        assert _issue_keys(issues) != first
+        assert checked == [workflow, workflow]
+        
+        # The edited content is now the cached entry
+        assert _issue_keys(WorkflowValidator(project, cache=cache).validate_file(workflow)) == _issue_keys(issues)
+        assert checked == [workflow, workflow]
+    
+    def test_default_run_uses_per_user_cache(self, project, tmp_path_factory, monkeypatch):
+        """Test a default workflow check is served from a cache kept outside the project."""
+        cache_home = tmp_path_factory.mktemp("cache-home")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+        checked = []
+        check = WorkflowValidator._check_workflow_file
+        monkeypatch.setattr(WorkflowValidator, "_check_workflow_file",
+                            lambda self, path: checked.append(path) or check(self, path))
+        
+        first = _issue_keys(QualityChecker(project).workflow_validator.validate())
+        second = _issue_keys(QualityChecker(project).workflow_validator.validate())
+        
+        assert second == first
+        assert checked == [project / ".github" / "workflows" / "ci.yml"]
+        assert list(cache_home.glob("ai-rulesets/validation/*/validations.db"))
+        assert not (project / ".ai-rulesets-cache").exists()
+    
+    @pytest.mark.parametrize("payload", [
+        pickle.dumps([ValidationResult(False, "From pickle", "ci.yml")]),
+        '{"not": "a list"}',
+        '[[false, "Too short"]]',
+        '[[false, "Bad line", "ci.yml", "3", "error", null]]',
+        "not json",
+    ])
+    def test_malformed_entry_is_a_miss(self, project, payload):
+        """Test an entry that is not JSON result rows is ignored and the file checked again."""
+        cache = ValidationCache(project / ".ai-rulesets-cache")
+        workflow = project / ".github" / "workflows" / "ci.yml"
+        expected = _issue_keys(WorkflowValidator(project, cache=cache).validate_file(workflow))
+        sha = ValidationCache.hash_content(workflow.read_bytes())
+        
+        with sqlite3.connect(cache.db_path) as connection:
+            connection.execute("UPDATE v SET results = ? WHERE sha = ?", (payload, sha))
+        
+        assert cache.get(str(workflow), WorkflowValidator.CACHE_KEY, sha) is None
+        assert _issue_keys(WorkflowValidator(project, cache=cache).validate_file(workflow)) == expected
+        assert cache.get(str(workflow), WorkflowValidator.CACHE_KEY, sha) is not None